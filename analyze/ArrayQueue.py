@@ -1,38 +1,226 @@
-from typing import Any, List
+import math
+import sys
+import threading
+import weakref
+from enum import Enum
+from typing import Any, Dict, Iterator, List, Optional
+
+from analyze.serialization import decode_items, encode_items
+
+
+class OverflowPolicy(str, Enum):
+    """What an ArrayQueue does when it is full."""
+
+    grow = "grow"
+    reject = "reject"
+    block = "block"
+    overwrite = "overwrite"
+
 
 class ArrayQueue:
-    """Basic Array-based Queue implementation using a Python list."""
+    """Basic Array-based Queue implementation using a Python list.
+
+    The default ``grow`` policy doubles the buffer when it is full. The other
+    policies keep the capacity fixed, so the queue never allocates after
+    construction: ``reject`` raises, ``block`` waits for a consumer and
+    ``overwrite`` drops the oldest element. Rejected and overwritten elements
+    are counted in ``dropped``.
+
+    With ``incremental`` set, the larger buffer is built 16 slots at a time
+    once the queue is half full, and after switching to it the old
+    elements are copied over a few at a time on the following operations, so
+    no single enqueue pays for allocating or copying the whole queue.
 
-    def __init__(self, capacity: int = 10):
-        """Initialize an empty queue with a given capacity."""
+    With ``shrink_threshold`` set (e.g. 0.25), the buffer is halved through
+    the same incremental copy once occupancy drops below that fraction, but
+    never below the initial capacity. Because growing only happens when the
+    buffer is full, a threshold below one half leaves room between the two
+    triggers so a queue hovering around one size does not keep resizing.
+
+    ``snapshot`` returns a copy that shares the buffer. Dequeues on a shared
+    buffer leave the slot in place, and the first enqueue copies the buffer
+    before writing to it.
+    """
+
+    def __init__(
+        self,
+        capacity: int = 10,
+        overflow: OverflowPolicy = OverflowPolicy.grow,
+        incremental: bool = False,
+        shrink_threshold: float = 0.0,
+    ):
+        """Initialize an empty queue with a given capacity.
+
+        ``incremental`` and ``shrink_threshold`` only apply to the ``grow``
+        policy; a bounded queue rejects them, as it never resizes.
+        """
+        if capacity < 1:
+            raise ValueError("capacity must be positive")
+        if not 0.0 <= shrink_threshold < 0.5:
+            raise ValueError("shrink threshold must be in [0, 0.5)")
+        if overflow != OverflowPolicy.grow and (incremental or shrink_threshold):
+            raise ValueError("only a growing queue can resize incrementally or shrink")
         self.items: List[Any] = [None] * capacity
         self.front: int = 0
         self.rear: int = 0
         self.count: int = 0
         self.capacity: int = capacity
+        self.overflow: OverflowPolicy = OverflowPolicy(overflow)
+        self.dropped: int = 0
+        self._cond: Optional[threading.Condition] = (
+            threading.Condition() if self.overflow == OverflowPolicy.block else None
+        )
+        self.incremental: bool = incremental
+        # State of an in-progress incremental resize: the previous buffer and
+        # how many of its elements have been copied into ``items`` so far.
+        self._old: Optional[List[Any]] = None
+        self._old_front: int = 0
+        self._old_capacity: int = 0
+        self._old_count: int = 0
+        self._moved: int = 0
+        # Next buffer, pre-built in small chunks before a resize is due
+        self._spare: Optional[List[Any]] = None
+        # Old buffer of a finished resize, freed in small chunks
+        self._retired: Optional[List[Any]] = None
+        self.shrink_threshold: float = shrink_threshold
+        self._min_capacity: int = capacity
+        # Queues sharing ``items`` with this one, or None when it owns it alone
+        self._share: Optional[weakref.WeakSet] = None
+
+    def snapshot(self) -> "ArrayQueue":
+        """Return a copy of the queue that shares its buffer. O(1) unless a resize is in progress."""
+        self._finish_migration()
+        if self._share is None:
+            self._share = weakref.WeakSet([self])
+        clone = ArrayQueue(1, incremental=self.incremental, shrink_threshold=self.shrink_threshold)
+        clone.overflow = self.overflow
+        clone._cond = threading.Condition() if self._cond is not None else None
+        clone.items = self.items
+        clone.front = self.front
+        clone.rear = self.rear
+        clone.count = self.count
+        clone.capacity = self.capacity
+        clone._min_capacity = self._min_capacity
+        clone._share = self._share
+        self._share.add(clone)
+        return clone
+
+    def _shared(self) -> bool:
+        """Check whether another live queue still shares the buffer."""
+        if self._share is not None and len(self._share) < 2:
+            self._share = None
+        return self._share is not None
+
+    def _own_buffer(self) -> None:
+        """Copy the buffer if it is shared, before writing to it. O(n)."""
+        if self._share is not None and self._shared():
+            self.items = list(self.items)
+            self._leave_share()
+
+    def unshare(self) -> None:
+        """Copy a buffer shared with a snapshot now rather than on the next enqueue. O(n) if shared.
 
-    def enqueue(self, value: Any) -> None:
-        """Add an element to the end of the queue. O(1) amortized, O(n) worst-case (resize)."""
+        Later dequeues then clear their slots instead of leaving them to the
+        other sharers.
+        """
+        self._own_buffer()
+
+    def _leave_share(self) -> None:
+        """Stop sharing after switching to a buffer of our own."""
+        if self._share is not None:
+            self._share.discard(self)
+            self._share = None
+
+    def enqueue(self, value: Any, timeout: Optional[float] = None) -> None:
+        """Add an element to the end of the queue. O(1) amortized, O(n) worst-case (resize).
+
+        ``timeout`` only applies to the ``block`` policy.
+        """
+        if self._cond is not None:
+            self._enqueue_blocking(value, timeout)
+            return
+        self._own_buffer()
         if self.count == self.capacity:
-            self._resize(2 * self.capacity)
+            if self.overflow == OverflowPolicy.grow:
+                if self.incremental:
+                    self._start_migration(2 * self.capacity)
+                else:
+                    self._resize(2 * self.capacity)
+            elif self.overflow == OverflowPolicy.overwrite:
+                # Drop the oldest element; rear == front when the buffer is full
+                self.dropped += 1
+                self.items[self.rear] = value
+                self.rear = (self.rear + 1) % self.capacity
+                self.front = self.rear
+                return
+            else:
+                self.dropped += 1
+                raise IndexError("Queue is full")
         self.items[self.rear] = value
         self.rear = (self.rear + 1) % self.capacity
         self.count += 1
+        if self._old is not None:
+            self._migrate_step()
+        if self._retired is not None:
+            self._release_step()
+        if self.incremental and 2 * self.count >= self.capacity:
+            # Finish the spare by the time the buffer is full
+            self._adjust_spare(2 * self.capacity, self.capacity - self.count + 1)
+
+    def dequeue(self, timeout: Optional[float] = None) -> Any:
+        """Remove and return the first element from the queue. O(1).
 
-    def dequeue(self) -> Any:
-        """Remove and return the first element from the queue. O(1)."""
+        ``timeout`` only applies to the ``block`` policy.
+        """
+        if self._cond is not None:
+            return self._dequeue_blocking(timeout)
         if self.is_empty():
             raise IndexError("Queue is empty")
-        value = self.items[self.front]
-        self.items[self.front] = None  # Help with garbage collection
-        self.front = (self.front + 1) % self.capacity
-        self.count -= 1
+        if self._old is not None:
+            value = self._dequeue_migrating()
+        else:
+            value = self.items[self.front]
+            if not self._shared():
+                self.items[self.front] = None  # Help with garbage collection
+            self.front = (self.front + 1) % self.capacity
+            self.count -= 1
+        if self._retired is not None:
+            self._release_step()
+        if self.shrink_threshold:
+            self._maybe_shrink()
         return value
 
+    def _enqueue_blocking(self, value: Any, timeout: Optional[float]) -> None:
+        """Wait until there is room, then enqueue."""
+        with self._cond:
+            if not self._cond.wait_for(lambda: self.count < self.capacity, timeout):
+                self.dropped += 1
+                raise IndexError("Queue is full")
+            self._own_buffer()
+            self.items[self.rear] = value
+            self.rear = (self.rear + 1) % self.capacity
+            self.count += 1
+            self._cond.notify_all()
+
+    def _dequeue_blocking(self, timeout: Optional[float]) -> Any:
+        """Wait until an element is available, then dequeue it."""
+        with self._cond:
+            if not self._cond.wait_for(lambda: self.count > 0, timeout):
+                raise IndexError("Queue is empty")
+            value = self.items[self.front]
+            if not self._shared():
+                self.items[self.front] = None
+            self.front = (self.front + 1) % self.capacity
+            self.count -= 1
+            self._cond.notify_all()
+            return value
+
     def peek(self) -> Any:
         """Return the first element without removing it. O(1)."""
         if self.is_empty():
             raise IndexError("Queue is empty")
+        if self._old is not None:
+            return self._migrating_front()
         return self.items[self.front]
 
     def size(self) -> int:
@@ -43,8 +231,96 @@ class ArrayQueue:
         """Check if the queue is empty."""
         return self.count == 0
 
+    @property
+    def blocking(self) -> bool:
+        """Whether enqueue and dequeue wait for room or elements instead of failing."""
+        return self._cond is not None
+
+    def buffer_bytes(self) -> int:
+        """Return the memory held by the buffers, including any resize in progress."""
+        return sum(
+            sys.getsizeof(buffer)
+            for buffer in (self.items, self._old, self._spare, self._retired)
+            if buffer is not None
+        )
+
+    def __iter__(self) -> Iterator[Any]:
+        """Yield the elements from front to back without removing them."""
+        self._finish_migration()
+        for i in range(self.count):
+            yield self.items[(self.front + i) % self.capacity]
+
+    def _ordered(self) -> List[Any]:
+        """Return the elements from front to back as a new list. O(n)."""
+        self._finish_migration()
+        end = self.front + self.count
+        if end <= self.capacity:
+            return self.items[self.front:end]
+        return self.items[self.front:] + self.items[:end - self.capacity]
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Pickle the elements in order together with the queue's settings."""
+        return {
+            "items": self._ordered(),
+            "capacity": self.capacity,
+            "min_capacity": self._min_capacity,
+            "overflow": self.overflow.value,
+            "incremental": self.incremental,
+            "shrink_threshold": self.shrink_threshold,
+            "dropped": self.dropped,
+        }
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__init__(
+            state["min_capacity"],
+            OverflowPolicy(state["overflow"]),
+            state["incremental"],
+            state["shrink_threshold"],
+        )
+        self.dropped = state["dropped"]
+        self._load(state["items"], state["capacity"])
+
+    def _load(self, items: List[Any], capacity: int) -> None:
+        """Replace the contents of an empty queue with ``items`` in one go. O(n)."""
+        count = len(items)
+        capacity = max(capacity, count)
+        self.items = items + [None] * (capacity - count)
+        self.front = 0
+        self.rear = count if count < capacity else 0
+        self.count = count
+        self.capacity = capacity
+        if self.incremental and 2 * count >= capacity:
+            # No enqueue has built the spare; this is O(n) already
+            self._spare = [None] * (2 * capacity)
+
+    def to_bytes(self) -> bytes:
+        """Encode the elements in the compact format of ``analyze.serialization``."""
+        return encode_items(self._ordered())
+
+    @classmethod
+    def from_bytes(
+        cls,
+        data: bytes,
+        capacity: int = 10,
+        overflow: OverflowPolicy = OverflowPolicy.grow,
+        incremental: bool = False,
+        shrink_threshold: float = 0.0,
+    ) -> "ArrayQueue":
+        """Build a queue from the output of ``to_bytes``.
+
+        A growing queue gets at least enough capacity for every element; a
+        bounded queue raises ValueError if the elements do not fit.
+        """
+        queue = cls(capacity, overflow, incremental, shrink_threshold)
+        items = decode_items(data)
+        if len(items) > capacity and queue.overflow != OverflowPolicy.grow:
+            raise ValueError("more elements than the queue's capacity")
+        queue._load(items, capacity)
+        return queue
+
     def _resize(self, new_capacity: int) -> None:
         """Resize the underlying array."""
+        self._finish_migration()
         temp = [None] * new_capacity
         for i in range(self.count):
             index = (self.front + i) % self.capacity
@@ -53,10 +329,141 @@ class ArrayQueue:
         self.front = 0
         self.rear = self.count
         self.capacity = new_capacity
+        self._spare = None
+        self._leave_share()
+
+    def _start_migration(self, new_capacity: int) -> None:
+        """Switch to a new buffer and copy the old elements over incrementally.
+
+        The elements already in the queue keep their logical positions
+        ``0 .. count - 1`` in the new buffer; until position ``_moved`` is
+        reached they are still read from the old buffer. The pre-built spare
+        is used when it has exactly ``new_capacity`` slots, which enqueue
+        guarantees for growth; otherwise a new buffer is allocated.
+        """
+        self._finish_migration()
+        spare = self._spare
+        self._spare = None
+        if spare is None or len(spare) != new_capacity:
+            spare = [None] * new_capacity
+        if self.count:
+            self._old = self.items
+            self._old_front = self.front
+            self._old_capacity = self.capacity
+            self._old_count = self.count
+            self._moved = 0
+        self.items = spare
+        self.front = 0
+        self.rear = self.count % new_capacity
+        self.capacity = new_capacity
+        self._leave_share()
+
+    # Slots added to or removed from the next buffer per operation. Growing
+    # needs 4 per enqueue (2 * capacity slots over capacity / 2 enqueues) and
+    # shrinking 1 / (2 * shrink_threshold) per dequeue, so 16 keeps up with
+    # thresholds down to 1/32.
+    _SPARE_CHUNK = 16
+
+    def _adjust_spare(self, target: int, remaining: int = 0) -> None:
+        """Move the pre-built next buffer towards ``target`` slots. O(1) amortized.
+
+        One chunk is added or removed per call; when ``remaining`` calls are
+        left to reach the target, enough is moved to make it in time.
+        """
+        if self._spare is None:
+            self._spare = []
+        size = len(self._spare)
+        step = self._SPARE_CHUNK
+        if remaining:
+            step = max(step, -(-abs(target - size) // remaining))
+        if size < target:
+            self._spare.extend([None] * min(step, target - size))
+        elif size > target:
+            del self._spare[max(target, size - step):]
+
+    def _maybe_shrink(self) -> None:
+        """Halve the buffer once occupancy drops below the shrink threshold.
+
+        An incremental queue pre-builds the smaller buffer as occupancy
+        approaches the threshold and waits until it is complete, so the
+        dequeue that starts the shrink allocates nothing.
+        """
+        half = self.capacity // 2
+        if half < self._min_capacity or self._old is not None:
+            return
+        if self._share is not None and self._shared():
+            # The old buffer would be cleared while another queue reads it
+            return
+        limit = self.shrink_threshold * self.capacity
+        if self.incremental and self.count < 2 * limit:
+            # Finish the spare by the time the count drops below the limit
+            self._adjust_spare(half, max(self.count - math.ceil(limit) + 1, 1))
+            if len(self._spare) != half:
+                return
+        if self.count < limit:
+            self._start_migration(half)
+
+    def _migrate_step(self, steps: int = 2) -> None:
+        """Copy up to ``steps`` elements of an in-progress resize. O(steps).
+
+        Each copied slot of the old buffer is cleared, and once every slot
+        is copied the old buffer is retired rather than dropped: freeing a
+        list touches each of its slots, so it is freed a chunk at a time.
+        """
+        old = self._old
+        end = min(self._moved + steps, self._old_count)
+        for i in range(self._moved, end):
+            index = (self._old_front + i) % self._old_capacity
+            self.items[i] = old[index]
+            old[index] = None
+        self._moved = end
+        if end >= self._old_count:
+            self._retire()
+
+    def _finish_migration(self) -> None:
+        """Complete an in-progress resize in one go."""
+        if self._old is not None:
+            self._migrate_step(self._old_count)
+
+    def _retire(self) -> None:
+        """Hand the emptied old buffer over to be freed by ``_release_step``."""
+        # A buffer still being freed from an earlier resize is dropped at once
+        self._retired = self._old
+        self._old = None
+
+    def _release_step(self) -> None:
+        """Free one chunk of the retired buffer. O(1)."""
+        del self._retired[-self._SPARE_CHUNK:]
+        if not self._retired:
+            self._retired = None
+
+    def _migrating_front(self) -> Any:
+        """Return the front element while a resize is in progress."""
+        if self._moved <= self.front < self._old_count:
+            return self._old[(self._old_front + self.front) % self._old_capacity]
+        return self.items[self.front]
+
+    def _dequeue_migrating(self) -> Any:
+        """Dequeue while a resize is in progress. O(1)."""
+        value = self._migrating_front()
+        if self._moved <= self.front < self._old_count:
+            self._old[(self._old_front + self.front) % self._old_capacity] = None
+        self.items[self.front] = None
+        self.front = (self.front + 1) % self.capacity
+        self.count -= 1
+        if self.front >= self._old_count:
+            # Every element of the old buffer has been dequeued
+            self._retire()
+        else:
+            self._moved = max(self._moved, self.front)
+            self._migrate_step()
+        return value
 
     def __add__(self, other: "ArrayQueue") -> "ArrayQueue":
         """Concatenate two queues. O(n + m) operation."""
-        result = ArrayQueue(self.count + other.count)
+        self._finish_migration()
+        other._finish_migration()
+        result = ArrayQueue(max(self.count + other.count, 1))
         for i in range(self.count):
             result.enqueue(self.items[(self.front + i) % self.capacity])
         for i in range(other.count):
@@ -65,6 +472,7 @@ class ArrayQueue:
 
     def __iadd__(self, other: "ArrayQueue") -> "ArrayQueue":
         """Concatenate another queue to this queue. O(m) amortized, O(n*m) worst-case."""
+        other._finish_migration()
         for i in range(other.count):
             self.enqueue(other.items[(other.front + i) % other.capacity])
         return self
@@ -0,0 +1,545 @@
+"""Benchmark harness shared by the analysis commands."""
+
+import math
+import pickle
+import random
+import threading
+import tracemalloc
+from contextlib import ExitStack, nullcontext
+from time import perf_counter, perf_counter_ns
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from analyze.environment import summarize_repeats
+from analyze.gc_monitor import GCMode, GCMonitor, gc_disabled
+
+DOUBLING_OPERATIONS = ["enqueue", "dequeue", "peek", "concat", "iconcat"]
+
+
+def operation_elements(operation: str, size: int) -> int:
+    """Return how many elements one timed run of ``operation`` handles at ``size``."""
+    return {
+        "enqueue": size,
+        "dequeue": size // 2,
+        "peek": size // 3,
+    }.get(operation, size // 10)
+
+
+def harness_iterations(operation: str, size: int) -> int:
+    """Return the loop length of the timed function (0 when it is a single call)."""
+    if operation in ("concat", "iconcat"):
+        return 0
+    return operation_elements(operation, size)
+
+
+def time_operation(func, gc_mode=GCMode.enabled, gc_monitor=None, setup=None, warmup=True):
+    """Time an operation with the nanosecond counter and return seconds.
+
+    With ``gc_mode`` disabled the cyclic collector is off for the timed run,
+    and ``gc_monitor`` is reset and records collections during that run only.
+    When ``setup`` is given it is called untimed before the warm-up and before
+    the timed run, and ``func`` receives its result as a fresh fixture.
+    """
+    try:
+        # Warm up
+        if not warmup:
+            pass
+        elif setup is None:
+            func()
+        else:
+            func(setup())
+
+        # Actual timing
+        with ExitStack() as stack:
+            if gc_mode == GCMode.disabled:
+                stack.enter_context(gc_disabled())
+            if gc_monitor is not None:
+                gc_monitor.reset()
+                stack.enter_context(gc_monitor)
+            if setup is None:
+                start_time = perf_counter_ns()
+                func()
+                elapsed = perf_counter_ns() - start_time
+            else:
+                fixture = setup()
+                start_time = perf_counter_ns()
+                func(fixture)
+                elapsed = perf_counter_ns() - start_time
+        return elapsed / 1e9
+    except Exception:
+        return float("nan")
+
+
+def measure_doubling_cell(
+    queue_class,
+    size: int,
+    operations: Sequence[str] = DOUBLING_OPERATIONS,
+    gc_mode: GCMode = GCMode.enabled,
+    gc_stats: Optional[Dict[str, Dict]] = None,
+    on_result: Optional[Callable[[str, float], None]] = None,
+    repeats: int = 1,
+    noise: Optional[Dict[str, Dict]] = None,
+    items: Optional[Sequence] = None,
+) -> Dict[str, float]:
+    """Time the doubling operations for one queue size.
+
+    Every repeat of an operation starts from the same fixture: a fresh queue
+    for enqueue, and for dequeue a ``snapshot()`` of the filled queue, so the
+    warm-up and the timed run do the same work. A snapshot shares its nodes
+    or buffer with the live queue, which would send every dequeue down the
+    copy-on-write path, so the untimed setup has it ``unshare()`` first and
+    the timed dequeues run on a private copy. The later operations run on the
+    last dequeue fixture, so they too see an unshared queue. Iconcat moves
+    nodes out of the other queue, so it runs on the live queue with a freshly
+    built other queue per repeat. Operations that are not requested still run
+    once so the later ones see the same queue state as in a full run. When
+    ``gc_stats`` is given it is filled with each operation's GC counters, and
+    ``on_result`` is called with each operation's time as soon as it is known.
+
+    With ``repeats`` > 1 each operation is timed that many times (warming up
+    only before the first), outliers are rejected and the median of the rest
+    is reported; ``noise``, when given, receives each operation's
+    ``summarize_repeats`` record before ``on_result`` is called.
+
+    ``items`` holds at least ``size`` pre-generated elements to enqueue
+    (see ``analyze.payloads``); without it the elements are ``range(size)``.
+    """
+    values = range(size) if items is None else items[:size]
+    results = {}
+    fixtures = {}
+
+    def run(operation, func, setup=None):
+        def fixture():
+            fixtures[operation] = setup()
+            return fixtures[operation]
+
+        if operation in operations:
+            monitor = GCMonitor() if gc_stats is not None else None
+            timings = [
+                time_operation(func, gc_mode, monitor, None if setup is None else fixture, i == 0)
+                for i in range(repeats)
+            ]
+            if repeats > 1:
+                summary = summarize_repeats(timings)
+                results[operation] = summary["seconds"]
+                if noise is not None:
+                    noise[operation] = summary
+            else:
+                results[operation] = timings[0]
+            if monitor is not None:
+                gc_stats[operation] = monitor.stats()
+            if on_result is not None:
+                on_result(operation, results[operation])
+        elif setup is not None:
+            func(fixture())
+        return fixtures.pop(operation, None)
+
+    def filled(count):
+        target = queue_class()
+        for i in range(count):
+            target.enqueue(values[i])
+        return target
+
+    # Enqueue
+    queue = run("enqueue", lambda q: [q.enqueue(item) for item in values], queue_class)
+
+    def private_snapshot():
+        fixture = queue.snapshot()
+        fixture.unshare()
+        return fixture
+
+    # Dequeue, on private copies of the filled queue
+    queue = run("dequeue", lambda q: [q.dequeue() for _ in range(size // 2)], private_snapshot)
+
+    # Refill queue
+    for i in range(size // 2):
+        queue.enqueue(values[i])
+
+    # Peek
+    run("peek", lambda: [queue.peek() for _ in range(size // 3)])
+
+    # Prepare other queue for concat
+    other = filled(size // 10)
+
+    # Concat
+    run("concat", lambda: queue + other)
+
+    # Iconcat
+    run("iconcat", lambda o: queue.__iadd__(o), lambda: filled(size // 10))
+
+    return results
+
+
+def measure_interleaved(
+    queue_classes: Dict[str, type],
+    size: int,
+    operations: Sequence[str] = DOUBLING_OPERATIONS,
+    repeats: int = 20,
+    gc_mode: GCMode = GCMode.enabled,
+    items: Optional[Sequence] = None,
+    seed: Optional[int] = None,
+    on_round: Optional[Callable[[int], None]] = None,
+) -> Dict[str, Dict[str, List[float]]]:
+    """Time the doubling cell of every implementation ``repeats`` times, interleaved.
+
+    Each round measures every implementation once, in a fresh random order,
+    so that drift of the machine over the run (frequency, heat, background
+    load) spreads over all of them instead of favouring whichever ran first.
+    Returns ``{name: {operation: [seconds per round]}}``; ``on_round`` is
+    called with the number of completed rounds.
+    """
+    rng = random.Random(seed)
+    samples = {name: {operation: [] for operation in operations} for name in queue_classes}
+    names = list(queue_classes)
+    for completed in range(1, repeats + 1):
+        rng.shuffle(names)
+        for name in names:
+            cell = measure_doubling_cell(queue_classes[name], size, operations, gc_mode, items=items)
+            for operation in operations:
+                samples[name][operation].append(cell[operation])
+        if on_round is not None:
+            on_round(completed)
+    return samples
+
+
+def measure_churn(queue, prefill: int, rounds: int) -> float:
+    """Time ``rounds`` enqueue/dequeue pairs on a queue holding ``prefill`` items.
+
+    A short untimed warm-up brings any node pool to its steady state first.
+    """
+    for i in range(prefill):
+        queue.enqueue(i)
+    enqueue = queue.enqueue
+    dequeue = queue.dequeue
+    for i in range(max(rounds // 10, 1)):
+        enqueue(i)
+        dequeue()
+
+    start_time = perf_counter()
+    for i in range(rounds):
+        enqueue(i)
+        dequeue()
+    return perf_counter() - start_time
+
+
+def measure_ring(queue, items: int) -> float:
+    """Time sustained traffic through a fixed-capacity ArrayQueue.
+
+    Blocking queues are driven by a producer and a consumer thread moving
+    ``items`` elements. The other policies run a single-threaded loop that
+    enqueues two elements for every dequeue, so a bounded queue stays full
+    and keeps exercising its overflow path.
+    """
+    if queue.blocking:
+        def consume():
+            for _ in range(items):
+                queue.dequeue()
+
+        consumer = threading.Thread(target=consume)
+        start_time = perf_counter()
+        consumer.start()
+        for i in range(items):
+            queue.enqueue(i)
+        consumer.join()
+        return perf_counter() - start_time
+
+    enqueue = queue.enqueue
+    dequeue = queue.dequeue
+    start_time = perf_counter()
+    for i in range(items):
+        try:
+            enqueue(i)
+        except IndexError:
+            pass
+        if i & 1:
+            dequeue()
+    return perf_counter() - start_time
+
+
+def measure_enqueue_latencies(queue, count: int) -> List[int]:
+    """Return the latency of each of ``count`` enqueues in nanoseconds."""
+    latencies = [0] * count
+    enqueue = queue.enqueue
+    clock = perf_counter_ns
+    for i in range(count):
+        start = clock()
+        enqueue(i)
+        latencies[i] = clock() - start
+    return latencies
+
+
+def measure_memory_over_time(
+    queue, burst: int, floor: int, bursts: int, samples: int = 200
+) -> Tuple[List[Tuple[int, int, int, int]], List[Tuple[int, int, int, int]]]:
+    """Run a bursty workload and sample an ArrayQueue's buffer memory.
+
+    Each burst fills the queue up to ``burst`` elements and drains it back to
+    ``floor``. Returns ``(samples, phases)``: ``samples`` holds
+    ``(operation, size, capacity, bytes)`` tuples taken at regular intervals
+    and ``phases`` the same tuple at the end of every fill and every drain.
+    """
+    total = floor + 2 * bursts * max(burst - floor, 0)
+    every = max(total // samples, 1)
+    timeline = []
+    phases = []
+    operation = 0
+
+    def record():
+        return (operation, queue.size(), queue.capacity, queue.buffer_bytes())
+
+    for i in range(floor):
+        queue.enqueue(i)
+        operation += 1
+    for _ in range(bursts):
+        while queue.size() < burst:
+            queue.enqueue(operation)
+            operation += 1
+            if operation % every == 0:
+                timeline.append(record())
+        phases.append(record())
+        while queue.size() > floor:
+            queue.dequeue()
+            operation += 1
+            if operation % every == 0:
+                timeline.append(record())
+        phases.append(record())
+    return timeline, phases
+
+
+def measure_serialization(queue, gc_mode: GCMode = GCMode.enabled) -> Dict[str, Tuple[int, float, float]]:
+    """Time saving and loading a filled queue with pickle and with ``to_bytes``.
+
+    Returns ``{format: (bytes, save_seconds, load_seconds)}``. Contents the
+    binary format cannot encode are reported with NaN times.
+    """
+    formats = {
+        "pickle": (lambda: pickle.dumps(queue, pickle.HIGHEST_PROTOCOL), pickle.loads),
+        "to_bytes": (queue.to_bytes, type(queue).from_bytes),
+    }
+    results = {}
+    for name, (save, load) in formats.items():
+        with gc_disabled() if gc_mode == GCMode.disabled else nullcontext():
+            try:
+                start_time = perf_counter()
+                data = save()
+                saved = perf_counter() - start_time
+                start_time = perf_counter()
+                loaded = load(data)
+                load_time = perf_counter() - start_time
+            except TypeError:
+                results[name] = (0, math.nan, math.nan)
+                continue
+        # Free the copy outside the timed region
+        del loaded
+        results[name] = (len(data), saved, load_time)
+    return results
+
+
+def measure_payload(
+    queue_class, items: Sequence, gc_mode: GCMode = GCMode.enabled
+) -> Dict[str, float]:
+    """Time enqueuing and dequeuing all of ``items`` and trace the queue's memory.
+
+    Returns the enqueue and dequeue times in seconds and ``queue_bytes``, the
+    memory the filled queue itself allocated; the elements already exist, so
+    they are not part of it.
+    """
+    enqueue = time_operation(
+        lambda q: [q.enqueue(item) for item in items], gc_mode, setup=queue_class
+    )
+
+    def filled():
+        queue = queue_class()
+        for item in items:
+            queue.enqueue(item)
+        return queue
+
+    dequeue = time_operation(
+        lambda q: [q.dequeue() for _ in range(len(items))], gc_mode, setup=filled
+    )
+    tracemalloc.start()
+    try:
+        queue = filled()
+        queue_bytes, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del queue
+    return {"enqueue": enqueue, "dequeue": dequeue, "queue_bytes": queue_bytes}
+
+
+def percentile(sorted_values: Sequence[float], fraction: float) -> float:
+    """Return the nearest-rank percentile of already sorted values."""
+    if not sorted_values:
+        return math.nan
+    rank = max(math.ceil(fraction * len(sorted_values)), 1)
+    return sorted_values[rank - 1]
+
+
+class TimeBudget:
+    """Wall-clock budget for a doubling experiment.
+
+    ``total`` bounds the whole run and ``per_cell`` bounds the time a single
+    operation may take at one size. Either may be ``None`` for no limit.
+    """
+
+    def __init__(self, total: Optional[float] = None, per_cell: Optional[float] = None):
+        self.total = total
+        self.per_cell = per_cell
+        self.start = perf_counter()
+
+    def elapsed(self) -> float:
+        """Return the seconds spent since the budget started."""
+        return perf_counter() - self.start
+
+    def remaining(self) -> float:
+        """Return the seconds left in the total budget."""
+        if self.total is None:
+            return math.inf
+        return max(self.total - self.elapsed(), 0.0)
+
+    def exhausted(self) -> bool:
+        """Check whether the total budget has been used up."""
+        return self.remaining() <= 0.0
+
+    def share(self, parts: int) -> "TimeBudget":
+        """Return a sub-budget with an equal share of what is left."""
+        total = None if self.total is None else self.remaining() / max(parts, 1)
+        return TimeBudget(total=total, per_cell=self.per_cell)
+
+
+class AdaptiveDoubling:
+    """Budget-aware doubling experiment for one queue implementation.
+
+    Each operation keeps doubling until its predicted time at the next size
+    would exceed the per-cell budget, and the whole sweep stops once the next
+    size is predicted to overrun the total budget. Afterwards sizes are
+    refined geometrically around the points where an operation's growth
+    exponent changes, which is where the cost curve bends.
+    """
+
+    def __init__(
+        self,
+        measure: Callable[[int, Sequence[str]], Dict[str, float]],
+        budget: TimeBudget,
+        operations: Sequence[str] = DOUBLING_OPERATIONS,
+        bend_threshold: float = 0.75,
+        refine_rounds: int = 2,
+        min_time: float = 1e-4,
+    ):
+        self.measure = measure
+        self.budget = budget
+        self.operations = list(operations)
+        self.bend_threshold = bend_threshold
+        self.refine_rounds = refine_rounds
+        self.min_time = min_time
+        self.cells: Dict[int, Dict[str, float]] = {}
+        self.wall: Dict[int, float] = {}
+        self.stopped: Dict[str, int] = {}
+
+    def _measure(self, size: int, operations: Sequence[str]) -> None:
+        start = perf_counter()
+        self.cells[size] = self.measure(size, operations)
+        self.wall[size] = perf_counter() - start
+
+    def _predict(self, sizes: List[int], operation: str, size: int) -> float:
+        """Extrapolate an operation's time to ``size`` from the last two sizes."""
+        known = [s for s in sizes if not math.isnan(self.cells[s].get(operation, math.nan))]
+        if not known:
+            return 0.0
+        last = known[-1]
+        last_time = self.cells[last][operation]
+        exponent = 1.0
+        if len(known) > 1:
+            prev = known[-2]
+            prev_time = self.cells[prev][operation]
+            if prev_time > 0 and last_time > 0:
+                exponent = max(math.log(last_time / prev_time) / math.log(last / prev), 1.0)
+        return last_time * (size / last) ** exponent
+
+    def _predict_wall(self, sizes: List[int], size: int) -> float:
+        if not sizes:
+            return 0.0
+        last = sizes[-1]
+        exponent = 1.0
+        if len(sizes) > 1 and self.wall[sizes[-2]] > 0:
+            prev = sizes[-2]
+            exponent = max(math.log(self.wall[last] / self.wall[prev]) / math.log(last / prev), 1.0)
+        return self.wall[last] * (size / last) ** exponent
+
+    def _active_operations(self, sizes: List[int], size: int) -> List[str]:
+        active = []
+        for operation in self.operations:
+            if operation in self.stopped:
+                continue
+            # The harness runs each operation twice (warm-up and timed run)
+            predicted = 2 * self._predict(sizes, operation, size)
+            if self.budget.per_cell is not None and predicted > self.budget.per_cell:
+                self.stopped[operation] = size
+                continue
+            active.append(operation)
+        return active
+
+    def run(self, initial_size: int, max_size: int) -> List[int]:
+        """Run the doubling pass and the refinement rounds, returning the sizes measured."""
+        sizes: List[int] = []
+        size = initial_size
+        while size <= max_size:
+            operations = self._active_operations(sizes, size)
+            if not operations:
+                break
+            if self._predict_wall(sizes, size) > self.budget.remaining():
+                for operation in operations:
+                    self.stopped.setdefault(operation, size)
+                break
+            self._measure(size, operations)
+            sizes.append(size)
+            size *= 2
+
+        for _ in range(self.refine_rounds):
+            new_sizes = self._refinement_sizes(sizes)
+            if not new_sizes:
+                break
+            for size in new_sizes:
+                operations = [
+                    op for op in self.operations
+                    if op not in self.stopped or size < self.stopped[op]
+                ]
+                if not operations or self._predict_wall(sizes, size) > self.budget.remaining():
+                    break
+                self._measure(size, operations)
+            sizes = sorted(self.cells)
+        return sorted(self.cells)
+
+    def _slope(self, operation: str, small: int, large: int) -> Optional[float]:
+        first = self.cells[small].get(operation, math.nan)
+        second = self.cells[large].get(operation, math.nan)
+        if math.isnan(first) or math.isnan(second):
+            return None
+        if first < self.min_time or second < self.min_time:
+            return None
+        return math.log(second / first) / math.log(large / small)
+
+    def _refinement_sizes(self, sizes: List[int]) -> List[int]:
+        """Return geometric midpoints of the intervals next to a bend in the curve."""
+        intervals = set()
+        for i in range(1, len(sizes) - 1):
+            for operation in self.operations:
+                left = self._slope(operation, sizes[i - 1], sizes[i])
+                right = self._slope(operation, sizes[i], sizes[i + 1])
+                if left is None or right is None:
+                    continue
+                if abs(right - left) > self.bend_threshold:
+                    intervals.add((sizes[i - 1], sizes[i]))
+                    intervals.add((sizes[i], sizes[i + 1]))
+        midpoints = []
+        for small, large in sorted(intervals):
+            midpoint = int(round(math.sqrt(small * large)))
+            if small < midpoint < large and midpoint not in self.cells:
+                midpoints.append(midpoint)
+        return midpoints
+
+    def results(self, sizes: Sequence[int]) -> Dict[str, List[float]]:
+        """Return per-operation time lists aligned with ``sizes`` (NaN when skipped)."""
+        return {
+            operation: [self.cells[size].get(operation, math.nan) for size in sizes]
+            for operation in self.operations
+        }
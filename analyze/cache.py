@@ -0,0 +1,109 @@
+"""Content-addressed cache of benchmark results."""
+
+import hashlib
+import inspect
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import analyze.benchmark
+
+
+def _analyze_imports(module) -> Dict[str, Any]:
+    """Return the ``analyze`` modules that ``module`` pulls modules or names from."""
+    found = {}
+    for value in vars(module).values():
+        dependency = value if inspect.ismodule(value) else inspect.getmodule(value)
+        if dependency is not None and dependency.__name__.startswith("analyze."):
+            found[dependency.__name__] = dependency
+    return found
+
+
+def implementation_sources(queue_class) -> Dict[str, str]:
+    """Return the source of every ``analyze`` module a queue class depends on.
+
+    That is the module defining the class and the benchmark harness, plus
+    every ``analyze`` module either of them imports, directly or through
+    another one (such as the node pool, the GC monitor and the environment
+    checks).
+    """
+    module = sys.modules[queue_class.__module__]
+    modules = {module.__name__: module, analyze.benchmark.__name__: analyze.benchmark}
+    pending = list(modules.values())
+    while pending:
+        for name, dependency in _analyze_imports(pending.pop()).items():
+            if name not in modules:
+                modules[name] = dependency
+                pending.append(dependency)
+    return {name: inspect.getsource(modules[name]) for name in sorted(modules)}
+
+
+class ResultCache:
+    """Benchmark results stored as JSON files named by a content hash.
+
+    The key covers the implementation's source (see
+    ``implementation_sources``), the interpreter version and the benchmark
+    parameters, so results are only reused while all three are unchanged.
+    """
+
+    def __init__(self, root: Path = Path(".queue_cache")):
+        self.root = Path(root)
+
+    def key(self, queue_class, parameters: Dict[str, Any]) -> str:
+        """Return the cache key for one implementation and parameter set."""
+        digest = hashlib.sha256()
+        for name, source in implementation_sources(queue_class).items():
+            digest.update(name.encode())
+            digest.update(source.encode())
+        digest.update(sys.version.encode())
+        digest.update(sys.implementation.name.encode())
+        digest.update(json.dumps(parameters, sort_keys=True, default=str).encode())
+        return digest.hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.root / f"{key}.json"
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value for ``key``, or None on a miss."""
+        path = self._path(key)
+        try:
+            with open(path) as handle:
+                value = json.load(handle)
+        except (OSError, json.JSONDecodeError):
+            return None
+        # Refresh the timestamp so eviction by age drops the least recently used first
+        path.touch()
+        return value
+
+    def put(self, key: str, value: Any) -> None:
+        """Store ``value`` under ``key``."""
+        self.root.mkdir(parents=True, exist_ok=True)
+        path = self._path(key)
+        temporary = path.with_suffix(".tmp")
+        with open(temporary, "w") as handle:
+            json.dump(value, handle)
+        temporary.replace(path)
+
+    def evict(self, max_age: Optional[float] = None, max_bytes: Optional[int] = None) -> int:
+        """Remove entries older than ``max_age`` seconds, then the oldest ones
+        until the cache is at most ``max_bytes``. Returns the number removed."""
+        if not self.root.exists():
+            return 0
+        entries = sorted(
+            (path.stat().st_mtime, path.stat().st_size, path)
+            for path in self.root.glob("*.json")
+        )
+        removed = 0
+        now = time.time()
+        total = sum(size for _, size, _ in entries)
+        for mtime, size, path in entries:
+            too_old = max_age is not None and now - mtime > max_age
+            too_big = max_bytes is not None and total > max_bytes
+            if not (too_old or too_big):
+                continue
+            path.unlink()
+            total -= size
+            removed += 1
+        return removed
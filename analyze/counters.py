@@ -0,0 +1,239 @@
+"""Internal cost counters for the queue implementations.
+
+The counting subclasses here record the work the queues do behind the
+timings: resizes and element copies of ArrayQueue, node allocations and pool
+reuse of the linked lists. Counting has a cost of its own, so the plain
+classes stay uninstrumented and ``count_doubling_cell`` replays the doubling
+operations with the counting classes in a separate, untimed pass.
+"""
+
+import struct
+import sys
+from typing import Any, Dict, Optional
+
+from analyze.ArrayQueue import ArrayQueue
+from analyze.dll_queue import BasicDLLQueue
+from analyze.dll_queue import Node as DLLNode
+from analyze.sll_queue import BasicSLLQueue
+from analyze.sll_queue import Node as SLLNode
+
+# A buffer slot is one object pointer
+POINTER_SIZE = struct.calcsize("P")
+
+
+class CostCounters:
+    """Running totals shared by every queue that counts into them."""
+
+    FIELDS = ("enqueues", "dequeues", "resizes", "elements_copied", "nodes_allocated", "nodes_reused")
+
+    def __init__(self):
+        self.enqueues = 0
+        self.dequeues = 0
+        self.resizes = 0
+        self.elements_copied = 0
+        self.nodes_allocated = 0
+        self.nodes_reused = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Return a copy of the totals."""
+        return {field: getattr(self, field) for field in self.FIELDS}
+
+
+def node_bytes(node_class: type) -> int:
+    """Return the memory of one node object including its attribute dict."""
+    node = node_class(None)
+    size = sys.getsizeof(node)
+    if hasattr(node, "__dict__"):
+        size += sys.getsizeof(node.__dict__)
+    return size
+
+
+class CountingArrayQueue(ArrayQueue):
+    """ArrayQueue that counts resizes and the elements they copy.
+
+    Copies made by a full resize, by an incremental migration, by the
+    copy-on-write of a shared buffer and by concatenation all count as
+    ``elements_copied``.
+    """
+
+    def __init__(self, *args, counters: Optional[CostCounters] = None, **kwargs):
+        self.counters = counters if counters is not None else CostCounters()
+        super().__init__(*args, **kwargs)
+
+    def enqueue(self, value: Any, timeout: Optional[float] = None) -> None:
+        self.counters.enqueues += 1
+        super().enqueue(value, timeout)
+
+    def dequeue(self, timeout: Optional[float] = None) -> Any:
+        self.counters.dequeues += 1
+        return super().dequeue(timeout)
+
+    def _own_buffer(self) -> None:
+        if self._share is not None and self._shared():
+            self.counters.elements_copied += len(self.items)
+        super()._own_buffer()
+
+    def _resize(self, new_capacity: int) -> None:
+        self._finish_migration()
+        self.counters.resizes += 1
+        self.counters.elements_copied += self.count
+        super()._resize(new_capacity)
+
+    def _start_migration(self, new_capacity: int) -> None:
+        self.counters.resizes += 1
+        super()._start_migration(new_capacity)
+
+    def _migrate_step(self, steps: int = 2) -> None:
+        moved = self._moved
+        super()._migrate_step(steps)
+        self.counters.elements_copied += self._moved - moved
+
+    def __add__(self, other: ArrayQueue) -> ArrayQueue:
+        self.counters.elements_copied += self.count + other.count
+        return super().__add__(other)
+
+    def __iadd__(self, other: ArrayQueue) -> ArrayQueue:
+        self.counters.elements_copied += other.count
+        return super().__iadd__(other)
+
+    def wasted(self) -> int:
+        """Return the allocated slots that hold no element, including spare and old buffers."""
+        slots = self.capacity - self.count
+        if self._spare is not None:
+            slots += len(self._spare)
+        if self._old is not None:
+            slots += self._old_capacity
+        if self._retired is not None:
+            slots += len(self._retired)
+        return slots
+
+
+class _NodeCounting:
+    """Counting shared by the linked-list queues."""
+
+    counters: CostCounters
+    # Set while _unshare re-enqueues the shared elements
+    _copying = False
+
+    def _count_node(self) -> None:
+        if self._pool is not None and len(self._pool):
+            self.counters.nodes_reused += 1
+        else:
+            self.counters.nodes_allocated += 1
+
+    def enqueue(self, item: Any) -> None:
+        if not self._copying:
+            self.counters.enqueues += 1
+        self._count_node()
+        super().enqueue(item)
+
+    def dequeue(self) -> Any:
+        self.counters.dequeues += 1
+        return super().dequeue()
+
+    def _unshare(self) -> None:
+        # The copies are re-enqueued, which counts their nodes but not as enqueues
+        self.counters.elements_copied += self._size
+        self._copying = True
+        try:
+            super()._unshare()
+        finally:
+            self._copying = False
+
+    def _extend(self, items) -> None:
+        items = list(items)
+        self.counters.nodes_allocated += len(items)
+        super()._extend(items)
+
+    def __add__(self, other):
+        copied = self._size + other._size
+        self.counters.elements_copied += copied
+        self.counters.nodes_allocated += copied
+        return super().__add__(other)
+
+    def wasted(self) -> int:
+        """Return the free nodes kept by the pool."""
+        return len(self._pool) if self._pool is not None else 0
+
+
+class CountingDLLQueue(_NodeCounting, BasicDLLQueue):
+    """BasicDLLQueue that counts node allocations and copies."""
+
+    def __init__(self, *args, counters: Optional[CostCounters] = None, **kwargs):
+        self.counters = counters if counters is not None else CostCounters()
+        super().__init__(*args, **kwargs)
+
+    def push_front(self, item: Any) -> None:
+        self.counters.enqueues += 1
+        self._count_node()
+        super().push_front(item)
+
+
+class CountingSLLQueue(_NodeCounting, BasicSLLQueue):
+    """BasicSLLQueue that counts node allocations and copies."""
+
+    def __init__(self, *args, counters: Optional[CostCounters] = None, **kwargs):
+        self.counters = counters if counters is not None else CostCounters()
+        super().__init__(*args, **kwargs)
+
+
+COUNTING_CLASSES = {
+    ArrayQueue: CountingArrayQueue,
+    BasicDLLQueue: CountingDLLQueue,
+    BasicSLLQueue: CountingSLLQueue,
+}
+
+NODE_CLASSES = {
+    BasicDLLQueue: DLLNode,
+    BasicSLLQueue: SLLNode,
+}
+
+
+def count_doubling_cell(queue_class, size: int) -> Dict[str, Dict[str, int]]:
+    """Replay the doubling operations once and return the counters of each.
+
+    The sequence and fixtures match ``measure_doubling_cell``: enqueue
+    ``size`` into a fresh queue, dequeue half of a filled, unshared queue
+    (the state of the timed run's private snapshot copy, built here with the
+    counting class), refill that queue, peek a third, then concat and
+    iconcat a tenth, each with its own freshly filled other queue. Building
+    the fixtures is not counted. Every record holds the counter increments
+    of that operation plus ``bytes_copied`` (buffer slots copied times the
+    pointer size), ``node_bytes`` (memory of the nodes allocated) and
+    ``wasted``, the unused slots or pooled nodes left afterwards.
+    """
+    counting = COUNTING_CLASSES[queue_class]
+    per_node = node_bytes(NODE_CLASSES[queue_class]) if queue_class in NODE_CLASSES else 0
+    counters = CostCounters()
+    results = {}
+
+    def step(operation, queue, func):
+        before = counters.stats()
+        func()
+        record = {field: value - before[field] for field, value in counters.stats().items()}
+        record["bytes_copied"] = record["elements_copied"] * POINTER_SIZE
+        record["node_bytes"] = record["nodes_allocated"] * per_node
+        record["wasted"] = queue.wasted()
+        results[operation] = record
+
+    def filled(count):
+        # Built with separate counters so that they stay out of the operations
+        target = counting()
+        for i in range(count):
+            target.enqueue(i)
+        return target
+
+    queue = counting(counters=counters)
+    step("enqueue", queue, lambda: [queue.enqueue(i) for i in range(size)])
+    # Like the timed run, dequeue works on a fresh fixture and the rest on it
+    queue = filled(size)
+    queue.counters = counters
+    step("dequeue", queue, lambda: [queue.dequeue() for _ in range(size // 2)])
+    for i in range(size // 2):
+        queue.enqueue(i)
+    step("peek", queue, lambda: [queue.peek() for _ in range(size // 3)])
+    other = filled(size // 10)
+    step("concat", queue, lambda: queue + other)
+    other = filled(size // 10)
+    step("iconcat", queue, lambda: queue.__iadd__(other))
+    return results
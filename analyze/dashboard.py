@@ -0,0 +1,123 @@
+"""Live terminal dashboard for long doubling experiments."""
+
+from datetime import timedelta
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from rich import box
+from rich.console import Group
+from rich.progress import (
+    BarColumn,
+    Progress,
+    ProgressColumn,
+    Task,
+    TaskProgressColumn,
+    TextColumn,
+    TimeElapsedColumn,
+    TimeRemainingColumn,
+)
+from rich.table import Table
+from rich.text import Text
+
+from analyze.benchmark import TimeBudget
+
+
+class BudgetRemainingColumn(ProgressColumn):
+    """Time left in a total budget, an upper bound on the time left in the run."""
+
+    def __init__(self, budget: TimeBudget):
+        super().__init__()
+        self.budget = budget
+
+    def render(self, task: Task) -> Text:
+        left = timedelta(seconds=int(self.budget.remaining()))
+        return Text(f"≤ {left}", style="progress.remaining")
+
+
+class DoublingDashboard:
+    """Rich renderable showing progress, ETA and partial doubling results.
+
+    Progress is weighted by queue size, since a cell at size 2n takes about
+    twice as long as one at size n, which keeps the ETA meaningful while the
+    sizes grow.
+
+    Adaptive doubling picks its sizes as it goes, so with a ``budget`` the
+    bar tracks elapsed time against the total budget and the ETA is the
+    budget left. A budget without a total shows no ETA at all.
+    """
+
+    def __init__(
+        self,
+        implementations: Sequence[str],
+        sizes: Sequence[int],
+        operations: Sequence[str],
+        visible_rows: int = 12,
+        budget: Optional[TimeBudget] = None,
+    ):
+        self.operations = list(operations)
+        self.visible_rows = visible_rows
+        self.budget = budget
+        columns: List[ProgressColumn] = [
+            TextColumn("[bold blue]{task.description}"),
+            BarColumn(),
+            TaskProgressColumn(),
+            TimeElapsedColumn(),
+        ]
+        if budget is None:
+            columns += [TextColumn("ETA"), TimeRemainingColumn()]
+            total: Optional[float] = len(implementations) * sum(sizes) * len(self.operations)
+        elif budget.total is not None:
+            columns += [TextColumn("ETA"), BudgetRemainingColumn(budget)]
+            total = budget.total
+        else:
+            total = None
+        self.progress = Progress(*columns)
+        self.task = self.progress.add_task("doubling", total=total)
+        self.rows: Dict[Tuple[str, int], Dict[str, float]] = {}
+        self.current: Tuple[str, int] = ("", 0)
+
+    def start_cell(self, implementation: str, size: int) -> None:
+        """Mark the (implementation, size) cell that is being measured."""
+        self.current = (implementation, size)
+        self.rows.setdefault(self.current, {})
+        self.progress.update(
+            self.task, description=f"{implementation.upper()} n={size:,}"
+        )
+
+    def record(self, implementation: str, size: int, operation: str, seconds: float) -> None:
+        """Add one measured operation to the dashboard."""
+        self.rows.setdefault((implementation, size), {})[operation] = seconds
+        self._advance(size)
+
+    def skip(self, size: int, operations: int = 1) -> None:
+        """Advance the progress bar past work that will not be measured."""
+        self._advance(size * operations)
+
+    def _advance(self, size: int) -> None:
+        if self.budget is None:
+            self.progress.advance(self.task, size)
+        elif self.budget.total is not None:
+            self.progress.update(
+                self.task, completed=min(self.budget.elapsed(), self.budget.total)
+            )
+
+    def _table(self) -> Table:
+        table = Table(box=box.SIMPLE_HEAD, header_style="bold magenta")
+        table.add_column("Queue", style="cyan")
+        table.add_column("Size (n)", justify="right")
+        for operation in self.operations:
+            table.add_column(f"{operation} (ms)", justify="right")
+        keys: List[Tuple[str, int]] = list(self.rows)[-self.visible_rows:]
+        for key in keys:
+            cell = self.rows[key]
+            values = [
+                f"{cell[operation] * 1000:.5f}" if operation in cell
+                else ("…" if key == self.current else "-")
+                for operation in self.operations
+            ]
+            table.add_row(key[0].upper(), f"{key[1]:,}", *values)
+        return table
+
+    def __rich__(self) -> Group:
+        # Budgeted progress moves with the clock, not only when a cell ends
+        self._advance(0)
+        return Group(self.progress, self._table())
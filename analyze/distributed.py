@@ -0,0 +1,378 @@
+"""Coordinator and workers for running doubling experiments over TCP.
+
+Workers connect to the coordinator and pull one (implementation, size) job at
+a time. Messages are JSON objects, one per line:
+
+* worker -> coordinator: ``hello`` with the worker's name and host, then a
+  ``result`` for every job it was given;
+* coordinator -> worker: ``job`` with the cell to measure, or ``done`` when
+  there is nothing left.
+
+Every worker first measures the same calibration cell, which gives a speed
+reference for comparing workers and hosts. A job whose worker disconnects is
+handed to the next worker that asks, up to ``max_attempts`` times in all;
+a job that has lost that many workers is given up and its cell recorded as
+NaN, so one cell that crashes every worker cannot stall the sweep.
+
+The module only depends on the standard library and the queue
+implementations, so a worker can be started on another host with
+``python -m analyze.distributed HOST:PORT``.
+"""
+
+import argparse
+import json
+import math
+import os
+import platform
+import socket
+import socketserver
+import statistics
+import subprocess
+import sys
+import threading
+from collections import deque
+from time import perf_counter, sleep
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from analyze.benchmark import measure_doubling_cell
+from analyze.gc_monitor import GCMode
+from analyze.implementations import IMPLEMENTATIONS
+from analyze.isolation import child_env
+from analyze.payloads import Payload, make_payloads
+
+CALIBRATION_JOB = {
+    "id": "calibration",
+    "implementation": "sll",
+    "size": 100000,
+    "operations": ["enqueue", "dequeue"],
+}
+
+
+def _send(stream, message: Dict[str, Any]) -> None:
+    stream.write(json.dumps(message).encode("utf-8") + b"\n")
+    stream.flush()
+
+
+def _receive(stream) -> Optional[Dict[str, Any]]:
+    """Return the next message, or None when the peer has gone away."""
+    try:
+        line = stream.readline()
+    except OSError:
+        return None
+    if not line:
+        return None
+    return json.loads(line)
+
+
+def make_jobs(
+    cells: Dict[Tuple[str, int], Sequence[str]],
+    gc_mode: GCMode = GCMode.enabled,
+    payload: Payload = Payload.small_int,
+) -> List[Dict[str, Any]]:
+    """Turn ``{(implementation, size): operations}`` into jobs, largest sizes first.
+
+    Handing out the slowest cells first keeps one long job from running on
+    its own at the end of the sweep.
+    """
+    ordered = sorted(cells.items(), key=lambda item: item[0][1], reverse=True)
+    return [
+        {
+            "id": index,
+            "implementation": implementation,
+            "size": size,
+            "operations": list(operations),
+            "gc_mode": GCMode(gc_mode).value,
+            "payload": Payload(payload).value,
+        }
+        for index, ((implementation, size), operations) in enumerate(ordered)
+    ]
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    """Serves one worker connection."""
+
+    def handle(self) -> None:
+        coordinator = self.server.coordinator
+        hello = _receive(self.rfile)
+        if hello is None or hello.get("type") != "hello":
+            return
+        worker = coordinator._register(hello, self.client_address[0])
+        job = dict(CALIBRATION_JOB, gc_mode=coordinator.gc_mode.value)
+        while True:
+            if job is None:
+                job = coordinator._next_job()
+            if job is None:
+                try:
+                    _send(self.wfile, {"type": "done"})
+                except OSError:
+                    pass
+                return
+            try:
+                _send(self.wfile, dict(job, type="job"))
+            except OSError:
+                coordinator._requeue(worker, job)
+                return
+            reply = _receive(self.rfile)
+            if reply is None or reply.get("type") != "result":
+                coordinator._requeue(worker, job)
+                return
+            coordinator._finish(worker, job, reply)
+            job = None
+
+
+class _Server(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+class Coordinator:
+    """Hands doubling jobs to TCP workers and collects their results.
+
+    ``results`` maps ``(implementation, size)`` to the operation times and
+    ``workers`` holds per-worker counters. ``on_result`` is called, from the
+    connection's thread but never concurrently, as
+    ``on_result(worker_name, implementation, size, operation, seconds)``.
+    A job is handed out at most ``max_attempts`` times; after that its
+    operations are reported as NaN by the worker that lost it last and its
+    id is added to ``failed``.
+    """
+
+    def __init__(
+        self,
+        jobs: Sequence[Dict[str, Any]],
+        host: str = "127.0.0.1",
+        port: int = 0,
+        gc_mode: GCMode = GCMode.enabled,
+        on_result: Optional[Callable[[str, str, int, str, float], None]] = None,
+        max_attempts: int = 3,
+    ):
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+        self.gc_mode = GCMode(gc_mode)
+        self.on_result = on_result
+        self.max_attempts = max_attempts
+        self.results: Dict[Tuple[str, int], Dict[str, float]] = {}
+        self.workers: Dict[str, Dict[str, Any]] = {}
+        self.failed: List[Any] = []
+        self._attempts: Dict[Any, int] = {}
+        self._pending = deque(jobs)
+        self._outstanding = len(jobs)
+        self._cond = threading.Condition()
+        self._server = _Server((host, port), _Handler)
+        self._server.coordinator = self
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def address(self) -> Tuple[str, int]:
+        """Return the (host, port) the coordinator listens on."""
+        return self._server.server_address[:2]
+
+    def start(self) -> "Coordinator":
+        """Start accepting workers in a background thread."""
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until every job has a result; return False on timeout."""
+        with self._cond:
+            return self._cond.wait_for(lambda: self._outstanding == 0, timeout)
+
+    def close(self) -> None:
+        """Stop accepting workers and release the port."""
+        with self._cond:
+            self._pending.clear()
+            self._outstanding = 0
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread.join()
+        self._server.server_close()
+
+    def __enter__(self) -> "Coordinator":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    @property
+    def remaining(self) -> int:
+        """Return the number of jobs without a result yet."""
+        return self._outstanding
+
+    def _register(self, hello: Dict[str, Any], address: str) -> str:
+        with self._cond:
+            name = str(hello.get("name") or address)
+            base, suffix = name, 2
+            while name in self.workers:
+                name = f"{base}-{suffix}"
+                suffix += 1
+            self.workers[name] = {
+                "host": hello.get("host") or address,
+                "python": hello.get("python", ""),
+                "jobs": 0,
+                "cells": 0,
+                "elements": 0,
+                "busy": 0.0,
+                "calibration": math.nan,
+            }
+            return name
+
+    def _next_job(self) -> Optional[Dict[str, Any]]:
+        """Return a pending job, waiting while a failed job may still come back."""
+        with self._cond:
+            while not self._pending and self._outstanding > 0:
+                self._cond.wait()
+            return self._pending.popleft() if self._pending else None
+
+    def _requeue(self, worker: str, job: Dict[str, Any]) -> None:
+        """Hand ``job`` out again after ``worker`` lost it, or give it up."""
+        if job["id"] == CALIBRATION_JOB["id"]:
+            return
+        with self._cond:
+            if self._outstanding == 0:
+                return
+            attempts = self._attempts.get(job["id"], 0) + 1
+            self._attempts[job["id"]] = attempts
+            if attempts < self.max_attempts:
+                self._pending.appendleft(job)
+                self._cond.notify_all()
+                return
+            self.failed.append(job["id"])
+            self._record(worker, job, {operation: math.nan for operation in job["operations"]})
+
+    def _finish(self, worker: str, job: Dict[str, Any], reply: Dict[str, Any]) -> None:
+        results = reply.get("results", {})
+        with self._cond:
+            stats = self.workers[worker]
+            if job["id"] == CALIBRATION_JOB["id"]:
+                stats["calibration"] = sum(results.values())
+                return
+            stats["jobs"] += 1
+            stats["cells"] += len(results)
+            stats["elements"] += job["size"] * len(results)
+            stats["busy"] += reply.get("elapsed", 0.0)
+            self._record(worker, job, results)
+
+    def _record(self, worker: str, job: Dict[str, Any], results: Dict[str, float]) -> None:
+        """Store the results of a finished or abandoned job; the caller holds the lock."""
+        cell = self.results.setdefault((job["implementation"], job["size"]), {})
+        cell.update(results)
+        if self.on_result is not None:
+            for operation, seconds in results.items():
+                self.on_result(worker, job["implementation"], job["size"], operation, seconds)
+        self._outstanding -= 1
+        self._cond.notify_all()
+
+
+def host_spread(workers: Dict[str, Dict[str, Any]]) -> Tuple[Dict[str, Tuple[int, float, float]], float]:
+    """Summarise calibration times by host.
+
+    Returns ``({host: (workers, mean_seconds, stdev_seconds)}, cv)`` where
+    ``cv`` is the coefficient of variation of the host means (NaN with fewer
+    than two hosts).
+    """
+    by_host: Dict[str, List[float]] = {}
+    for stats in workers.values():
+        if not math.isnan(stats["calibration"]):
+            by_host.setdefault(stats["host"], []).append(stats["calibration"])
+    summary = {
+        host: (
+            len(times),
+            statistics.mean(times),
+            statistics.stdev(times) if len(times) > 1 else 0.0,
+        )
+        for host, times in by_host.items()
+    }
+    means = [mean for _, mean, _ in summary.values()]
+    cv = statistics.stdev(means) / statistics.mean(means) if len(means) > 1 else math.nan
+    return summary, cv
+
+
+def run_worker(host: str, port: int, name: Optional[str] = None, connect_timeout: float = 10.0) -> int:
+    """Connect to a coordinator and measure jobs until it is done.
+
+    Connection attempts are retried for ``connect_timeout`` seconds so that
+    workers may be started before the coordinator. Returns the number of
+    jobs measured, including the calibration cell.
+    """
+    deadline = perf_counter() + connect_timeout
+    while True:
+        try:
+            connection = socket.create_connection((host, port))
+            break
+        except OSError:
+            if perf_counter() >= deadline:
+                raise
+            sleep(0.2)
+
+    jobs = 0
+    with connection, connection.makefile("rwb") as stream:
+        _send(
+            stream,
+            {
+                "type": "hello",
+                "name": name or f"{socket.gethostname()}-{os.getpid()}",
+                "host": socket.gethostname(),
+                "python": platform.python_version(),
+            },
+        )
+        while True:
+            message = _receive(stream)
+            if message is None or message.get("type") != "job":
+                break
+            items = make_payloads(
+                Payload(message.get("payload", Payload.small_int.value)), message["size"]
+            )
+            start_time = perf_counter()
+            results = measure_doubling_cell(
+                IMPLEMENTATIONS[message["implementation"]],
+                message["size"],
+                message["operations"],
+                GCMode(message.get("gc_mode", GCMode.enabled.value)),
+                items=items,
+            )
+            _send(
+                stream,
+                {
+                    "type": "result",
+                    "id": message["id"],
+                    "results": results,
+                    "elapsed": perf_counter() - start_time,
+                },
+            )
+            jobs += 1
+    return jobs
+
+
+def spawn_local_workers(count: int, host: str, port: int) -> List[subprocess.Popen]:
+    """Start ``count`` worker processes on this machine."""
+    # Make the package importable no matter where the coordinator was started
+    env = child_env()
+    return [
+        subprocess.Popen(
+            [sys.executable, "-m", "analyze.distributed", f"{host}:{port}", "--name", f"local-{index}"],
+            env=env,
+        )
+        for index in range(count)
+    ]
+
+
+def parse_address(address: str) -> Tuple[str, int]:
+    """Split ``HOST:PORT`` (or just ``PORT`` for localhost)."""
+    host, _, port = address.rpartition(":")
+    return host or "127.0.0.1", int(port)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Doubling experiment worker")
+    parser.add_argument("address", help="Coordinator address as HOST:PORT")
+    parser.add_argument("--name", help="Worker name shown in the coordinator's report")
+    parser.add_argument("--connect-timeout", type=float, default=10.0)
+    args = parser.parse_args(argv)
+    host, port = parse_address(args.address)
+    run_worker(host, port, args.name, args.connect_timeout)
+
+
+if __name__ == "__main__":
+    main()
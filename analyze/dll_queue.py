@@ -1,6 +1,10 @@
 """A basic Doubly Linked List implementation for a Queue."""
 
-from typing import Any, Optional
+import weakref
+from typing import Any, Dict, Iterator, Optional
+
+from analyze.node_pool import NodePool
+from analyze.serialization import decode_items, encode_items
 
 class Node:
     """Represents a node in a doubly linked list."""
@@ -10,14 +14,83 @@ class Node:
         self.next: Optional['Node'] = None
 
 class BasicDLLQueue:
-    """A Doubly Linked List implementation of a Queue (FIFO)."""
-    def __init__(self):
+    """A Doubly Linked List implementation of a Queue (FIFO).
+
+    The ``prev`` links also make it usable as a deque: ``push_front``,
+    ``pop_back`` and ``peek_back`` work on the other end, and ``splice``
+    moves a run of nodes from one queue to another in O(1).
+
+    With ``pool_size`` > 0 dequeued nodes are recycled through a bounded free
+    list instead of being reallocated on every enqueue.
+
+    ``snapshot`` returns a copy that shares the nodes. Every queue only looks
+    at its own ``_size`` nodes from ``_head``, so removing from either end
+    just moves that end, and the first sharer to add past a shared end can
+    link there; a later sharer finds that link taken and copies its nodes.
+    """
+    def __init__(self, pool_size: int = 0):
         self._head: Optional[Node] = None
         self._tail: Optional[Node] = None
         self._size: int = 0
+        self._pool: Optional[NodePool] = NodePool(Node, pool_size) if pool_size else None
+        # Queues sharing nodes with this one, or None when it owns them alone
+        self._share: Optional[weakref.WeakSet] = None
+
+    def snapshot(self) -> 'BasicDLLQueue':
+        """Return a copy of the queue that shares its nodes (O(1))."""
+        if self._share is None:
+            self._share = weakref.WeakSet([self])
+        clone = BasicDLLQueue(self._pool.max_size if self._pool is not None else 0)
+        clone._head = self._head
+        clone._tail = self._tail
+        clone._size = self._size
+        clone._share = self._share
+        self._share.add(clone)
+        return clone
+
+    def _shared(self) -> bool:
+        """Check whether another live queue still shares nodes with this one."""
+        if self._share is not None and len(self._share) < 2:
+            self._share = None
+        return self._share is not None
+
+    def _unshare(self) -> None:
+        """Copy this queue's nodes so it no longer shares any (O(n))."""
+        node = self._head
+        size = self._size
+        self._share.discard(self)
+        self._share = None
+        self._head = None
+        self._tail = None
+        self._size = 0
+        for _ in range(size):
+            self.enqueue(node.data)
+            node = node.next
+
+    def unshare(self) -> None:
+        """Take private copies of any nodes shared with a snapshot now (O(n) if shared, else O(1)).
+
+        Later operations then take the unshared paths, which clear links and
+        recycle nodes, instead of copying on the first conflicting write.
+        """
+        if self._share is not None and self._shared():
+            self._unshare()
+
+    def _claim_tail(self) -> None:
+        """Copy the nodes first if another sharer already linked past our tail."""
+        if self._share is not None and self._tail is not None and self._tail.next is not None:
+            if self._shared():
+                self._unshare()
+
+    def _claim_head(self) -> None:
+        """Copy the nodes first if another sharer already linked before our head."""
+        if self._share is not None and self._head is not None and self._head.prev is not None:
+            if self._shared():
+                self._unshare()
 
     def enqueue(self, item: Any) -> None:
-        new_node = Node(item)
+        self._claim_tail()
+        new_node = Node(item) if self._pool is None else self._pool.acquire(item)
         if self._tail:
             self._tail.next = new_node
             new_node.prev = self._tail
@@ -29,13 +102,19 @@ class BasicDLLQueue:
     def dequeue(self) -> Any:
         if self.is_empty():
             raise IndexError("Dequeue from empty queue")
-        result = self._head.data
-        self._head = self._head.next
-        if self._head:
-            self._head.prev = None
-        else:
-            self._tail = None
+        node = self._head
+        result = node.data
+        shared = self._shared()
         self._size -= 1
+        if self._size == 0:
+            self._head = None
+            self._tail = None
+        else:
+            self._head = node.next
+            if not shared:
+                self._head.prev = None
+        if self._pool is not None and not shared:
+            self._pool.release(node)
         return result
 
     def peek(self) -> Any:
@@ -43,21 +122,157 @@ class BasicDLLQueue:
             raise IndexError("Peek from empty queue")
         return self._head.data
 
+    def push_front(self, item: Any) -> None:
+        """Add an item at the front of the queue. O(1)."""
+        self._claim_head()
+        new_node = Node(item) if self._pool is None else self._pool.acquire(item)
+        if self._head:
+            self._head.prev = new_node
+            new_node.next = self._head
+        else:
+            self._tail = new_node
+        self._head = new_node
+        self._size += 1
+
+    def pop_back(self) -> Any:
+        """Remove and return the item at the back of the queue. O(1)."""
+        if self.is_empty():
+            raise IndexError("Pop from empty queue")
+        node = self._tail
+        result = node.data
+        shared = self._shared()
+        self._size -= 1
+        if self._size == 0:
+            self._head = None
+            self._tail = None
+        else:
+            self._tail = node.prev
+            if not shared:
+                self._tail.next = None
+        if self._pool is not None and not shared:
+            node.prev = None
+            self._pool.release(node)
+        return result
+
+    def peek_back(self) -> Any:
+        """Return the item at the back of the queue without removing it. O(1)."""
+        if self.is_empty():
+            raise IndexError("Peek from empty queue")
+        return self._tail.data
+
+    def splice(self, other: 'BasicDLLQueue', first: Node, last: Node, count: int) -> None:
+        """Move the nodes ``first`` .. ``last`` of ``other`` to the back of this queue. O(1).
+
+        ``first`` must come before (or be) ``last`` in ``other`` and ``count``
+        must be the number of nodes between them inclusive; neither is checked,
+        since that would need a walk over the range. ``other`` must not share
+        its nodes with a snapshot.
+        """
+        if count <= 0:
+            return
+        if other._share is not None and other._shared():
+            raise ValueError("cannot splice nodes out of a shared queue")
+        self._claim_tail()
+        # Unlink the range from other
+        before = None if first is other._head else first.prev
+        after = None if last is other._tail else last.next
+        if before:
+            before.next = after
+        else:
+            other._head = after
+        if after:
+            after.prev = before
+        else:
+            other._tail = before
+        other._size -= count
+        # Link it in after our tail
+        first.prev = self._tail
+        last.next = None
+        if self._tail:
+            self._tail.next = first
+        else:
+            self._head = first
+        self._tail = last
+        self._size += count
+
+    def split_front(self, count: int) -> 'BasicDLLQueue':
+        """Remove up to ``count`` items from the front and return them as a new queue.
+
+        Finding the end of the range takes O(count); moving it is O(1).
+        """
+        result = BasicDLLQueue(self._pool.max_size if self._pool is not None else 0)
+        count = min(count, self._size)
+        if count > 0:
+            if self._share is not None and self._shared():
+                self._unshare()
+            last = self._head
+            for _ in range(count - 1):
+                last = last.next
+            result.splice(self, self._head, last, count)
+        return result
+
     def is_empty(self) -> bool:
         return self._size == 0
 
     def __len__(self) -> int:
         return self._size
 
+    def pool_stats(self) -> Optional[Dict[str, int]]:
+        """Return the node pool counters, or None when pooling is off."""
+        return None if self._pool is None else self._pool.stats()
+
+    def __iter__(self) -> Iterator[Any]:
+        """Yield the elements from front to back without removing them."""
+        node = self._head
+        for _ in range(self._size):
+            yield node.data
+            node = node.next
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Pickle the elements as a flat list instead of a recursive chain of nodes."""
+        return {"items": list(self), "pool_size": self._pool.max_size if self._pool is not None else 0}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__init__(state["pool_size"])
+        self._extend(state["items"])
+
+    def _extend(self, items) -> None:
+        """Append ``items`` in one pass, linking fresh nodes directly."""
+        self._claim_tail()
+        tail = self._tail
+        count = 0
+        for item in items:
+            node = Node(item)
+            if tail is None:
+                self._head = node
+            else:
+                tail.next = node
+                node.prev = tail
+            tail = node
+            count += 1
+        self._tail = tail
+        self._size += count
+
+    def to_bytes(self) -> bytes:
+        """Encode the elements in the compact format of ``analyze.serialization``."""
+        return encode_items(self)
+
+    @classmethod
+    def from_bytes(cls, data: bytes, pool_size: int = 0) -> 'BasicDLLQueue':
+        """Build a queue from the output of ``to_bytes``."""
+        queue = cls(pool_size)
+        queue._extend(decode_items(data))
+        return queue
+
     def __add__(self, other: 'BasicDLLQueue') -> 'BasicDLLQueue':
         """Creates a new queue by merging two existing queues (O(n))."""
-        new_queue = BasicDLLQueue()
+        new_queue = BasicDLLQueue(self._pool.max_size if self._pool is not None else 0)
         current = self._head
-        while current:
+        for _ in range(self._size):
             new_queue.enqueue(current.data)
             current = current.next
         current_other = other._head
-        while current_other:
+        for _ in range(other._size):
             new_queue.enqueue(current_other.data)
             current_other = current_other.next
         return new_queue
@@ -65,6 +280,10 @@ class BasicDLLQueue:
     def __iadd__(self, other: 'BasicDLLQueue') -> 'BasicDLLQueue':
         """Merges another queue into the current queue in place (O(1))."""
         if other._head:
+            if other._share is not None and other._shared():
+                # Its nodes still belong to other queues too
+                other._unshare()
+            self._claim_tail()
             if not self._head:
                 self._head = other._head
                 self._tail = other._tail
@@ -0,0 +1,206 @@
+"""Checks and stabilization of the machine a benchmark runs on.
+
+Everything here degrades gracefully: on systems without ``/sys`` cpufreq
+entries, CPU affinity or load averages the corresponding fields are None and
+no warning is raised for them.
+"""
+
+import glob
+import math
+import os
+import platform
+import statistics
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+CPU_ROOT = Path("/sys/devices/system/cpu")
+
+# Modified z-score above which a timing counts as an outlier (Iglewicz and Hoaglin)
+OUTLIER_THRESHOLD = 3.5
+# Scales the MAD to the standard deviation of a normal distribution
+MAD_SCALE = 1.4826
+
+
+def _read(path: Path) -> Optional[str]:
+    try:
+        return path.read_text().strip()
+    except OSError:
+        return None
+
+
+def pin_cpu(cpu: Optional[int] = None) -> Optional[int]:
+    """Restrict this process to one CPU and return it, or None when unsupported.
+
+    Without ``cpu`` the highest CPU the process may already use is chosen,
+    which tends to be the one the OS schedules the least on.
+    """
+    if not hasattr(os, "sched_setaffinity"):
+        return None
+    allowed = sorted(os.sched_getaffinity(0))
+    if cpu is None:
+        cpu = allowed[-1]
+    try:
+        os.sched_setaffinity(0, {cpu})
+    except OSError:
+        return None
+    return cpu
+
+
+def frequency_scaling(root: Path = CPU_ROOT) -> Dict[str, Any]:
+    """Return the cpufreq governors, frequency range and turbo state.
+
+    ``turbo`` is True or False when the intel_pstate or cpufreq boost switch
+    is present, otherwise None.
+    """
+    governors = sorted(
+        {_read(Path(path)) for path in glob.glob(str(root / "cpu[0-9]*" / "cpufreq" / "scaling_governor"))}
+        - {None}
+    )
+
+    def mhz(name: str) -> Optional[float]:
+        values = [
+            int(value) / 1000
+            for value in (
+                _read(Path(path))
+                for path in glob.glob(str(root / "cpu[0-9]*" / "cpufreq" / name))
+            )
+            if value and value.isdigit()
+        ]
+        return max(values) if values else None
+
+    turbo = None
+    no_turbo = _read(root / "intel_pstate" / "no_turbo")
+    boost = _read(root / "cpufreq" / "boost")
+    if no_turbo is not None:
+        turbo = no_turbo == "0"
+    elif boost is not None:
+        turbo = boost == "1"
+    return {
+        "governors": governors,
+        "min_mhz": mhz("scaling_min_freq"),
+        "max_mhz": mhz("scaling_max_freq"),
+        "current_mhz": mhz("scaling_cur_freq"),
+        "turbo": turbo,
+    }
+
+
+def load_average() -> Optional[Tuple[float, float, float]]:
+    """Return the 1, 5 and 15 minute load averages, or None when unavailable."""
+    try:
+        return os.getloadavg()
+    except (AttributeError, OSError):
+        return None
+
+
+def check_environment(max_load_per_cpu: float = 0.25) -> Dict[str, Any]:
+    """Describe the machine and list conditions that make timings noisy.
+
+    The result is JSON-serialisable; ``warnings`` holds human-readable
+    problems such as a powersave governor, turbo boost or a busy machine.
+    """
+    cpus = os.cpu_count() or 1
+    affinity = sorted(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else None
+    scaling = frequency_scaling()
+    load = load_average()
+    warnings = []
+    for governor in scaling["governors"]:
+        if governor != "performance":
+            warnings.append(f"CPU frequency governor is '{governor}', not 'performance'")
+    if scaling["turbo"]:
+        warnings.append("Turbo boost is enabled; clock speed depends on temperature and load")
+    if load is not None and load[0] > max_load_per_cpu * cpus:
+        warnings.append(f"Load average {load[0]:.2f} on {cpus} CPUs; other work will disturb timings")
+    return {
+        "platform": platform.platform(),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "cpu_count": cpus,
+        "affinity": affinity,
+        "frequency": scaling,
+        "load_average": list(load) if load is not None else None,
+        "warnings": warnings,
+    }
+
+
+def median_absolute_deviation(values: Sequence[float]) -> float:
+    """Return the median absolute deviation from the median."""
+    center = statistics.median(values)
+    return statistics.median(abs(value - center) for value in values)
+
+
+def reject_outliers(
+    values: Sequence[float], threshold: float = OUTLIER_THRESHOLD
+) -> Tuple[List[float], List[float]]:
+    """Split ``values`` into (kept, rejected) by modified z-score.
+
+    The score is ``0.6745 * |x - median| / MAD``. When more than half of the
+    values are identical the MAD is zero and nothing is rejected.
+    """
+    values = [value for value in values if not math.isnan(value)]
+    if len(values) < 3:
+        return values, []
+    center = statistics.median(values)
+    mad = median_absolute_deviation(values)
+    if mad == 0:
+        return values, []
+    kept, rejected = [], []
+    for value in values:
+        (rejected if 0.6745 * abs(value - center) / mad > threshold else kept).append(value)
+    return kept, rejected
+
+
+def noise_score(values: Sequence[float]) -> float:
+    """Return the robust coefficient of variation, ``1.4826 * MAD / median``."""
+    values = [value for value in values if not math.isnan(value)]
+    if len(values) < 2:
+        return math.nan
+    center = statistics.median(values)
+    if center <= 0:
+        return math.nan
+    return MAD_SCALE * median_absolute_deviation(values) / center
+
+
+def summarize_repeats(values: Sequence[float]) -> Dict[str, Any]:
+    """Reduce repeated timings of one cell to a robust estimate.
+
+    Returns the median of the values left after outlier rejection together
+    with the noise score of all values and the number rejected.
+    """
+    kept, rejected = reject_outliers(values)
+    return {
+        "seconds": statistics.median(kept) if kept else math.nan,
+        "noise": noise_score(values),
+        "repeats": len(values),
+        "rejected": len(rejected),
+    }
+
+
+def warm_up(
+    func: Callable[[], float], window: int = 5, tolerance: float = 0.05, max_runs: int = 50
+) -> Dict[str, Any]:
+    """Run ``func`` until the last ``window`` timings it returns are stable.
+
+    Stable means their noise score is at most ``tolerance``. This gives CPU
+    frequency, caches and the allocator time to settle before measuring.
+    """
+    timings: List[float] = []
+    while len(timings) < max_runs:
+        timings.append(func())
+        if len(timings) >= window and noise_score(timings[-window:]) <= tolerance:
+            return {"runs": len(timings), "stable": True, "timings": timings}
+    return {"runs": len(timings), "stable": False, "timings": timings}
+
+
+def probe_noise(func: Callable[[], float], runs: int = 5) -> float:
+    """Return the noise score of ``runs`` timings returned by ``func``.
+
+    Timing a small fixed probe gives every run a noise score, also when its
+    cells are only timed once and so have no score of their own.
+    """
+    return noise_score([func() for _ in range(runs)])
+
+
+def run_noise_score(cell_scores: Sequence[float]) -> float:
+    """Return the noise score of a whole run: the median over its cells."""
+    scores = [score for score in cell_scores if not math.isnan(score)]
+    return statistics.median(scores) if scores else math.nan
@@ -0,0 +1,78 @@
+"""Garbage collector pause accounting for timed regions."""
+
+import gc
+from enum import Enum
+from time import perf_counter
+from typing import Dict, List, Optional
+
+
+class GCMode(str, Enum):
+    """How the garbage collector behaves during a timed region."""
+
+    enabled = "enabled"
+    disabled = "disabled"
+
+
+class GCMonitor:
+    """Record cyclic garbage collector passes through ``gc.callbacks``.
+
+    Use it as a context manager around the region of interest; every
+    collection that starts and stops inside it is counted per generation
+    together with its pause time.
+    """
+
+    def __init__(self):
+        self.collections: List[int] = [0, 0, 0]
+        self.pauses: List[float] = [0.0, 0.0, 0.0]
+        self._started: Optional[float] = None
+
+    def _callback(self, phase: str, info: Dict) -> None:
+        if phase == "start":
+            self._started = perf_counter()
+        elif phase == "stop" and self._started is not None:
+            generation = info["generation"]
+            self.collections[generation] += 1
+            self.pauses[generation] += perf_counter() - self._started
+            self._started = None
+
+    def reset(self) -> None:
+        """Forget every recorded collection."""
+        self.collections = [0, 0, 0]
+        self.pauses = [0.0, 0.0, 0.0]
+        self._started = None
+
+    def __enter__(self) -> "GCMonitor":
+        gc.callbacks.append(self._callback)
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        gc.callbacks.remove(self._callback)
+        self._started = None
+
+    @property
+    def total_collections(self) -> int:
+        """Return the number of collections across all generations."""
+        return sum(self.collections)
+
+    @property
+    def total_pause(self) -> float:
+        """Return the total pause time in seconds."""
+        return sum(self.pauses)
+
+    def stats(self) -> Dict[str, List]:
+        """Return a copy of the counters for one run."""
+        return {"collections": list(self.collections), "pauses": list(self.pauses)}
+
+
+class gc_disabled:
+    """Context manager that turns the cyclic collector off and restores it."""
+
+    def __enter__(self) -> None:
+        self._was_enabled = gc.isenabled()
+        # Start from a clean heap so garbage from earlier runs is not carried over
+        gc.collect()
+        gc.disable()
+
+    def __exit__(self, *exc_info) -> None:
+        if self._was_enabled:
+            gc.enable()
@@ -0,0 +1,20 @@
+"""Registry of queue implementations by name.
+
+Kept free of CLI dependencies so that worker processes can resolve an
+implementation without importing Typer, Rich or matplotlib.
+"""
+
+from analyze.ArrayQueue import ArrayQueue
+from analyze.dll_queue import BasicDLLQueue
+from analyze.persistent_queue import BankersQueue
+from analyze.sll_queue import BasicSLLQueue
+
+IMPLEMENTATIONS = {
+    "dll": BasicDLLQueue,
+    "sll": BasicSLLQueue,
+    "array": ArrayQueue,
+    "bankers": BankersQueue,
+}
+
+# Measured when no implementations are chosen; the persistent queue is opt-in
+DEFAULT_IMPLEMENTATIONS = ["dll", "sll", "array"]
@@ -0,0 +1,122 @@
+"""Run the doubling cells under several Python interpreters.
+
+Each cell runs through ``analyze.isolation`` in a subprocess of the chosen
+interpreter. The isolation runner, the harness and the queues only need the
+standard library, so any CPython or PyPy from 3.9 on can run them without
+installing this project's dependencies.
+"""
+
+import json
+import os
+import shutil
+import subprocess
+import sys
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from analyze.isolation import child_env, run_isolated
+from analyze.payloads import Payload
+
+MIN_VERSION = (3, 9)
+
+# Names looked up on PATH when no interpreters are given
+CANDIDATES = (
+    ["python3"]
+    + [f"python3.{minor}" for minor in range(MIN_VERSION[1], 16)]
+    + ["pypy3"]
+    + [f"pypy3.{minor}" for minor in range(MIN_VERSION[1], 12)]
+)
+
+_PROBE = (
+    "import json, platform, sys; "
+    "print(json.dumps({'implementation': platform.python_implementation(), "
+    "'version': platform.python_version(), 'version_info': list(sys.version_info[:2])}))"
+)
+
+
+def interpreter_info(executable: str, timeout: float = 30.0) -> Optional[Dict[str, Any]]:
+    """Return the implementation and version of an interpreter.
+
+    Returns None when it cannot be run, is older than 3.9 or cannot import
+    the package.
+    """
+    try:
+        completed = subprocess.run(
+            [executable, "-c", _PROBE + "; import analyze.isolation"],
+            capture_output=True,
+            text=True,
+            env=child_env(),
+            timeout=timeout,
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+    if completed.returncode != 0:
+        return None
+    try:
+        info = json.loads(completed.stdout.splitlines()[0])
+    except (IndexError, ValueError):
+        return None
+    if tuple(info["version_info"]) < MIN_VERSION:
+        return None
+    return {
+        "executable": executable,
+        "implementation": info["implementation"],
+        "version": info["version"],
+        "label": f"{info['implementation']} {info['version']}",
+    }
+
+
+def discover_interpreters(candidates: Sequence[str] = CANDIDATES) -> List[Dict[str, Any]]:
+    """Find usable interpreters on PATH, starting with the current one.
+
+    Interpreters are deduplicated by resolved path and by label, so that
+    ``python3`` and ``python3.11`` pointing at the same build count once.
+    """
+    found = []
+    seen_paths = set()
+    seen_labels = set()
+    for name in [sys.executable, *candidates]:
+        path = shutil.which(name)
+        if path is None or os.path.realpath(path) in seen_paths:
+            continue
+        seen_paths.add(os.path.realpath(path))
+        info = interpreter_info(path)
+        if info is not None and info["label"] not in seen_labels:
+            seen_labels.add(info["label"])
+            found.append(info)
+    return found
+
+
+def run_matrix(
+    interpreters: Sequence[Dict[str, Any]],
+    implementations: Sequence[str],
+    sizes: Sequence[int],
+    operations: Sequence[str],
+    payload: Payload = Payload.small_int,
+    repeats: int = 1,
+    on_cell: Optional[Callable[[str, str, int, Dict[str, float]], None]] = None,
+) -> Dict[Tuple[str, str, int], Dict[str, float]]:
+    """Measure every (interpreter, implementation, size) cell in its own subprocess.
+
+    Returns ``{(label, implementation, size): {operation: seconds}}``. A cell
+    whose subprocess fails, cannot start or prints unreadable output gets NaN
+    for every operation.
+    """
+    results = {}
+    for info in interpreters:
+        for implementation in implementations:
+            for size in sizes:
+                try:
+                    cell = run_isolated(
+                        implementation,
+                        size,
+                        operations,
+                        payload=payload,
+                        repeats=repeats,
+                        executable=info["executable"],
+                    )["results"]
+                except (OSError, RuntimeError, ValueError):
+                    cell = {operation: float("nan") for operation in operations}
+                results[(info["label"], implementation, size)] = cell
+                if on_cell is not None:
+                    on_cell(info["label"], implementation, size, cell)
+    return results
@@ -0,0 +1,156 @@
+"""Measure doubling cells in fresh interpreter processes.
+
+Measuring every implementation in one interpreter lets heap growth and
+allocator state from one cell leak into the next. ``run_isolated`` starts
+``python -m analyze.isolation``, sends it the cell as JSON on stdin and reads
+the timings and the child's resource usage back from stdout.
+
+Resource usage comes from ``resource.getrusage``, which only exists on Unix;
+elsewhere the usage fields are None.
+"""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Dict, Optional, Sequence
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+from analyze.benchmark import measure_doubling_cell
+from analyze.gc_monitor import GCMode
+from analyze.implementations import IMPLEMENTATIONS
+from analyze.payloads import Payload, make_payloads
+
+# ru_maxrss is in kilobytes on Linux and in bytes on macOS
+_MAXRSS_UNIT = 1 if sys.platform == "darwin" else 1024
+
+
+def child_env() -> Dict[str, str]:
+    """Return an environment in which child processes can import this package."""
+    env = dict(os.environ)
+    root = str(Path(__file__).resolve().parent.parent)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [root, env.get("PYTHONPATH")]))
+    return env
+
+
+def peak_rss() -> Optional[int]:
+    """Return this process's peak resident set size in bytes.
+
+    Linux carries ``ru_maxrss`` over from the parent across fork and exec,
+    so a child started by a big parent would report the parent's peak; the
+    ``VmHWM`` line of /proc/self/status is reset by exec and is used instead
+    where it exists.
+    """
+    try:
+        with open("/proc/self/status") as handle:
+            for line in handle:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) * 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    if resource is None:
+        return None
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * _MAXRSS_UNIT
+
+
+def resource_usage(before: Optional[Any] = None, after: Optional[Any] = None) -> Optional[Dict[str, float]]:
+    """Return the process's resource usage, or None without the resource module.
+
+    With ``before`` and ``after`` (``getrusage`` results) the counters are
+    the difference between them. ``max_rss`` is always the peak resident set
+    size of the whole process, in bytes (see ``peak_rss``).
+    """
+    if resource is None:
+        return None
+    after = after or resource.getrusage(resource.RUSAGE_SELF)
+
+    def delta(field: str) -> float:
+        return getattr(after, field) - (getattr(before, field) if before is not None else 0)
+
+    return {
+        "max_rss": peak_rss(),
+        "minor_faults": delta("ru_minflt"),
+        "major_faults": delta("ru_majflt"),
+        "voluntary_switches": delta("ru_nvcsw"),
+        "involuntary_switches": delta("ru_nivcsw"),
+        "user_cpu": delta("ru_utime"),
+        "system_cpu": delta("ru_stime"),
+    }
+
+
+def measure_cell(job: Dict[str, Any]) -> Dict[str, Any]:
+    """Measure one cell in this process and return its timings and resource usage."""
+    size = job["size"]
+    items = make_payloads(Payload(job.get("payload", Payload.small_int.value)), size)
+    gc_stats = {} if job.get("gc_stats") else None
+    noise: Dict[str, Dict] = {}
+    before = resource.getrusage(resource.RUSAGE_SELF) if resource is not None else None
+    start_time = perf_counter()
+    results = measure_doubling_cell(
+        IMPLEMENTATIONS[job["implementation"]],
+        size,
+        job["operations"],
+        GCMode(job.get("gc_mode", GCMode.enabled.value)),
+        gc_stats,
+        repeats=job.get("repeats", 1),
+        noise=noise,
+        items=items,
+    )
+    wall = perf_counter() - start_time
+    usage = resource_usage(before)
+    if usage is not None:
+        usage["wall"] = wall
+    return {"results": results, "gc_stats": gc_stats, "noise": noise, "usage": usage}
+
+
+def run_isolated(
+    implementation: str,
+    size: int,
+    operations: Sequence[str],
+    gc_mode: GCMode = GCMode.enabled,
+    payload: Payload = Payload.small_int,
+    repeats: int = 1,
+    gc_stats: bool = False,
+    timeout: Optional[float] = None,
+    executable: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Measure one cell in a new interpreter, this one unless ``executable`` is given.
+
+    Returns ``{"results", "gc_stats", "noise", "usage"}`` as produced by
+    ``measure_cell`` in the child. Raises RuntimeError if the child fails.
+    """
+    job = {
+        "implementation": implementation,
+        "size": size,
+        "operations": list(operations),
+        "gc_mode": GCMode(gc_mode).value,
+        "payload": Payload(payload).value,
+        "repeats": repeats,
+        "gc_stats": gc_stats,
+    }
+    completed = subprocess.run(
+        [executable or sys.executable, "-m", "analyze.isolation"],
+        input=json.dumps(job),
+        capture_output=True,
+        text=True,
+        env=child_env(),
+        timeout=timeout,
+    )
+    if completed.returncode != 0:
+        error = (completed.stderr.strip().splitlines() or ["no output"])[-1]
+        raise RuntimeError(f"isolated {implementation} n={size} failed: {error}")
+    return json.loads(completed.stdout)
+
+
+def main() -> None:
+    json.dump(measure_cell(json.load(sys.stdin)), sys.stdout)
+
+
+if __name__ == "__main__":
+    main()
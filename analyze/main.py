@@ -6,15 +6,61 @@ from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
 from rich import box
-from time import perf_counter
+from rich.live import Live
+from contextlib import nullcontext
 import os  # noqa: F401
+import json
+import math
+import subprocess
 import matplotlib.pyplot as plt
 import numpy as np
 from pathlib import Path
-
-from analyze.dll_queue import BasicDLLQueue as DLLQueue
-from analyze.sll_queue import BasicSLLQueue as SLLQueue
-from analyze.ArrayQueue import ArrayQueue
+from typing import List, Optional
+
+from analyze.ArrayQueue import ArrayQueue, OverflowPolicy
+from analyze.implementations import IMPLEMENTATIONS
+from analyze.benchmark import (
+    DOUBLING_OPERATIONS,
+    AdaptiveDoubling,
+    TimeBudget,
+    harness_iterations,
+    measure_churn,
+    measure_doubling_cell,
+    measure_enqueue_latencies,
+    measure_interleaved,
+    measure_memory_over_time,
+    measure_payload,
+    measure_ring,
+    measure_serialization,
+    operation_elements,
+    percentile,
+    time_operation,
+)
+from analyze.gc_monitor import GCMode, GCMonitor
+from analyze.results_store import ResultStore
+from analyze.dashboard import DoublingDashboard
+from analyze.cache import ResultCache
+from analyze.timer import HarnessBaseline
+from analyze.environment import check_environment, pin_cpu, probe_noise, run_noise_score, warm_up
+from analyze.work_stealing import run_scheduler, worker_counts
+from analyze.pipeline import parse_stages, run_pipeline
+from analyze.readers import READER_QUEUES, run_readers
+from analyze.stats import compare_samples
+from analyze.report import build_report, write_report_files
+from analyze.workloads import WORKLOADS, measure_workload
+from analyze.payloads import Payload, make_payloads, traced_payloads
+from analyze.isolation import run_isolated
+from analyze.counters import COUNTING_CLASSES, count_doubling_cell
+from analyze.plan import execute_jobs, expand_plan, load_plan, plan_jobs
+from analyze.interpreters import discover_interpreters, interpreter_info, run_matrix
+from analyze.distributed import (
+    Coordinator,
+    host_spread,
+    make_jobs,
+    parse_address,
+    run_worker,
+    spawn_local_workers,
+)
 
 
 class QueueApproach(str, Enum):
@@ -23,15 +69,27 @@ class QueueApproach(str, Enum):
     dll = "dll"
     sll = "sll"
     array = "array"
+    bankers = "bankers"
 
 
-# Map queue implementations to their classes
-QUEUE_IMPLEMENTATIONS = {
-    QueueApproach.dll: DLLQueue,
-    QueueApproach.sll: SLLQueue,
-    QueueApproach.array: ArrayQueue,
+class SerializePayload(str, Enum):
+    """Element types for the serialization benchmark."""
+
+    int = "int"
+    float = "float"
+    str = "str"
+
+
+# Element generators for each serialization payload
+SERIALIZE_PAYLOADS = {
+    SerializePayload.int: lambda i: i,
+    SerializePayload.float: lambda i: i * 0.5,
+    SerializePayload.str: lambda i: f"item-{i}",
 }
 
+# Map queue implementations to their classes
+QUEUE_IMPLEMENTATIONS = {approach: IMPLEMENTATIONS[approach.value] for approach in QueueApproach}
+
 # Create console for rich output
 console = Console()
 
@@ -43,66 +101,220 @@ app = typer.Typer(
 )
 
 
-def time_operation(func):
-    """Time an operation using high-precision counter."""
-    try:
-        # Warm up
-        func()
+def print_counter_table(title, rows):
+    """Display the internal cost counters of a set of operations.
 
-        # Actual timing
-        start_time = perf_counter()
-        func()
-        elapsed = perf_counter() - start_time
-        return elapsed
-    except Exception:
-        return float("nan")
+    Each row is ``(label, elements, record)`` where ``record`` comes from
+    ``count_doubling_cell``. Copies per element is the amortized copying
+    cost of the operation.
+    """
+    table = Table(
+        title=title,
+        box=box.ROUNDED,
+        show_header=True,
+        header_style="bold magenta",
+    )
+    table.add_column("Run", style="cyan", no_wrap=True)
+    table.add_column("Resizes", justify="right")
+    table.add_column("Copied", justify="right")
+    table.add_column("Copies/Elem", justify="right")
+    table.add_column("Copied (KB)", justify="right")
+    table.add_column("Nodes New", justify="right")
+    table.add_column("Nodes Reused", justify="right")
+    table.add_column("Node (KB)", justify="right")
+    table.add_column("Wasted Slots", justify="right")
+
+    for label, elements, record in rows:
+        table.add_row(
+            label,
+            f"{record['resizes']:,}",
+            f"{record['elements_copied']:,}",
+            f"{record['elements_copied'] / elements:.2f}" if elements > 0 else "-",
+            f"{record['bytes_copied'] / 1e3:,.1f}",
+            f"{record['nodes_allocated']:,}",
+            f"{record['nodes_reused']:,}",
+            f"{record['node_bytes'] / 1e3:,.1f}",
+            f"{record['wasted']:,}",
+        )
 
+    console.print(Panel(table))
 
-def analyze_queue(queue_class, size=1000):
-    """Analyze a queue implementation."""
-    approach = next(
-        (k for k, v in QUEUE_IMPLEMENTATIONS.items() if v == queue_class), None
+
+def print_usage_table(title, rows):
+    """Display the resource usage of isolated cells.
+
+    Each row is ``(size, usage)`` where ``usage`` comes from
+    ``analyze.isolation.resource_usage`` with the cell's wall time added.
+    """
+    table = Table(
+        title=title,
+        box=box.ROUNDED,
+        show_header=True,
+        header_style="bold magenta",
     )
-    if approach is None:
-        console.print("[red]Unknown queue implementation[/red]")
-        return
+    table.add_column("Size (n)", style="cyan", justify="right")
+    table.add_column("Peak RSS (MB)", justify="right")
+    table.add_column("Minor Flt", justify="right")
+    table.add_column("Major Flt", justify="right")
+    table.add_column("Vol. CS", justify="right")
+    table.add_column("Invol. CS", justify="right")
+    table.add_column("CPU (ms)", justify="right")
+    table.add_column("Wall (ms)", justify="right")
+    table.add_column("CPU/Wall", justify="right")
+
+    for size, usage in rows:
+        cpu = usage["user_cpu"] + usage["system_cpu"]
+        table.add_row(
+            f"{size:,}",
+            f"{usage['max_rss'] / 1e6:.1f}",
+            f"{usage['minor_faults']:,}",
+            f"{usage['major_faults']:,}",
+            f"{usage['voluntary_switches']:,}",
+            f"{usage['involuntary_switches']:,}",
+            f"{cpu * 1000:.1f}",
+            f"{usage['wall'] * 1000:.1f}",
+            f"{cpu / usage['wall']:.2f}" if usage["wall"] > 0 else "-",
+        )
 
-    console.print(f"\n{approach.value.upper()} Queue Implementation")
+    console.print(Panel(table))
 
-    try:
-        queue = queue_class()
-        operations = []
 
-        # Test enqueue
-        enqueue_time = time_operation(lambda: [queue.enqueue(i) for i in range(size)])
-        operations.append(("enqueue", enqueue_time, size))
+def print_gc_table(title, rows):
+    """Display garbage collector activity for a set of timed runs.
 
-        # Test dequeue
-        dequeue_count = size // 2
-        dequeue_time = time_operation(
-            lambda: [queue.dequeue() for _ in range(dequeue_count)]
+    Each row is ``(label, elapsed_seconds, stats)`` where ``stats`` comes from
+    ``GCMonitor.stats()``.
+    """
+    table = Table(
+        title=title,
+        box=box.ROUNDED,
+        show_header=True,
+        header_style="bold magenta",
+    )
+    table.add_column("Run", style="cyan", no_wrap=True)
+    table.add_column("Time (ms)", justify="right")
+    table.add_column("Gen 0", justify="right")
+    table.add_column("Gen 1", justify="right")
+    table.add_column("Gen 2", justify="right")
+    table.add_column("GC Pause (ms)", justify="right")
+    table.add_column("GC Share", justify="right")
+
+    for label, elapsed, stats in rows:
+        pause = sum(stats["pauses"])
+        share = pause / elapsed if elapsed > 0 else 0
+        table.add_row(
+            label,
+            f"{elapsed * 1000:.5f}",
+            *[f"{count:,}" for count in stats["collections"]],
+            f"{pause * 1000:.5f}",
+            f"{share:.1%}",
         )
-        operations.append(("dequeue", dequeue_time, dequeue_count))
 
-        # Refill queue
-        for i in range(dequeue_count):
-            queue.enqueue(i)
+    console.print(Panel(table))
+
+
+def open_cache(enabled, max_age_days, max_size_mb):
+    """Return the result cache after evicting stale entries, or None when disabled."""
+    if not enabled:
+        return None
+    cache = ResultCache()
+    cache.evict(max_age=max_age_days * 86400, max_bytes=int(max_size_mb * 1e6))
+    return cache
+
+
+def print_baseline(baseline):
+    """Show the calibrated harness costs that net times subtract."""
+    console.print(
+        f"[dim]Harness baseline: clock resolution {baseline.resolution() * 1e9:.0f} ns, "
+        f"empty call {baseline.call() * 1e9:.0f} ns, "
+        f"loop {baseline.loop(100000) / 100000 * 1e9:.1f} ns per element[/dim]"
+    )
 
-        # Test peek
-        peek_count = size // 3
-        peek_time = time_operation(lambda: [queue.peek() for _ in range(peek_count)])
-        operations.append(("peek", peek_time, peek_count))
+def analyze_queue(
+    queue_class,
+    size=1000,
+    gc_mode=GCMode.enabled,
+    gc_stats=False,
+    cache=None,
+    baseline=None,
+    payload=Payload.small_int,
+    counters=False,
+):
+    """Analyze a queue implementation.
 
-        # Test concat
-        other = queue_class()
-        for i in range(size // 10):
-            other.enqueue(i)
-        concat_time = time_operation(lambda: queue + other)
-        operations.append(("concat", concat_time, size // 10))
+    Net times subtract the calibrated cost of the harness loop (see
+    ``HarnessBaseline``) from the raw times. The ``payload`` elements are
+    generated before any timing starts. With ``counters`` the operations are
+    replayed untimed with the counting classes and their costs shown too.
+    """
+    approach = next(
+        (k for k, v in QUEUE_IMPLEMENTATIONS.items() if v == queue_class), None
+    )
+    if approach is None:
+        console.print("[red]Unknown queue implementation[/red]")
+        return
 
-        # Test iconcat
-        iconcat_time = time_operation(lambda: queue.__iadd__(other))
-        operations.append(("iconcat", iconcat_time, size // 10))
+    console.print(f"\n{approach.value.upper()} Queue Implementation")
+
+    try:
+        key = None
+        cached = None
+        if cache is not None:
+            key = cache.key(
+                queue_class,
+                {
+                    "command": "analyze",
+                    "size": size,
+                    "gc_mode": gc_mode.value,
+                    "gc_stats": gc_stats,
+                    "payload": payload.value,
+                },
+            )
+            cached = cache.get(key)
+
+        if cached is not None:
+            console.print("[dim]Using cached results[/dim]")
+            operations = [tuple(row) for row in cached["operations"]]
+            gc_rows = [tuple(row) for row in cached["gc_rows"]]
+        else:
+            values = make_payloads(payload, size)
+            queue = queue_class()
+            operations = []
+            monitor = GCMonitor() if gc_stats else None
+            gc_rows = []
+
+            def timed(name, func, elements):
+                elapsed = time_operation(func, gc_mode, monitor)
+                operations.append((name, elapsed, elements))
+                if monitor is not None:
+                    gc_rows.append((name, elapsed, monitor.stats()))
+
+            # Test enqueue
+            timed("enqueue", lambda: [queue.enqueue(item) for item in values], size)
+
+            # Test dequeue
+            dequeue_count = size // 2
+            timed("dequeue", lambda: [queue.dequeue() for _ in range(dequeue_count)], dequeue_count)
+
+            # Refill queue
+            for i in range(dequeue_count):
+                queue.enqueue(values[i])
+
+            # Test peek
+            peek_count = size // 3
+            timed("peek", lambda: [queue.peek() for _ in range(peek_count)], peek_count)
+
+            # Test concat
+            other = queue_class()
+            for i in range(size // 10):
+                other.enqueue(values[i])
+            timed("concat", lambda: queue + other, size // 10)
+
+            # Test iconcat
+            timed("iconcat", lambda: queue.__iadd__(other), size // 10)
+
+            if cache is not None:
+                cache.put(key, {"operations": operations, "gc_rows": gc_rows})
 
         # Display results in table
         table = Table(
@@ -115,18 +327,38 @@ def analyze_queue(queue_class, size=1000):
         table.add_column("Time (ms)", justify="right")
         table.add_column("Elements", justify="right")
         table.add_column("Time/Element (ms)", justify="right")
+        table.add_column("Net Time/Element (ms)", justify="right")
+        table.add_column("Harness Share", justify="right")
 
+        baseline = baseline or HarnessBaseline()
         for operation, time_taken, elements in operations:
             time_per_element = time_taken / elements if elements > 0 else 0
+            net = baseline.net(time_taken, harness_iterations(operation, size))
+            net_per_element = net / elements if elements > 0 else 0
+            share = 1 - net / time_taken if time_taken > 0 else 0
             table.add_row(
                 operation,
                 f"{time_taken * 1000:.6f}",  # Convert to milliseconds
                 f"{elements:,}",
                 f"{time_per_element * 1000:.6f}",  # Convert to milliseconds
+                f"{net_per_element * 1000:.6f}",
+                f"{share:.1%}",
             )
 
         console.print(Panel(table))
 
+        if gc_rows:
+            print_gc_table(f"{approach.value.upper()} Queue GC Activity", gc_rows)
+
+        if counters and queue_class not in COUNTING_CLASSES:
+            console.print(f"[dim]No cost counters for {approach.value}[/dim]")
+        elif counters:
+            records = count_doubling_cell(queue_class, size)
+            print_counter_table(
+                f"{approach.value.upper()} Queue Cost Counters",
+                [(operation, operation_elements(operation, size), records[operation]) for operation in records],
+            )
+
     except Exception as e:
         console.print(f"[red]Error testing {approach.value}: {str(e)}[/red]")
         import traceback
@@ -140,15 +372,338 @@ def analyze(
     dll: bool = typer.Option(True, help="Test DLL implementation"),
     sll: bool = typer.Option(True, help="Test SLL implementation"),
     array: bool = typer.Option(True, help="Test Array implementation"),
+    bankers: bool = typer.Option(False, help="Test persistent banker's queue implementation"),
+    gc_mode: GCMode = typer.Option(
+        GCMode.enabled, "--gc", help="Garbage collector state during timed runs"
+    ),
+    gc_stats: bool = typer.Option(False, help="Report garbage collector pauses"),
+    cache: bool = typer.Option(True, help="Reuse results of unchanged implementations"),
+    cache_max_age: float = typer.Option(30.0, help="Evict cached results older than this many days"),
+    cache_max_size: float = typer.Option(50.0, help="Evict oldest cached results above this many MB"),
+    payload: Payload = typer.Option(Payload.small_int, help="Type of the enqueued elements"),
+    counters: bool = typer.Option(False, help="Report resizes, copies and node allocations"),
 ):
     """Run basic performance analysis on queue implementations."""
+    result_cache = open_cache(cache, cache_max_age, cache_max_size)
+    baseline = HarnessBaseline()
+    print_baseline(baseline)
     for approach, queue_class in QUEUE_IMPLEMENTATIONS.items():
         if (
             (approach == QueueApproach.dll and dll)
             or (approach == QueueApproach.sll and sll)
             or (approach == QueueApproach.array and array)
+            or (approach == QueueApproach.bankers and bankers)
         ):
-            analyze_queue(queue_class, size)
+            analyze_queue(
+                queue_class, size, gc_mode, gc_stats, result_cache, baseline, payload, counters
+            )
+
+
+@app.command()
+def compare(
+    size: int = typer.Option(10000, help="Size of queue for testing"),
+    repeats: int = typer.Option(20, min=5, help="Interleaved rounds; every round times each implementation once"),
+    operation: Optional[List[str]] = typer.Option(
+        None, help=f"Operations to compare (default all): {', '.join(DOUBLING_OPERATIONS)}"
+    ),
+    dll: bool = typer.Option(True, help="Test DLL implementation"),
+    sll: bool = typer.Option(True, help="Test SLL implementation"),
+    array: bool = typer.Option(True, help="Test Array implementation"),
+    bankers: bool = typer.Option(False, help="Test persistent banker's queue implementation"),
+    gc_mode: GCMode = typer.Option(
+        GCMode.enabled, "--gc", help="Garbage collector state during timed runs"
+    ),
+    payload: Payload = typer.Option(Payload.small_int, help="Type of the enqueued elements"),
+    alpha: float = typer.Option(0.05, min=0.0, max=1.0, help="Significance level after Holm adjustment"),
+    confidence: float = typer.Option(0.95, min=0.5, max=0.999, help="Level of the bootstrap intervals"),
+    seed: Optional[int] = typer.Option(None, help="Seed for the run order and the bootstrap"),
+):
+    """Test whether the implementations really differ, with interleaved repeats."""
+    operations = operation or list(DOUBLING_OPERATIONS)
+    unknown = [op for op in operations if op not in DOUBLING_OPERATIONS]
+    if unknown:
+        console.print(f"[red]Unknown operations: {', '.join(unknown)}[/red]")
+        raise typer.Exit(code=1)
+    operations = [op for op in DOUBLING_OPERATIONS if op in operations]
+    selected = {
+        approach.value: queue_class
+        for approach, queue_class in QUEUE_IMPLEMENTATIONS.items()
+        if (approach == QueueApproach.dll and dll)
+        or (approach == QueueApproach.sll and sll)
+        or (approach == QueueApproach.array and array)
+        or (approach == QueueApproach.bankers and bankers)
+    }
+    if len(selected) < 2:
+        console.print("[red]Select at least two implementations to compare[/red]")
+        raise typer.Exit(code=1)
+    results_dir = Path("results")
+    results_dir.mkdir(exist_ok=True)
+
+    items = make_payloads(payload, size)
+    with console.status("Measuring...") as status:
+        samples = measure_interleaved(
+            selected,
+            size,
+            operations,
+            repeats,
+            gc_mode,
+            items,
+            seed,
+            lambda done: status.update(f"Round {done}/{repeats} done"),
+        )
+    comparisons = {
+        op: compare_samples(
+            {name: samples[name][op] for name in selected}, alpha, confidence, seed=seed
+        )
+        for op in operations
+    }
+
+    percent = f"{confidence:.0%}"
+    medians = Table(
+        title=f"Medians of {repeats} Interleaved Rounds, Size {size:,}",
+        box=box.ROUNDED,
+        show_header=True,
+        header_style="bold magenta",
+    )
+    medians.add_column("Operation", style="cyan")
+    medians.add_column("Queue", style="cyan")
+    medians.add_column("Median (ms)", justify="right")
+    medians.add_column(f"{percent} CI (ms)", justify="right")
+    for op in operations:
+        for name, summary in comparisons[op]["summary"].items():
+            medians.add_row(
+                op,
+                name.upper(),
+                f"{summary['median'] * 1000:.4f}",
+                f"{summary['low'] * 1000:.4f} - {summary['high'] * 1000:.4f}",
+            )
+    console.print(Panel(medians))
+
+    differences = Table(
+        title=f"Differences (Mann-Whitney U, Holm-adjusted, alpha {alpha:g})",
+        box=box.ROUNDED,
+        show_header=True,
+        header_style="bold magenta",
+    )
+    differences.add_column("Operation", style="cyan")
+    differences.add_column("A / B", style="cyan", no_wrap=True)
+    differences.add_column("Time Ratio", justify="right")
+    differences.add_column(f"{percent} CI", justify="right")
+    differences.add_column("p", justify="right")
+    differences.add_column("Result")
+    for op in operations:
+        for pair in comparisons[op]["pairs"]:
+            if pair["significant"]:
+                faster = pair["a"] if pair["ratio"] < 1 else pair["b"]
+                result = f"[green]{faster.upper()} faster[/green]"
+            else:
+                result = "[dim]not significant[/dim]"
+            differences.add_row(
+                op,
+                f"{pair['a'].upper()} / {pair['b'].upper()}",
+                f"{pair['ratio']:.3f}",
+                f"{pair['low']:.2f}-{pair['high']:.2f}",
+                f"{pair['p_adjusted']:.4f}",
+                result,
+            )
+    console.print(Panel(differences))
+
+    path = results_dir / "compare.json"
+    with open(path, "w") as handle:
+        json.dump(
+            {
+                "size": size,
+                "repeats": repeats,
+                "gc_mode": gc_mode.value,
+                "payload": payload.value,
+                "alpha": alpha,
+                "confidence": confidence,
+                "samples": samples,
+                "comparisons": comparisons,
+            },
+            handle,
+            indent=2,
+        )
+    console.print(f"[green]Samples and comparisons saved to [bold]{path}[/bold][/green]")
+
+
+def run_coordinator(
+    implementations,
+    sizes,
+    completed,
+    gc_mode,
+    bind,
+    port,
+    local_workers,
+    store,
+    dashboard,
+    payload=Payload.small_int,
+):
+    """Measure doubling cells on TCP workers and report how each worker did.
+
+    Returns ``{(implementation, size): {operation: seconds}}`` including the
+    ``completed`` cells of a resumed run.
+    """
+    cells = {}
+    results = {}
+    for implementation in implementations:
+        for size in sizes:
+            missing = []
+            for operation in DOUBLING_OPERATIONS:
+                key = (implementation, size, operation)
+                if key in completed:
+                    results.setdefault((implementation, size), {})[operation] = completed[key]
+                    dashboard.record(implementation, size, operation, completed[key])
+                else:
+                    missing.append(operation)
+            if missing:
+                cells[(implementation, size)] = missing
+
+    def on_result(worker, implementation, size, operation, seconds):
+        store.append(implementation, size, operation, seconds, worker=worker)
+        dashboard.start_cell(implementation, size)
+        dashboard.record(implementation, size, operation, seconds)
+
+    coordinator = Coordinator(make_jobs(cells, gc_mode, payload), bind, port, gc_mode, on_result)
+    processes = []
+    with coordinator:
+        host, port = coordinator.address
+        console.print(
+            f"Coordinator listening on [bold]{host}:{port}[/bold] with "
+            f"{coordinator.remaining} jobs; start workers with "
+            f"[bold]analyze worker <this-host>:{port}[/bold]"
+        )
+        if local_workers:
+            processes = spawn_local_workers(
+                local_workers, "127.0.0.1" if host == "0.0.0.0" else host, port
+            )
+        coordinator.wait()
+    for process in processes:
+        try:
+            process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            process.kill()
+
+    for key, cell in coordinator.results.items():
+        results.setdefault(key, {}).update(cell)
+    if coordinator.failed:
+        console.print(
+            f"[yellow]{len(coordinator.failed)} cells lost {coordinator.max_attempts} workers "
+            "and were recorded as failed[/yellow]"
+        )
+    print_worker_table(coordinator.workers)
+    return results
+
+
+def print_worker_table(workers):
+    """Display per-worker throughput and how calibration times vary across hosts."""
+    table = Table(
+        title="Distributed Workers",
+        box=box.ROUNDED,
+        show_header=True,
+        header_style="bold magenta",
+    )
+    table.add_column("Worker", style="cyan")
+    table.add_column("Host")
+    table.add_column("Python")
+    table.add_column("Jobs", justify="right")
+    table.add_column("Busy (s)", justify="right")
+    table.add_column("Elements/sec", justify="right")
+    table.add_column("Calibration (ms)", justify="right")
+    table.add_column("Relative Speed", justify="right")
+
+    calibrations = [w["calibration"] for w in workers.values() if not math.isnan(w["calibration"])]
+    fastest = min(calibrations) if calibrations else math.nan
+    for name, stats in sorted(workers.items()):
+        busy = stats["busy"]
+        table.add_row(
+            name,
+            stats["host"],
+            stats["python"],
+            f"{stats['jobs']:,}",
+            f"{busy:.3f}",
+            f"{stats['elements'] / busy:,.0f}" if busy > 0 else "-",
+            f"{stats['calibration'] * 1000:.3f}",
+            f"{fastest / stats['calibration']:.2f}" if stats["calibration"] > 0 else "-",
+        )
+    console.print(Panel(table))
+
+    summary, cv = host_spread(workers)
+    host_table = Table(
+        title="Calibration by Host",
+        box=box.ROUNDED,
+        show_header=True,
+        header_style="bold magenta",
+    )
+    host_table.add_column("Host", style="cyan")
+    host_table.add_column("Workers", justify="right")
+    host_table.add_column("Mean (ms)", justify="right")
+    host_table.add_column("Std Dev (ms)", justify="right")
+    for host, (count, mean, stdev) in sorted(summary.items()):
+        host_table.add_row(host, str(count), f"{mean * 1000:.3f}", f"{stdev * 1000:.3f}")
+    console.print(Panel(host_table))
+    if not math.isnan(cv):
+        console.print(f"Variation of calibration time across hosts: [bold]{cv:.1%}[/bold]")
+
+def print_doubling_table(name, sizes, results):
+    """Display one implementation's doubling results."""
+    table = Table(
+        title=f"{name.upper()} Queue Doubling Experiment Results",
+        box=box.ROUNDED,
+        show_header=True,
+        header_style="bold magenta",
+        width=73  # Adjusted width to fit operations
+    )
+    table.add_column("Size (n)", justify="right", width=10)
+    table.add_column("enqueue (ms)", justify="right", width=12)
+    table.add_column("dequeue (ms)", justify="right", width=12)
+    table.add_column("peek (ms)", justify="right", width=12)
+    table.add_column("concat (ms)", justify="right", width=12)
+    table.add_column("iconcat (ms)", justify="right", width=12)
+
+    for i, size in enumerate(sizes):
+        row = [f"{size:,}"]
+        for operation in results.keys():
+            value = results[operation][i]
+            if np.isnan(value):
+                row.append("N/A")
+            else:
+                row.append(f"{value * 1000:.5f}")
+        table.add_row(*row)
+
+    console.print(Panel(table))
+
+
+def print_per_element_table(name, sizes, results, baseline):
+    """Display raw and net (harness overhead removed) time per element in nanoseconds."""
+    table = Table(
+        title=f"{name.upper()} Time per Element (ns)",
+        box=box.ROUNDED,
+        show_header=True,
+        header_style="bold magenta",
+    )
+    table.add_column("Size (n)", justify="right")
+    table.add_column("Time", style="cyan")
+    for operation in results:
+        table.add_column(operation, justify="right")
+
+    for i, size in enumerate(sizes):
+        raw_row = [f"{size:,}", "raw"]
+        net_row = ["", "net"]
+        for operation, values in results.items():
+            value = values[i]
+            elements = operation_elements(operation, size)
+            if np.isnan(value) or elements == 0:
+                raw_row.append("N/A")
+                net_row.append("N/A")
+                continue
+            net = baseline.net(value, harness_iterations(operation, size))
+            raw_row.append(f"{value / elements * 1e9:,.1f}")
+            net_row.append(f"{net / elements * 1e9:,.1f}")
+        table.add_row(*raw_row)
+        table.add_row(*net_row, end_section=True)
+
+    console.print(Panel(table))
 
 
 @app.command()
@@ -158,139 +713,1197 @@ def doubling(
     dll: bool = typer.Option(True, help="Test DLL implementation"),
     sll: bool = typer.Option(True, help="Test SLL implementation"),
     array: bool = typer.Option(True, help="Test Array implementation"),
+    bankers: bool = typer.Option(False, help="Test persistent banker's queue implementation"),
+    time_budget: Optional[float] = typer.Option(
+        None, help="Total time budget in seconds; enables adaptive doubling"
+    ),
+    cell_budget: Optional[float] = typer.Option(
+        None, help="Time budget in seconds for one operation at one size"
+    ),
+    gc_mode: GCMode = typer.Option(
+        GCMode.enabled, "--gc", help="Garbage collector state during timed runs"
+    ),
+    gc_stats: bool = typer.Option(False, help="Report garbage collector pauses"),
+    live: bool = typer.Option(False, help="Show a live progress dashboard"),
+    resume: Optional[str] = typer.Option(
+        None, help="Run id of an interrupted run to continue with its saved parameters"
+    ),
+    cache: bool = typer.Option(True, help="Reuse results of unchanged implementations"),
+    cache_max_age: float = typer.Option(30.0, help="Evict cached results older than this many days"),
+    cache_max_size: float = typer.Option(50.0, help="Evict oldest cached results above this many MB"),
+    distribute: Optional[int] = typer.Option(
+        None, help="Hand cells to TCP workers on this port (0 picks a free port)"
+    ),
+    bind: str = typer.Option("127.0.0.1", help="Address the coordinator listens on"),
+    local_workers: int = typer.Option(0, help="Worker processes to start on this machine"),
+    repeats: int = typer.Option(
+        1, min=1, help="Time every cell this many times and keep the median without outliers"
+    ),
+    stabilize: bool = typer.Option(
+        False, help="Pin to one CPU and warm up until timings are stable before measuring"
+    ),
+    payload: Payload = typer.Option(Payload.small_int, help="Type of the enqueued elements"),
+    isolate: bool = typer.Option(
+        False, help="Measure every (implementation, size) cell in a fresh subprocess"
+    ),
+    counters: bool = typer.Option(False, help="Report resizes, copies and node allocations"),
 ):
     """Run doubling experiment on queue implementations."""
     # Create results directory if it doesn't exist
     results_dir = Path("results")
     results_dir.mkdir(exist_ok=True)
 
+    # A resumed run reuses its own stored cells instead of the cache, and
+    # cells measured on other hosts must not be cached as this machine's
+    result_cache = open_cache(
+        cache and resume is None and distribute is None, cache_max_age, cache_max_size
+    )
+
+    # Cells already measured by the run being resumed
+    completed = {}
+    if resume is not None:
+        if not ResultStore.exists(results_dir, resume):
+            console.print(f"[red]No stored run with id {resume}[/red]")
+            raise typer.Exit(code=1)
+        store = ResultStore(results_dir, resume)
+        metadata = store.read_metadata()
+        initial_size = metadata["initial_size"]
+        max_size = metadata["max_size"]
+        dll, sll, array, bankers = (
+            approach.value in metadata["implementations"]
+            for approach in (QueueApproach.dll, QueueApproach.sll, QueueApproach.array, QueueApproach.bankers)
+        )
+        time_budget = metadata["time_budget"]
+        cell_budget = metadata["cell_budget"]
+        gc_mode = GCMode(metadata["gc_mode"])
+        repeats = metadata.get("repeats", 1)
+        isolate = metadata.get("isolate", False)
+        payload = Payload(metadata.get("payload", Payload.small_int.value))
+        completed = store.completed_cells()
+        console.print(f"Resuming run [bold]{resume}[/bold]: {len(completed)} cells already measured")
+
     sizes = []
     current_size = initial_size
     while current_size <= max_size:
         sizes.append(current_size)
         current_size *= 2
 
+    selected = [
+        (approach, queue_class)
+        for approach, queue_class in QUEUE_IMPLEMENTATIONS.items()
+        if (approach == QueueApproach.dll and dll)
+        or (approach == QueueApproach.sll and sll)
+        or (approach == QueueApproach.array and array)
+        or (approach == QueueApproach.bankers and bankers)
+    ]
+    adaptive = time_budget is not None or cell_budget is not None
+    budget = TimeBudget(total=time_budget, per_cell=cell_budget)
+    if distribute is not None and adaptive:
+        console.print("[red]Adaptive doubling picks sizes one at a time and cannot be distributed[/red]")
+        raise typer.Exit(code=1)
+    if distribute is not None and gc_stats:
+        console.print("[yellow]GC statistics are not collected by workers[/yellow]")
+        gc_stats = False
+    if distribute is not None and isolate:
+        console.print("[red]Distributed workers already measure in separate processes; drop --isolate[/red]")
+        raise typer.Exit(code=1)
+    if distribute is not None and repeats > 1:
+        console.print("[yellow]Workers time every cell once; --repeats is ignored[/yellow]")
+        repeats = 1
+
+    # Every measured cell is flushed to disk as soon as it completes
+    if resume is None:
+        store = ResultStore(results_dir)
+        store.write_metadata(
+            {
+                "initial_size": initial_size,
+                "max_size": max_size,
+                "implementations": [approach.value for approach, _ in selected],
+                "time_budget": time_budget,
+                "cell_budget": cell_budget,
+                "gc_mode": gc_mode.value,
+                "repeats": repeats,
+                "payload": payload.value,
+                "isolate": isolate,
+            }
+        )
+    console.print(f"Run [bold]{store.run_id}[/bold], results in {store.path}")
+
+    environment = check_environment()
+    for warning in environment["warnings"]:
+        console.print(f"[yellow]{warning}[/yellow]")
+    def probe():
+        return measure_doubling_cell(QUEUE_IMPLEMENTATIONS[QueueApproach.sll], 20000, ["enqueue"])["enqueue"]
+
+    if stabilize:
+        environment["pinned_cpu"] = pin_cpu()
+        if environment["pinned_cpu"] is not None:
+            console.print(f"Pinned to CPU {environment['pinned_cpu']}")
+        warm = warm_up(probe)
+        environment["warm_up"] = {"runs": warm["runs"], "stable": warm["stable"]}
+        if not warm["stable"]:
+            console.print(f"[yellow]Timings still unstable after {warm['runs']} warm-up runs[/yellow]")
+    # Every run gets a noise score from the probe, whatever --repeats is
+    environment["probe_noise"] = probe_noise(probe)
+    store.write_environment(environment)
+
+    baseline = HarnessBaseline()
+    print_baseline(baseline)
+
+    dashboard = DoublingDashboard(
+        [approach.value for approach, _ in selected],
+        sizes,
+        DOUBLING_OPERATIONS,
+        budget=budget if adaptive else None,
+    )
+
     # Dictionary to store all results for plotting
     all_results = {}
+    # Sizes measured per implementation (they differ in adaptive mode)
+    all_sizes = {}
+
+    with Live(dashboard, console=console, refresh_per_second=4) if live else nullcontext():
+        # Cells measured by TCP workers, looked up by measure() below
+        distributed = None
+        if distribute is not None:
+            distributed = run_coordinator(
+                [approach.value for approach, _ in selected],
+                sizes,
+                completed,
+                gc_mode,
+                bind,
+                distribute,
+                local_workers,
+                store,
+                dashboard,
+                payload,
+            )
+
+        for index, (approach, queue_class) in enumerate(selected):
+            try:
+                console.print(f"\n{approach.value.upper()} Queue Implementation")
+                # GC counters per size and operation, filled when --gc-stats is set
+                gc_records = {}
+                # Resource usage of the subprocess per size, filled when --isolate is set
+                usage_records = {}
+
+                def measure(n, ops=DOUBLING_OPERATIONS):
+                    if distributed is not None:
+                        cell = distributed.get((approach.value, n), {})
+                        return {operation: cell.get(operation, math.nan) for operation in ops}
+                    dashboard.start_cell(approach.value, n)
+                    dashboard.skip(n, len(DOUBLING_OPERATIONS) - len(ops))
+                    # Repeat statistics per operation, filled when --repeats > 1
+                    noise = {}
+
+                    def on_result(operation, seconds):
+                        summary = noise.get(operation, {})
+                        extra = {k: summary[k] for k in ("noise", "repeats", "rejected") if k in summary}
+                        if n in usage_records:
+                            extra["usage"] = usage_records[n]
+                        store.append(approach.value, n, operation, seconds, **extra)
+                        dashboard.record(approach.value, n, operation, seconds)
+
+                    # Reuse cells persisted by the run being resumed
+                    cell = {}
+                    for operation in ops:
+                        key = (approach.value, n, operation)
+                        if key in completed:
+                            cell[operation] = completed[key]
+                            dashboard.record(approach.value, n, operation, completed[key])
+                    missing = [operation for operation in ops if operation not in cell]
+                    if missing and isolate:
+                        child = run_isolated(
+                            approach.value, n, missing, gc_mode, payload, repeats, gc_stats
+                        )
+                        noise.update(child["noise"])
+                        if child["gc_stats"] is not None:
+                            gc_records.setdefault(n, {}).update(child["gc_stats"])
+                        if child["usage"] is not None:
+                            usage_records[n] = child["usage"]
+                        for operation in missing:
+                            on_result(operation, child["results"][operation])
+                        cell.update(child["results"])
+                    elif missing:
+                        cell.update(
+                            measure_doubling_cell(
+                                queue_class,
+                                n,
+                                missing,
+                                gc_mode,
+                                gc_records.setdefault(n, {}) if gc_stats else None,
+                                on_result,
+                                repeats,
+                                noise,
+                                make_payloads(payload, n),
+                            )
+                        )
+                    return cell
+
+                key = None
+                cached = None
+                if result_cache is not None:
+                    key = result_cache.key(
+                        queue_class,
+                        {
+                            "command": "doubling",
+                            "initial_size": initial_size,
+                            "max_size": max_size,
+                            "time_budget": time_budget,
+                            "cell_budget": cell_budget,
+                            "gc_mode": gc_mode.value,
+                            "gc_stats": gc_stats,
+                            "repeats": repeats,
+                            "payload": payload.value,
+                            "isolate": isolate,
+                        },
+                    )
+                    cached = result_cache.get(key)
+
+                if cached is not None:
+                    console.print("[dim]Using cached results[/dim]")
+                    impl_sizes = cached["sizes"]
+                    results = cached["results"]
+                    for size, operation, stats in cached["gc"]:
+                        gc_records.setdefault(size, {})[operation] = stats
+                    for i, size in enumerate(impl_sizes):
+                        dashboard.start_cell(approach.value, size)
+                        for operation in DOUBLING_OPERATIONS:
+                            seconds = results[operation][i]
+                            store.append(approach.value, size, operation, seconds, cached=True)
+                            dashboard.record(approach.value, size, operation, seconds)
+                elif adaptive:
+                    experiment = AdaptiveDoubling(
+                        measure,
+                        budget.share(len(selected) - index),
+                    )
+                    impl_sizes = experiment.run(initial_size, max_size)
+                    results = experiment.results(impl_sizes)
+                    for operation, size in experiment.stopped.items():
+                        console.print(
+                            f"[yellow]{operation}: stopped before n={size:,} "
+                            f"(budget)[/yellow]"
+                        )
+                else:
+                    impl_sizes = sizes
+                    results = {operation: [] for operation in DOUBLING_OPERATIONS}
+                    for size in sizes:
+                        cell = measure(size)
+                        for operation in DOUBLING_OPERATIONS:
+                            results[operation].append(cell[operation])
+
+                if result_cache is not None and cached is None:
+                    result_cache.put(
+                        key,
+                        {
+                            "sizes": impl_sizes,
+                            "results": results,
+                            "gc": [
+                                [size, operation, stats]
+                                for size, operations in gc_records.items()
+                                for operation, stats in operations.items()
+                            ],
+                        },
+                    )
+
+                # Store results for plotting
+                all_results[approach.value] = results
+                all_sizes[approach.value] = impl_sizes
+
+                print_doubling_table(approach.value, impl_sizes, results)
+                print_per_element_table(approach.value, impl_sizes, results, baseline)
+
+                if gc_stats:
+                    gc_rows = [
+                        (f"{size:,} {operation}", results[operation][i], gc_records[size][operation])
+                        for i, size in enumerate(impl_sizes)
+                        for operation in DOUBLING_OPERATIONS
+                        if operation in gc_records.get(size, {})
+                    ]
+                    print_gc_table(f"{approach.value.upper()} Queue GC Activity", gc_rows)
+
+                if counters and queue_class not in COUNTING_CLASSES:
+                    console.print(f"[dim]No cost counters for {approach.value}[/dim]")
+                elif counters:
+                    counter_rows = []
+                    for size in impl_sizes:
+                        records = count_doubling_cell(queue_class, size)
+                        counter_rows.extend(
+                            (f"{size:,} {operation}", operation_elements(operation, size), records[operation])
+                            for operation in DOUBLING_OPERATIONS
+                        )
+                    print_counter_table(f"{approach.value.upper()} Queue Cost Counters", counter_rows)
+
+                if usage_records:
+                    print_usage_table(
+                        f"{approach.value.upper()} Subprocess Resource Usage",
+                        [(size, usage_records[size]) for size in impl_sizes if size in usage_records],
+                    )
+
+                # Refresh the plots with everything measured so far
+                plot_results(all_sizes, all_results, results_dir, operations=DOUBLING_OPERATIONS)
+
+            except Exception as e:
+                console.print(f"[red]Error testing {approach.value}: {str(e)}[/red]")
+                import traceback
+
+                console.print(traceback.format_exc())
+
+    if repeats > 1:
+        score = run_noise_score(
+            [record["noise"] for record in store.load() if isinstance(record.get("noise"), (int, float))]
+        )
+        source = "median robust CV over cells"
+    else:
+        # Cells timed once have no spread, so fall back to the probe
+        score = environment["probe_noise"]
+        source = "robust CV of the probe"
+    environment["noise_score"] = score
+    store.write_environment(environment)
+    store.write_metadata(dict(store.read_metadata(), noise_score=score))
+    console.print(f"Run noise score ({source}): [bold]{score:.2%}[/bold]")
+
+    console.print(f"[green]Plots saved to [bold]{results_dir}[/bold] directory[/green]")
+
+
+@app.command()
+def churn(
+    prefill: int = typer.Option(1000, help="Items kept in the queue during churn"),
+    rounds: int = typer.Option(1000000, help="Number of enqueue/dequeue pairs"),
+    pool_size: int = typer.Option(1024, help="Node pool size for the pooled runs"),
+    dll: bool = typer.Option(True, help="Test DLL implementation"),
+    sll: bool = typer.Option(True, help="Test SLL implementation"),
+):
+    """Measure steady-state churn throughput with and without node pooling."""
+    table = Table(
+        title="Steady-State Churn Throughput",
+        box=box.ROUNDED,
+        show_header=True,
+        header_style="bold magenta",
+    )
+    table.add_column("Queue", style="cyan")
+    table.add_column("Pool Size", justify="right")
+    table.add_column("Time (ms)", justify="right")
+    table.add_column("Ops/sec", justify="right")
+    table.add_column("Pool Hits", justify="right")
+    table.add_column("Pool Misses", justify="right")
 
     for approach, queue_class in QUEUE_IMPLEMENTATIONS.items():
         if not (
             (approach == QueueApproach.dll and dll)
             or (approach == QueueApproach.sll and sll)
-            or (approach == QueueApproach.array and array)
         ):
             continue
+        for size in (0, pool_size):
+            queue = queue_class(pool_size=size)
+            elapsed = measure_churn(queue, prefill, rounds)
+            stats = queue.pool_stats()
+            table.add_row(
+                approach.value.upper(),
+                f"{size:,}",
+                f"{elapsed * 1000:.3f}",
+                f"{2 * rounds / elapsed:,.0f}",
+                f"{stats['hits']:,}" if stats else "-",
+                f"{stats['misses']:,}" if stats else "-",
+            )
 
+    console.print(Panel(table))
+
+
+@app.command()
+def ring(
+    capacity: int = typer.Option(1024, min=1, help="Fixed capacity of the ring buffer"),
+    items: int = typer.Option(1000000, help="Number of elements pushed through the queue"),
+):
+    """Measure sustained ArrayQueue throughput for each overflow policy."""
+    table = Table(
+        title=f"ArrayQueue Throughput at Capacity {capacity:,}",
+        box=box.ROUNDED,
+        show_header=True,
+        header_style="bold magenta",
+    )
+    table.add_column("Policy", style="cyan")
+    table.add_column("Time (ms)", justify="right")
+    table.add_column("Ops/sec", justify="right")
+    table.add_column("Dropped", justify="right")
+    table.add_column("Final Capacity", justify="right")
+
+    for policy in OverflowPolicy:
+        queue = ArrayQueue(capacity, overflow=policy)
+        elapsed = measure_ring(queue, items)
+        # Both loops perform one enqueue per item plus the matching dequeues
+        operations = 2 * items if policy == OverflowPolicy.block else items + items // 2
+        table.add_row(
+            policy.value,
+            f"{elapsed * 1000:.3f}",
+            f"{operations / elapsed:,.0f}",
+            f"{queue.dropped:,}",
+            f"{queue.capacity:,}",
+        )
+
+    console.print(Panel(table))
+
+
+@app.command()
+def latency(
+    size: int = typer.Option(1000000, min=1, help="Number of enqueues to measure"),
+    capacity: int = typer.Option(10, min=1, help="Initial ArrayQueue capacity"),
+):
+    """Compare per-enqueue latency of doubling and incremental ArrayQueue resizing."""
+    table = Table(
+        title=f"ArrayQueue Enqueue Latency over {size:,} Enqueues",
+        box=box.ROUNDED,
+        show_header=True,
+        header_style="bold magenta",
+    )
+    table.add_column("Resize", style="cyan")
+    table.add_column("Mean (ns)", justify="right")
+    table.add_column("p99 (ns)", justify="right")
+    table.add_column("p99.9 (ns)", justify="right")
+    table.add_column("Max (ns)", justify="right")
+
+    for label, incremental in (("doubling", False), ("incremental", True)):
+        latencies = sorted(
+            measure_enqueue_latencies(ArrayQueue(capacity, incremental=incremental), size)
+        )
+        table.add_row(
+            label,
+            f"{sum(latencies) / len(latencies):,.0f}",
+            f"{percentile(latencies, 0.99):,}",
+            f"{percentile(latencies, 0.999):,}",
+            f"{latencies[-1]:,}",
+        )
+
+    console.print(Panel(table))
+
+
+@app.command()
+def memory(
+    burst: int = typer.Option(1000000, help="Queue size at the peak of each burst"),
+    floor: int = typer.Option(10, help="Queue size after each drain"),
+    bursts: int = typer.Option(3, help="Number of fill/drain cycles"),
+    shrink_threshold: float = typer.Option(0.25, help="Occupancy below which the buffer halves"),
+):
+    """Track ArrayQueue memory over a bursty workload with and without shrinking."""
+    results_dir = Path("results")
+    results_dir.mkdir(exist_ok=True)
+
+    configurations = {
+        "grow only": lambda: ArrayQueue(),
+        "shrink": lambda: ArrayQueue(shrink_threshold=shrink_threshold),
+    }
+    timelines = {}
+    phases = {}
+    for label, factory in configurations.items():
+        timelines[label], phases[label] = measure_memory_over_time(
+            factory(), burst, floor, bursts
+        )
+
+    table = Table(
+        title="ArrayQueue Memory after Bursty Workloads",
+        box=box.ROUNDED,
+        show_header=True,
+        header_style="bold magenta",
+    )
+    table.add_column("Phase", style="cyan")
+    table.add_column("Size", justify="right")
+    for label in configurations:
+        table.add_column(f"{label} capacity", justify="right")
+        table.add_column(f"{label} MB", justify="right")
+
+    labels = list(configurations)
+    for index, phase in enumerate(phases[labels[0]]):
+        name = f"{'fill' if index % 2 == 0 else 'drain'} {index // 2 + 1}"
+        row = [name, f"{phase[1]:,}"]
+        for label in labels:
+            _, _, capacity, size_bytes = phases[label][index]
+            row.extend([f"{capacity:,}", f"{size_bytes / 1e6:.3f}"])
+        table.add_row(*row)
+
+    console.print(Panel(table))
+
+    plt.figure(figsize=(10, 6))
+    for label, timeline in timelines.items():
+        plt.plot(
+            [sample[0] for sample in timeline],
+            [sample[3] / 1e6 for sample in timeline],
+            label=label,
+            linewidth=2,
+        )
+    plt.title("ArrayQueue Buffer Memory over Time", fontsize=16)
+    plt.xlabel("Operations", fontsize=14)
+    plt.ylabel("Buffer Memory (MB)", fontsize=14)
+    plt.grid(True, linestyle="--", alpha=0.7)
+    plt.legend(fontsize=12)
+    plt.tight_layout()
+    plot_path = results_dir / "memory_over_time.png"
+    plt.savefig(plot_path)
+    plt.close()
+    console.print(f"[green]Plot saved to [bold]{plot_path}[/bold][/green]")
+
+
+
+@app.command()
+def steal(
+    depth: int = typer.Option(16, help="Depth of the fork/join task tree"),
+    work: int = typer.Option(200, help="Busy-loop iterations per leaf task"),
+    max_workers: int = typer.Option(8, help="Largest number of worker threads"),
+    steal_half: bool = typer.Option(True, help="Steal half of the victim's tasks instead of one"),
+):
+    """Run a work-stealing scheduler on BasicDLLQueue deques with more and more workers."""
+    table = Table(
+        title=f"Work-Stealing Scheduler, {2 ** (depth + 1) - 1:,} Tasks",
+        box=box.ROUNDED,
+        show_header=True,
+        header_style="bold magenta",
+    )
+    table.add_column("Workers", style="cyan", justify="right")
+    table.add_column("Time (ms)", justify="right")
+    table.add_column("Tasks/sec", justify="right")
+    table.add_column("Steals", justify="right")
+    table.add_column("Stolen Tasks", justify="right")
+    table.add_column("Failed Steals", justify="right")
+    table.add_column("Tasks per Worker (min / max)", justify="right")
+
+    for workers in worker_counts(max_workers):
+        stats = run_scheduler(workers, depth, work, steal_half)
+        table.add_row(
+            str(workers),
+            f"{stats['elapsed'] * 1000:.3f}",
+            f"{stats['tasks'] / stats['elapsed']:,.0f}",
+            f"{stats['steals']:,}",
+            f"{stats['stolen']:,}",
+            f"{stats['failed_steals']:,}",
+            f"{min(stats['executed']):,} / {max(stats['executed']):,}",
+        )
+
+    console.print(Panel(table))
+
+
+@app.command()
+def readers(
+    max_readers: int = typer.Option(8, min=1, help="Largest number of reader threads"),
+    writes: int = typer.Option(100000, min=1, help="Items the writer enqueues"),
+    window: int = typer.Option(1000, min=1, help="Items kept in the queue; older ones are dequeued"),
+    scan: int = typer.Option(100, min=1, help="Elements every reader view scans"),
+):
+    """Compare a locked BasicSLLQueue with the persistent queue under concurrent readers."""
+    results_dir = Path("results")
+    results_dir.mkdir(exist_ok=True)
+    table = Table(
+        title=f"One Writer, {writes:,} Writes, Concurrent Readers",
+        box=box.ROUNDED,
+        show_header=True,
+        header_style="bold magenta",
+    )
+    table.add_column("Readers", style="cyan", justify="right")
+    table.add_column("Queue", style="cyan")
+    table.add_column("Writes/sec", justify="right")
+    table.add_column("Views/sec", justify="right")
+    table.add_column("Mean View (µs)", justify="right")
+    table.add_column("Worst View (ms)", justify="right")
+    table.add_column("Torn Views", justify="right")
+
+    counts = worker_counts(max_readers)
+    throughput = {kind: [] for kind in READER_QUEUES}
+    for count in counts:
+        for kind in READER_QUEUES:
+            stats = run_readers(kind, count, writes, window, scan)
+            throughput[kind].append(stats["write_throughput"])
+            table.add_row(
+                str(count),
+                kind,
+                f"{stats['write_throughput']:,.0f}",
+                f"{stats['view_throughput']:,.0f}",
+                f"{stats['mean_view'] * 1e6:,.1f}",
+                f"{stats['worst_view'] * 1000:.3f}",
+                f"{stats['inconsistent']:,}",
+            )
+    console.print(Panel(table))
+
+    plt.figure(figsize=(10, 6))
+    for kind, values in throughput.items():
+        plt.plot(counts, values, marker="o", label=kind, linewidth=2)
+    plt.title("Writer Throughput under Concurrent Readers", fontsize=14)
+    plt.xlabel("Reader Threads", fontsize=12)
+    plt.ylabel("Writes/sec", fontsize=12)
+    plt.grid(True, linestyle="--", alpha=0.7)
+    plt.legend(fontsize=10)
+    plt.tight_layout()
+    plot_path = results_dir / "readers_throughput.png"
+    plt.savefig(plot_path)
+    plt.close()
+    console.print(f"[green]Plot saved to [bold]{plot_path}[/bold][/green]")
+
+
+@app.command()
+def pipeline(
+    items: int = typer.Option(100000, help="Number of items pushed through the pipeline"),
+    stages: str = typer.Option(
+        "parse:1:20,transform:2:200,write:1:50",
+        help="Comma-separated stages as name:workers:cost (cost is busy-loop iterations per item)",
+    ),
+    capacity: Optional[int] = typer.Option(
+        None, min=1, help="Bound on every queue between stages (unbounded by default)"
+    ),
+    dll: bool = typer.Option(True, help="Test DLL implementation"),
+    sll: bool = typer.Option(True, help="Test SLL implementation"),
+    array: bool = typer.Option(True, help="Test Array implementation"),
+):
+    """Run a threaded multi-stage pipeline connected by each queue implementation."""
+    try:
+        stage_list = parse_stages(stages)
+    except ValueError as e:
+        console.print(f"[red]{e}[/red]")
+        raise typer.Exit(code=1)
+    selected = [
+        (approach, queue_class)
+        for approach, queue_class in QUEUE_IMPLEMENTATIONS.items()
+        if (approach == QueueApproach.dll and dll)
+        or (approach == QueueApproach.sll and sll)
+        or (approach == QueueApproach.array and array)
+    ]
+    if not selected:
+        console.print("[red]Select at least one implementation[/red]")
+        raise typer.Exit(code=1)
+    results_dir = Path("results")
+    results_dir.mkdir(exist_ok=True)
+
+    summary = Table(
+        title=f"Pipeline Throughput, {items:,} Items",
+        box=box.ROUNDED,
+        show_header=True,
+        header_style="bold magenta",
+    )
+    summary.add_column("Queue", style="cyan")
+    summary.add_column("Time (ms)", justify="right")
+    summary.add_column("Items/sec", justify="right")
+    summary.add_column("Bottleneck", style="yellow")
+
+    runs = {}
+    for approach, queue_class in selected:
+        run = run_pipeline(queue_class, stage_list, items, capacity)
+        runs[approach.value] = run
+        summary.add_row(
+            approach.value.upper(),
+            f"{run['elapsed'] * 1000:.3f}",
+            f"{run['throughput']:,.0f}",
+            run["bottleneck"],
+        )
+
+        table = Table(
+            title=f"{approach.value.upper()} Pipeline Stages",
+            box=box.ROUNDED,
+            show_header=True,
+            header_style="bold magenta",
+        )
+        table.add_column("Stage", style="cyan")
+        table.add_column("Workers", justify="right")
+        table.add_column("Cost", justify="right")
+        table.add_column("Processed", justify="right")
+        table.add_column("Utilization", justify="right")
+        table.add_column("Mean Input Depth", justify="right")
+        table.add_column("Max Input Depth", justify="right")
+        for stats in run["stages"]:
+            table.add_row(
+                stats["name"],
+                str(stats["workers"]),
+                f"{stats['cost']:,}",
+                f"{stats['processed']:,}",
+                f"{stats['utilization']:.1%}",
+                f"{stats['mean_depth']:,.1f}",
+                f"{stats['max_depth']:,}",
+            )
+        console.print(Panel(table))
+
+    console.print(Panel(summary))
+
+    figure, axes = plt.subplots(len(runs), 1, figsize=(10, 3 * len(runs) + 1), squeeze=False)
+    for axis, (name, run) in zip(axes[:, 0], runs.items()):
+        times = [sample[0] * 1000 for sample in run["depths"]]
+        for index, stage in enumerate(stage_list):
+            axis.plot(times, [sample[1][index] for sample in run["depths"]], label=stage.name, linewidth=2)
+        axis.set_title(f"{name.upper()} Input Queue Depth", fontsize=14)
+        axis.set_xlabel("Time (ms)", fontsize=12)
+        axis.set_ylabel("Items", fontsize=12)
+        axis.grid(True, linestyle="--", alpha=0.7)
+        axis.legend(fontsize=10)
+    figure.tight_layout()
+    plot_path = results_dir / "pipeline_depth.png"
+    figure.savefig(plot_path)
+    plt.close(figure)
+    console.print(f"[green]Plot saved to [bold]{plot_path}[/bold][/green]")
+
+
+@app.command()
+def workloads(
+    initial_size: int = typer.Option(10000, help="Smallest input size (nodes or jobs)"),
+    max_size: int = typer.Option(160000, help="Largest input size; sizes double up to it"),
+    workload: Optional[List[str]] = typer.Option(
+        None, help=f"Workloads to run (default all): {', '.join(WORKLOADS)}"
+    ),
+    seed: int = typer.Option(0, help="Seed for the generated inputs"),
+    dll: bool = typer.Option(True, help="Test DLL implementation"),
+    sll: bool = typer.Option(True, help="Test SLL implementation"),
+    array: bool = typer.Option(True, help="Test Array implementation"),
+    gc_mode: GCMode = typer.Option(
+        GCMode.enabled, "--gc", help="Garbage collector state during timed runs"
+    ),
+):
+    """Run BFS, level-order traversal and a round-robin simulation on every queue."""
+    names = workload or list(WORKLOADS)
+    unknown = [name for name in names if name not in WORKLOADS]
+    if unknown:
+        console.print(f"[red]Unknown workload: {', '.join(unknown)}[/red]")
+        raise typer.Exit(code=1)
+    results_dir = Path("results")
+    results_dir.mkdir(exist_ok=True)
+
+    sizes = []
+    current_size = initial_size
+    while current_size <= max_size:
+        sizes.append(current_size)
+        current_size *= 2
+    selected = [
+        (approach, queue_class)
+        for approach, queue_class in QUEUE_IMPLEMENTATIONS.items()
+        if (approach == QueueApproach.dll and dll)
+        or (approach == QueueApproach.sll and sll)
+        or (approach == QueueApproach.array and array)
+    ]
+
+    for name in names:
+        spec = WORKLOADS[name]
+        table = Table(
+            title=spec.description,
+            box=box.ROUNDED,
+            show_header=True,
+            header_style="bold magenta",
+        )
+        table.add_column("Size (n)", style="cyan", justify="right")
+        for approach, _ in selected:
+            table.add_column(f"{approach.value.upper()} (ms)", justify="right")
+            table.add_column(f"{approach.value.upper()} Peak (MB)", justify="right")
+
+        times = {approach.value: [] for approach, _ in selected}
+        for size in sizes:
+            # The input is shared by every implementation and built untimed
+            data = spec.build(size, seed)
+            row = [f"{size:,}"]
+            for approach, queue_class in selected:
+                seconds, peak = measure_workload(queue_class, spec, data, gc_mode)
+                times[approach.value].append(seconds)
+                row.extend([f"{seconds * 1000:.3f}", f"{peak / 1e6:.3f}"])
+            table.add_row(*row)
+        console.print(Panel(table))
+
+        plt.figure(figsize=(10, 6))
+        for impl, impl_times in times.items():
+            plt.loglog(sizes, np.array(impl_times) * 1000, marker="o", label=impl.upper(), linewidth=2)
+        plt.title(spec.description, fontsize=16)
+        plt.xlabel("Input Size (n)", fontsize=14)
+        plt.ylabel("Time (ms)", fontsize=14)
+        plt.grid(True, which="both", linestyle="--", alpha=0.7)
+        plt.legend(fontsize=12)
+        plt.tight_layout()
+        plot_path = results_dir / f"workload_{name}.png"
+        plt.savefig(plot_path)
+        plt.close()
+        console.print(f"[green]Plot saved to [bold]{plot_path}[/bold][/green]")
+
+
+@app.command()
+def payloads(
+    size: int = typer.Option(200000, help="Number of elements enqueued per run"),
+    payload: Optional[List[Payload]] = typer.Option(
+        None, help="Payload types to compare (default all)"
+    ),
+    dll: bool = typer.Option(True, help="Test DLL implementation"),
+    sll: bool = typer.Option(True, help="Test SLL implementation"),
+    array: bool = typer.Option(True, help="Test Array implementation"),
+    gc_mode: GCMode = typer.Option(
+        GCMode.enabled, "--gc", help="Garbage collector state during timed runs"
+    ),
+):
+    """Compare throughput and memory of every queue across element types."""
+    table = Table(
+        title=f"Payload Comparison, {size:,} Elements",
+        box=box.ROUNDED,
+        show_header=True,
+        header_style="bold magenta",
+    )
+    table.add_column("Queue", style="cyan")
+    table.add_column("Payload", no_wrap=True)
+    table.add_column("Enqueue (M/s)", justify="right")
+    table.add_column("Dequeue (M/s)", justify="right")
+    table.add_column("Queue MB", justify="right")
+    table.add_column("Elements MB", justify="right")
+    table.add_column("Bytes/Elem", justify="right")
+
+    for kind in payload or list(Payload):
         try:
-            console.print(f"\n{approach.value.upper()} Queue Implementation")
-            results = {
-                "enqueue": [],
-                "dequeue": [],
-                "peek": [],
-                "concat": [],
-                "iconcat": [],
-            }
+            items, payload_bytes = traced_payloads(kind, size)
+        except ImportError as e:
+            console.print(f"[yellow]Skipping {kind.value}: {e}[/yellow]")
+            continue
+        for approach, queue_class in QUEUE_IMPLEMENTATIONS.items():
+            if not (
+                (approach == QueueApproach.dll and dll)
+                or (approach == QueueApproach.sll and sll)
+                or (approach == QueueApproach.array and array)
+            ):
+                continue
+            stats = measure_payload(queue_class, items, gc_mode)
+            table.add_row(
+                approach.value.upper(),
+                kind.value,
+                f"{size / stats['enqueue'] / 1e6:.2f}",
+                f"{size / stats['dequeue'] / 1e6:.2f}",
+                f"{stats['queue_bytes'] / 1e6:.3f}",
+                f"{payload_bytes / 1e6:.3f}",
+                f"{(stats['queue_bytes'] + payload_bytes) / size:,.1f}",
+            )
+        table.add_section()
+        del items
 
-            for size in sizes:
-                queue = queue_class()
-                other = queue_class()
+    console.print(Panel(table))
 
-                # Enqueue
-                enqueue_time = time_operation(
-                    lambda: [queue.enqueue(i) for i in range(size)]
-                )
-                results["enqueue"].append(enqueue_time)
 
-                # Dequeue
-                dequeue_time = time_operation(
-                    lambda: [queue.dequeue() for _ in range(size // 2)]
-                )
-                results["dequeue"].append(dequeue_time)
+@app.command("run")
+def run_plan(
+    plan_path: Path = typer.Argument(..., help="TOML file declaring the experiments", exists=True),
+    workers: Optional[int] = typer.Option(
+        None, min=1, help="Processes measuring jobs in parallel (overrides the plan)"
+    ),
+):
+    """Run the experiments declared in a plan file and report them together."""
+    try:
+        plan = load_plan(plan_path)
+        names, operations, members = expand_plan(plan)
+    except ValueError as e:
+        console.print(f"[red]{e}[/red]")
+        raise typer.Exit(code=1)
+    workers = workers or plan.get("workers", 1)
+    jobs = plan_jobs(operations)
+    requested = sum(len(ops) for experiments in members.values() for ops in experiments.values())
+    measured = sum(len(ops) for ops in operations.values())
+    console.print(
+        f"{len(names)} experiments, {measured:,} measurements in {len(jobs)} jobs on "
+        f"{workers} worker(s); {requested - measured:,} shared between experiments"
+    )
 
-                # Refill queue
-                for i in range(size // 2):
-                    queue.enqueue(i)
+    results_dir = Path("results")
+    results_dir.mkdir(exist_ok=True)
+    store = ResultStore(results_dir)
+    store.write_metadata({"plan": str(plan_path), "workers": workers, **plan})
+    environment = check_environment()
+    for warning in environment["warnings"]:
+        console.print(f"[yellow]{warning}[/yellow]")
+    store.write_environment(environment)
+    console.print(f"Run [bold]{store.run_id}[/bold], results in {store.path}")
+
+    def on_cell(cell, results, noise):
+        for operation, seconds in results.items():
+            summary = noise.get(operation, {})
+            store.append(
+                cell.implementation,
+                cell.size,
+                operation,
+                seconds,
+                payload=cell.payload,
+                gc_mode=cell.gc_mode,
+                repeats=cell.repeats,
+                experiments=list(members[cell]),
+                **{k: summary[k] for k in ("noise", "rejected") if k in summary},
+            )
 
-                # Peek
-                peek_time = time_operation(
-                    lambda: [queue.peek() for _ in range(size // 3)]
-                )
-                results["peek"].append(peek_time)
-
-                # Prepare other queue for concat
-                for i in range(size // 10):
-                    other.enqueue(i)
-
-                # Concat
-                concat_time = time_operation(lambda: queue + other)
-                results["concat"].append(concat_time)
-
-                # Iconcat
-                iconcat_time = time_operation(lambda: queue.__iadd__(other))
-                results["iconcat"].append(iconcat_time)
-
-            # Store results for plotting
-            all_results[approach.value] = results
-
-            # Display results in table
-            table = Table(
-                title=f"{approach.value.upper()} Queue Doubling Experiment Results",
-                box=box.ROUNDED,
-                show_header=True,
-                header_style="bold magenta",
-                width=73  # Adjusted width to fit operations
+    with console.status("Measuring..."):
+        results = execute_jobs(jobs, workers, on_cell)
+
+    report = {}
+    for name in names:
+        cells = sorted(
+            (cell for cell in operations if name in members[cell]),
+            key=lambda cell: (cell.implementation, cell.payload, cell.size),
+        )
+        shown = [op for op in DOUBLING_OPERATIONS if any(op in members[cell][name] for cell in cells)]
+        table = Table(
+            title=f"Experiment {name}",
+            box=box.ROUNDED,
+            show_header=True,
+            header_style="bold magenta",
+        )
+        table.add_column("Queue", style="cyan")
+        table.add_column("Payload", no_wrap=True)
+        table.add_column("Size (n)", justify="right")
+        for operation in shown:
+            table.add_column(f"{operation} (ms)", justify="right")
+        rows = []
+        for cell in cells:
+            cell_results = {
+                op: seconds for op, seconds in results.get(cell, {}).items() if op in members[cell][name]
+            }
+            rows.append({**cell._asdict(), "results": cell_results})
+            table.add_row(
+                cell.implementation.upper(),
+                cell.payload,
+                f"{cell.size:,}",
+                *[
+                    f"{cell_results[op] * 1000:.5f}" if op in cell_results else "-"
+                    for op in shown
+                ],
             )
-            table.add_column("Size (n)", justify="right", width=10)
-            table.add_column("enqueue (ms)", justify="right", width=12)
-            table.add_column("dequeue (ms)", justify="right", width=12)
-            table.add_column("peek (ms)", justify="right", width=12)
-            table.add_column("concat (ms)", justify="right", width=12)
-            table.add_column("iconcat (ms)", justify="right", width=12)
-
-            for i, size in enumerate(sizes):
-                row = [f"{size:,}"]
-                for operation in results.keys():
-                    value = results[operation][i]
-                    if np.isnan(value):
-                        row.append("N/A")
-                    else:
-                        row.append(f"{value * 1000:.5f}")
-                table.add_row(*row)
+        console.print(Panel(table))
+        report[name] = rows
+
+    store.write_report({"experiments": report, "environment": environment})
+    console.print(f"[green]Combined report saved to [bold]{store.path / 'report.json'}[/bold][/green]")
+
+
+@app.command()
+def report(
+    run_id: Optional[str] = typer.Argument(None, help="Run to report on (default: the latest stored run)"),
+    baseline: Optional[str] = typer.Option(
+        None, help="Implementation the speedups are relative to (default: the first of the run)"
+    ),
+    workers: int = typer.Option(os.cpu_count() or 1, min=1, help="Processes rendering the plots"),
+):
+    """Write an HTML and a Markdown report of a stored run."""
+    results_dir = Path("results")
+    if run_id is None:
+        runs = sorted(path.name for path in (results_dir / "runs").glob("*") if (path / "run.json").exists())
+        if not runs:
+            console.print(f"[red]No stored runs in {results_dir / 'runs'}[/red]")
+            raise typer.Exit(code=1)
+        run_id = runs[-1]
+    elif not ResultStore.exists(results_dir, run_id):
+        console.print(f"[red]No stored run with id {run_id}[/red]")
+        raise typer.Exit(code=1)
+
+    store = ResultStore(results_dir, run_id)
+    try:
+        with console.status(f"Rendering report of run {run_id}..."):
+            run_report = build_report(store, baseline, workers)
+    except ValueError as e:
+        console.print(f"[red]{e}[/red]")
+        raise typer.Exit(code=1)
+    html_path, markdown_path = write_report_files(run_report, store.path)
+    console.print(f"[green]Report saved to [bold]{html_path}[/bold] and [bold]{markdown_path}[/bold][/green]")
+
 
-            console.print(Panel(table))
+@app.command()
+def interpreters(
+    python: Optional[List[str]] = typer.Option(
+        None, help="Interpreter to include (repeatable); default: discover on PATH"
+    ),
+    initial_size: int = typer.Option(10000, help="Initial size for doubling experiment"),
+    max_size: int = typer.Option(160000, help="Maximum size for doubling experiment"),
+    dll: bool = typer.Option(True, help="Test DLL implementation"),
+    sll: bool = typer.Option(True, help="Test SLL implementation"),
+    array: bool = typer.Option(True, help="Test Array implementation"),
+    bankers: bool = typer.Option(False, help="Test persistent banker's queue implementation"),
+    payload: Payload = typer.Option(Payload.small_int, help="Type of the enqueued elements"),
+    repeats: int = typer.Option(1, min=1, help="Time every cell this many times"),
+):
+    """Compare the queue implementations across Python interpreters."""
+    if python:
+        found = []
+        for executable in python:
+            info = interpreter_info(executable)
+            if info is None:
+                console.print(f"[yellow]Skipping {executable}: not runnable or older than 3.9[/yellow]")
+            else:
+                found.append(info)
+    else:
+        found = discover_interpreters()
+    if not found:
+        console.print("[red]No usable interpreters[/red]")
+        raise typer.Exit(code=1)
+    for info in found:
+        console.print(f"[bold]{info['label']}[/bold]: {info['executable']}")
 
-        except Exception as e:
-            console.print(f"[red]Error testing {approach.value}: {str(e)}[/red]")
-            import traceback
+    sizes = []
+    current_size = initial_size
+    while current_size <= max_size:
+        sizes.append(current_size)
+        current_size *= 2
+    implementations = [
+        approach.value
+        for approach in QUEUE_IMPLEMENTATIONS
+        if (approach == QueueApproach.dll and dll)
+        or (approach == QueueApproach.sll and sll)
+        or (approach == QueueApproach.array and array)
+        or (approach == QueueApproach.bankers and bankers)
+    ]
+    labels = [info["label"] for info in found]
+    with console.status("Measuring...") as status:
+        results = run_matrix(
+            found,
+            implementations,
+            sizes,
+            DOUBLING_OPERATIONS,
+            payload,
+            repeats,
+            lambda label, impl, size, cell: status.update(f"{label}: {impl} n={size:,} done"),
+        )
 
-            console.print(traceback.format_exc())
+    results_dir = Path("results")
+    results_dir.mkdir(exist_ok=True)
+    for operation in DOUBLING_OPERATIONS:
+        table = Table(
+            title=f"{operation} (ms) by Interpreter",
+            box=box.ROUNDED,
+            show_header=True,
+            header_style="bold magenta",
+        )
+        table.add_column("Queue", style="cyan")
+        table.add_column("Size (n)", justify="right")
+        for label in labels:
+            table.add_column(label, justify="right")
+        if len(labels) > 1:
+            table.add_column("Fastest", style="green")
+        for implementation in implementations:
+            for size in sizes:
+                times = [results[(label, implementation, size)].get(operation, math.nan) for label in labels]
+                row = [implementation.upper(), f"{size:,}"]
+                row.extend("N/A" if math.isnan(t) else f"{t * 1000:.5f}" for t in times)
+                if len(labels) > 1:
+                    valid = [(t, label) for t, label in zip(times, labels) if not math.isnan(t)]
+                    row.append(min(valid)[1] if valid else "-")
+                table.add_row(*row)
+            table.add_section()
+        console.print(Panel(table))
 
-    # Generate and save plots
-    plot_results(sizes, all_results, results_dir, operations=["enqueue", "dequeue", "peek", "concat", "iconcat"])
+        figure, axes = plt.subplots(
+            1, len(implementations), figsize=(5 * len(implementations), 5), squeeze=False
+        )
+        for axis, implementation in zip(axes[0], implementations):
+            for label in labels:
+                times = np.array(
+                    [results[(label, implementation, size)].get(operation, math.nan) for size in sizes]
+                ) * 1000
+                valid = ~np.isnan(times) & (times > 0)
+                if np.any(valid):
+                    axis.loglog(np.array(sizes)[valid], times[valid], marker="o", label=label, linewidth=2)
+            axis.set_title(f"{implementation.upper()} {operation}", fontsize=14)
+            axis.set_xlabel("Input Size (n)", fontsize=12)
+            axis.set_ylabel("Time (ms)", fontsize=12)
+            axis.grid(True, which="both", linestyle="--", alpha=0.7)
+            axis.legend(fontsize=9)
+        figure.tight_layout()
+        plot_path = results_dir / f"interpreters_{operation}.png"
+        figure.savefig(plot_path)
+        plt.close(figure)
     console.print(f"[green]Plots saved to [bold]{results_dir}[/bold] directory[/green]")
 
 
+@app.command()
+def serialize(
+    size: int = typer.Option(1000000, help="Number of elements in each queue"),
+    payload: SerializePayload = typer.Option(SerializePayload.int, help="Element type"),
+    dll: bool = typer.Option(True, help="Test DLL implementation"),
+    sll: bool = typer.Option(True, help="Test SLL implementation"),
+    array: bool = typer.Option(True, help="Test Array implementation"),
+    gc_mode: GCMode = typer.Option(
+        GCMode.enabled, "--gc", help="Garbage collector state during timed runs"
+    ),
+):
+    """Measure save and load throughput of pickle and the compact binary format."""
+    table = Table(
+        title=f"Serialization of {size:,} {payload.value} Elements",
+        box=box.ROUNDED,
+        show_header=True,
+        header_style="bold magenta",
+    )
+    table.add_column("Queue", style="cyan")
+    table.add_column("Format")
+    table.add_column("Size (MB)", justify="right")
+    table.add_column("Save (ms)", justify="right")
+    table.add_column("Save (MB/s)", justify="right")
+    table.add_column("Load (ms)", justify="right")
+    table.add_column("Load (MB/s)", justify="right")
+
+    make_item = SERIALIZE_PAYLOADS[payload]
+    for approach, queue_class in QUEUE_IMPLEMENTATIONS.items():
+        if not (
+            (approach == QueueApproach.dll and dll)
+            or (approach == QueueApproach.sll and sll)
+            or (approach == QueueApproach.array and array)
+        ):
+            continue
+        queue = queue_class()
+        for i in range(size):
+            queue.enqueue(make_item(i))
+        for name, (size_bytes, saved, loaded) in measure_serialization(queue, gc_mode).items():
+            megabytes = size_bytes / 1e6
+            table.add_row(
+                approach.value.upper(),
+                name,
+                f"{megabytes:.3f}",
+                f"{saved * 1000:.3f}",
+                f"{megabytes / saved:,.1f}" if saved > 0 else "-",
+                f"{loaded * 1000:.3f}",
+                f"{megabytes / loaded:,.1f}" if loaded > 0 else "-",
+            )
+        del queue
+
+    console.print(Panel(table))
+
+
+@app.command()
+def worker(
+    address: str = typer.Argument(..., help="Coordinator address as HOST:PORT"),
+    name: Optional[str] = typer.Option(None, help="Name shown in the coordinator's report"),
+    connect_timeout: float = typer.Option(10.0, help="Seconds to keep retrying the connection"),
+):
+    """Measure doubling cells handed out by a coordinator (doubling --distribute)."""
+    host, port = parse_address(address)
+    jobs = run_worker(host, port, name, connect_timeout)
+    console.print(f"[green]Measured {jobs} jobs for {host}:{port}[/green]")
+
 def plot_results(sizes, all_results, results_dir, operations):
-    """Generate and save plots for doubling experiment results."""
+    """Generate and save plots for doubling experiment results.
+
+    ``sizes`` is either one list shared by every implementation or a dict
+    mapping each implementation to the sizes it was measured at.
+    """
+
+    def impl_sizes(impl):
+        return sizes[impl] if isinstance(sizes, dict) else sizes
+
+    if isinstance(sizes, dict):
+        all_sizes = sorted({size for impl in all_results for size in sizes[impl]})
+    else:
+        all_sizes = sizes
 
     # Create log-log plots for each operation
     for operation in operations:
-        if len(sizes) > 2:
+        if len(all_sizes) > 2:
             plt.figure(figsize=(10, 6))
 
             for impl, results in all_results.items():
+                x_values = np.array(impl_sizes(impl))
                 times = np.array(results[operation]) * 1000
-                if np.all(times > 0) and not np.all(np.isnan(times)):
+                valid = ~np.isnan(times)
+                if np.any(valid) and np.all(times[valid] > 0):
                     plt.loglog(
-                        sizes, times, marker="o", label=f"{impl.upper()}", linewidth=2
+                        x_values[valid], times[valid], marker="o", label=f"{impl.upper()}", linewidth=2
                     )
 
             valid_data_exists = any(
                 not np.all(np.isnan(results[operation])) for results in all_results.values()
             )
-            if valid_data_exists and len(sizes) > 1:
-                x_range = np.array(sizes)
-                first_valid_time = next((res[operation][0] * 1000 for res in all_results.values() if not np.isnan(res[operation][0])), None)
+            if valid_data_exists and len(all_sizes) > 1:
+                x_range = np.array(all_sizes)
+                first_valid_time = next(
+                    (
+                        res[operation][0] * 1000
+                        for impl, res in all_results.items()
+                        if impl_sizes(impl) and impl_sizes(impl)[0] == all_sizes[0]
+                        and not np.isnan(res[operation][0])
+                    ),
+                    None,
+                )
                 if first_valid_time is not None:
                     plt.loglog(x_range, np.ones_like(x_range) * first_valid_time, "--", label="O(1)", alpha=0.5)
                     plt.loglog(x_range, x_range * (first_valid_time / x_range[0]), "--", label="O(n)", alpha=0.5)
@@ -315,7 +1928,7 @@ def plot_results(sizes, all_results, results_dir, operations):
 
         for operation in operations:
             times = np.array(results[operation]) * 1000
-            plt.plot(sizes, times, marker="o", label=operation, linewidth=2)
+            plt.plot(impl_sizes(impl), times, marker="o", label=operation, linewidth=2)
 
         plt.title(f"{impl.upper()} Queue Implementation Performance", fontsize=16)
         plt.xlabel("Queue Size (n)", fontsize=14)
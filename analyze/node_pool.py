@@ -0,0 +1,53 @@
+"""A bounded free list that recycles linked-list nodes."""
+
+from typing import Any, Dict, List
+
+
+class NodePool:
+    """Bounded free list of nodes for the linked-list queues.
+
+    Dequeued nodes are kept (up to ``max_size``) and handed out again by the
+    next enqueue instead of allocating a fresh node.
+    """
+
+    def __init__(self, node_class: type, max_size: int):
+        if max_size < 0:
+            raise ValueError("pool size must be non-negative")
+        self.node_class = node_class
+        self.max_size = max_size
+        self._free: List[Any] = []
+        self.hits: int = 0
+        self.misses: int = 0
+        self.discarded: int = 0
+
+    def acquire(self, data: Any) -> Any:
+        """Return a node holding ``data``, reusing a free one when available."""
+        if self._free:
+            node = self._free.pop()
+            node.data = data
+            self.hits += 1
+            return node
+        self.misses += 1
+        return self.node_class(data)
+
+    def release(self, node: Any) -> None:
+        """Give a detached node back to the pool. Its links must already be cleared."""
+        node.data = None
+        node.next = None
+        if len(self._free) < self.max_size:
+            self._free.append(node)
+        else:
+            self.discarded += 1
+
+    def __len__(self) -> int:
+        return len(self._free)
+
+    def stats(self) -> Dict[str, int]:
+        """Return the pool size, free nodes and reuse counters."""
+        return {
+            "max_size": self.max_size,
+            "free": len(self._free),
+            "hits": self.hits,
+            "misses": self.misses,
+            "discarded": self.discarded,
+        }
@@ -0,0 +1,61 @@
+"""Element payloads for the benchmarks.
+
+The benchmarks enqueue ``range(size)`` by default. CPython caches the ints
+from -5 to 256 and every other small int is a tiny object, so that hides the
+cost of referencing and freeing bigger elements. The generators here build
+``count`` distinct elements of a given kind up front, so that creating them
+never happens inside a timed region.
+"""
+
+import tracemalloc
+from enum import Enum
+from typing import Any, List, Tuple
+
+
+class Payload(str, Enum):
+    """Kinds of element the benchmarks can enqueue."""
+
+    small_int = "small_int"
+    large_int = "large_int"
+    short_str = "short_str"
+    bytes_1k = "bytes_1k"
+    dict = "dict"
+    numpy = "numpy"
+
+
+def make_payloads(payload: Payload, count: int) -> List[Any]:
+    """Return a list of ``count`` distinct elements of the given kind.
+
+    ``small_int`` is ``list(range(count))``, the same values the benchmarks
+    use without a payload. ``numpy`` needs NumPy and raises ImportError without it.
+    """
+    payload = Payload(payload)
+    if payload == Payload.small_int:
+        return list(range(count))
+    if payload == Payload.large_int:
+        # Beyond 64 bits, so every element is a multi-digit int object
+        return [2 ** 100 + i for i in range(count)]
+    if payload == Payload.short_str:
+        return [f"item-{i}" for i in range(count)]
+    if payload == Payload.bytes_1k:
+        return [i.to_bytes(8, "little") * 128 for i in range(count)]
+    if payload == Payload.dict:
+        return [{"id": i, "name": f"item-{i}", "score": i * 0.5} for i in range(count)]
+    import numpy as np
+
+    return [np.full(16, i, dtype=np.int64) for i in range(count)]
+
+
+def traced_payloads(payload: Payload, count: int) -> Tuple[List[Any], int]:
+    """Return the elements of ``make_payloads`` and the bytes they take.
+
+    Every kind, ``small_int`` included, is built as a list, so its objects are
+    counted here rather than created while a queue is filled.
+    """
+    tracemalloc.start()
+    try:
+        items = make_payloads(payload, count)
+        allocated, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return items, allocated
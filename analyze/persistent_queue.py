@@ -0,0 +1,206 @@
+"""A persistent (immutable) queue with structural sharing.
+
+``PersistentQueue`` is Okasaki's real-time queue: the banker's queue whose
+rotation ``front ++ reverse(rear)`` is built lazily and forced one step per
+operation through a schedule. Every operation is O(1) in the worst case,
+also when an old version is reused, and returns a new version that shares
+almost all of its cells with the one it came from. Versions never change,
+so any number of threads can read one while another thread keeps producing
+new ones.
+
+``BankersQueue`` wraps the current version in the interface of the other
+queues. Its ``snapshot`` and ``version`` hand out a version in O(1) without
+copying or locking.
+"""
+
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+# A strict list is None or a (value, rest) pair; the rear is kept newest first
+Cons = Optional[Tuple[Any, Any]]
+
+
+class _Stream:
+    """A lazy list cell, computed by ``thunk`` on first use and then memoised.
+
+    Two threads forcing the same cell at once both compute it; the results
+    are equal, so either may win.
+    """
+
+    __slots__ = ("_thunk", "_cell")
+
+    def __init__(self, thunk=None, cell: Cons = None):
+        self._thunk = thunk
+        self._cell = cell
+
+    def force(self) -> Cons:
+        """Return None for the empty stream or a (value, rest stream) pair."""
+        thunk = self._thunk
+        if thunk is not None:
+            self._cell = thunk()
+            self._thunk = None
+        return self._cell
+
+
+_EMPTY = _Stream()
+
+
+def _rotate(front: _Stream, rear: Cons, acc: _Stream) -> _Stream:
+    """Return ``front ++ reverse(rear) ++ acc`` lazily, for ``len(rear) == len(front) + 1``."""
+
+    def step() -> Cons:
+        cell = front.force()
+        value, rest = rear
+        if cell is None:
+            return (value, acc)
+        return (cell[0], _rotate(cell[1], rest, _Stream(cell=(value, acc))))
+
+    return _Stream(step)
+
+
+class PersistentQueue:
+    """An immutable FIFO queue; ``enqueue`` and ``dequeue`` return new versions.
+
+    The schedule points at the first unforced cell of the front. Forcing one
+    cell per operation keeps the front evaluated ahead of every rotation, so
+    no operation ever has to force a long chain.
+    """
+
+    __slots__ = ("_front", "_rear", "_rear_size", "_schedule", "_size")
+
+    def __init__(
+        self,
+        front: _Stream = _EMPTY,
+        rear: Cons = None,
+        rear_size: int = 0,
+        schedule: _Stream = _EMPTY,
+        size: int = 0,
+    ):
+        self._front = front
+        self._rear = rear
+        self._rear_size = rear_size
+        self._schedule = schedule
+        self._size = size
+
+    @staticmethod
+    def _exec(front: _Stream, rear: Cons, rear_size: int, schedule: _Stream, size: int) -> "PersistentQueue":
+        """Force one scheduled cell, or start a rotation once the schedule runs out."""
+        cell = schedule.force()
+        if cell is not None:
+            return PersistentQueue(front, rear, rear_size, cell[1], size)
+        front = _rotate(front, rear, _EMPTY)
+        return PersistentQueue(front, None, 0, front, size)
+
+    def enqueue(self, value: Any) -> "PersistentQueue":
+        """Return a version with ``value`` added at the back (O(1))."""
+        return self._exec(self._front, (value, self._rear), self._rear_size + 1, self._schedule, self._size + 1)
+
+    def dequeue(self) -> Tuple[Any, "PersistentQueue"]:
+        """Return the front element and the version without it (O(1))."""
+        cell = self._front.force()
+        if cell is None:
+            raise IndexError("dequeue from empty queue")
+        return cell[0], self._exec(cell[1], self._rear, self._rear_size, self._schedule, self._size - 1)
+
+    def peek(self) -> Any:
+        """Return the front element (O(1))."""
+        cell = self._front.force()
+        if cell is None:
+            raise IndexError("peek from empty queue")
+        return cell[0]
+
+    def size(self) -> int:
+        """Return the number of elements (O(1))."""
+        return self._size
+
+    def is_empty(self) -> bool:
+        """Check if the queue is empty (O(1))."""
+        return self._size == 0
+
+    def __iter__(self) -> Iterator[Any]:
+        """Yield the elements from front to back."""
+        cell = self._front.force()
+        while cell is not None:
+            yield cell[0]
+            cell = cell[1].force()
+        rear = []
+        node = self._rear
+        while node is not None:
+            rear.append(node[0])
+            node = node[1]
+        yield from reversed(rear)
+
+
+class BankersQueue:
+    """A mutable queue holding the current version of a ``PersistentQueue``.
+
+    Every update replaces the version with one assignment, so a reader that
+    took ``version()`` or ``snapshot()`` keeps a consistent queue without
+    locking. Updates from several writers still need a lock.
+    """
+
+    def __init__(self):
+        self._version = PersistentQueue()
+
+    def version(self) -> PersistentQueue:
+        """Return the current immutable version (O(1))."""
+        return self._version
+
+    def snapshot(self) -> "BankersQueue":
+        """Return a copy of the queue that shares its version (O(1))."""
+        clone = BankersQueue()
+        clone._version = self._version
+        return clone
+
+    def unshare(self) -> None:
+        """Do nothing: versions are immutable, so sharing one never needs a copy."""
+
+    def enqueue(self, value: Any) -> None:
+        """Add an element to the back of the queue (O(1))."""
+        self._version = self._version.enqueue(value)
+
+    def dequeue(self) -> Any:
+        """Remove and return the front element of the queue (O(1))."""
+        value, self._version = self._version.dequeue()
+        return value
+
+    def peek(self) -> Any:
+        """Return the front element without removing it (O(1))."""
+        return self._version.peek()
+
+    def size(self) -> int:
+        """Return the number of elements in the queue (O(1))."""
+        return self._version.size()
+
+    def is_empty(self) -> bool:
+        """Check if the queue is empty (O(1))."""
+        return self._version.is_empty()
+
+    def __iter__(self) -> Iterator[Any]:
+        """Yield the elements from front to back without removing them."""
+        return iter(self._version)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Pickle the elements as a flat list; the lazy cells hold closures."""
+        return {"items": list(self)}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__init__()
+        for item in state["items"]:
+            self.enqueue(item)
+
+    def __add__(self, other: "BankersQueue") -> "BankersQueue":
+        """Creates a new queue by merging two existing queues (O(m))."""
+        new_queue = self.snapshot()
+        for item in other:
+            new_queue.enqueue(item)
+        return new_queue
+
+    def __iadd__(self, other: "BankersQueue") -> "BankersQueue":
+        """Merges another queue into the current queue in place (O(m))."""
+        version = self._version
+        for item in other:
+            version = version.enqueue(item)
+        # Like the other queues, the merged queue is left empty
+        other._version = PersistentQueue()
+        self._version = version
+        return self
@@ -0,0 +1,201 @@
+"""A multi-stage thread pipeline whose stages are connected by queues.
+
+Every stage reads from its own input channel and writes to the input channel
+of the next stage; the last stage writes nowhere. A stage runs on one or more
+worker threads, so a channel fans out to the workers of the stage it feeds
+and fans back in from the workers of the stage before it.
+"""
+
+import threading
+from time import perf_counter, sleep
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence
+
+# Returned by Channel.get once the channel is closed and drained
+CLOSED = object()
+
+
+class Stage(NamedTuple):
+    """One pipeline stage: ``workers`` threads spinning ``cost`` iterations per item."""
+
+    name: str
+    workers: int = 1
+    cost: int = 0
+
+
+def parse_stages(spec: str) -> List[Stage]:
+    """Parse ``name:workers:cost`` entries separated by commas.
+
+    ``workers`` and ``cost`` may be left out and default to 1 and 0.
+    """
+    stages = []
+    for entry in spec.split(","):
+        parts = entry.strip().split(":")
+        if not parts[0] or len(parts) > 3:
+            raise ValueError(f"invalid stage '{entry}', expected name:workers:cost")
+        try:
+            workers = int(parts[1]) if len(parts) > 1 else 1
+            cost = int(parts[2]) if len(parts) > 2 else 0
+        except ValueError:
+            raise ValueError(f"invalid stage '{entry}', workers and cost must be integers") from None
+        if workers < 1 or cost < 0:
+            raise ValueError(f"invalid stage '{entry}', needs at least one worker and a cost >= 0")
+        stages.append(Stage(parts[0], workers, cost))
+    return stages
+
+
+class Channel:
+    """A queue shared between threads, closed once all its producers are done.
+
+    The queue implementations are not thread-safe, so every operation holds
+    one lock. With a ``capacity`` producers wait while the channel is full,
+    which is what lets a slow stage hold back the stages before it.
+    """
+
+    def __init__(self, queue_class, producers: int = 1, capacity: Optional[int] = None):
+        if capacity is not None and capacity < 1:
+            raise ValueError("capacity must be positive")
+        self._queue = queue_class()
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+        self._producers = producers
+        self.capacity = capacity
+        self.depth = 0
+        self.max_depth = 0
+
+    def put(self, item: Any) -> None:
+        """Add an item, waiting for room when the channel is bounded."""
+        with self._not_full:
+            while self.capacity is not None and self.depth >= self.capacity:
+                self._not_full.wait()
+            self._queue.enqueue(item)
+            self.depth += 1
+            if self.depth > self.max_depth:
+                self.max_depth = self.depth
+            self._not_empty.notify()
+
+    def get(self) -> Any:
+        """Take the oldest item, or return CLOSED when no more will arrive."""
+        with self._not_empty:
+            while self.depth == 0:
+                if self._producers == 0:
+                    return CLOSED
+                self._not_empty.wait()
+            item = self._queue.dequeue()
+            self.depth -= 1
+            self._not_full.notify()
+            return item
+
+    def close(self) -> None:
+        """Called by each producer when it has put its last item."""
+        with self._lock:
+            self._producers -= 1
+            if self._producers == 0:
+                self._not_empty.notify_all()
+
+
+def run_pipeline(
+    queue_class,
+    stages: Sequence[Stage],
+    items: int,
+    capacity: Optional[int] = None,
+    sample_interval: float = 0.005,
+) -> Dict[str, Any]:
+    """Push ``items`` integers through ``stages`` connected by ``queue_class`` queues.
+
+    Returns the elapsed time and throughput, per-stage counters and input
+    queue depths sampled every ``sample_interval`` seconds as
+    ``(seconds, [depth per stage])``. The bottleneck is the stage whose
+    workers were busy for the largest share of the run.
+    """
+    if not stages:
+        raise ValueError("a pipeline needs at least one stage")
+    channels = [
+        Channel(queue_class, 1 if index == 0 else stages[index - 1].workers, capacity)
+        for index in range(len(stages))
+    ]
+    busy = [[0.0] * stage.workers for stage in stages]
+    processed = [[0] * stage.workers for stage in stages]
+    done = threading.Event()
+    start = threading.Barrier(sum(stage.workers for stage in stages) + 2)
+
+    def source() -> None:
+        channel = channels[0]
+        start.wait()
+        for item in range(items):
+            channel.put(item)
+        channel.close()
+
+    def worker(index: int, slot: int) -> None:
+        inbox = channels[index]
+        outbox = channels[index + 1] if index + 1 < len(channels) else None
+        cost = stages[index].cost
+        spent = 0.0
+        count = 0
+        start.wait()
+        while True:
+            item = inbox.get()
+            if item is CLOSED:
+                break
+            began = perf_counter()
+            for _ in range(cost):
+                pass
+            spent += perf_counter() - began
+            count += 1
+            if outbox is not None:
+                outbox.put(item)
+        if outbox is not None:
+            outbox.close()
+        busy[index][slot] = spent
+        processed[index][slot] = count
+
+    threads = [threading.Thread(target=source)]
+    for index, stage in enumerate(stages):
+        threads.extend(
+            threading.Thread(target=worker, args=(index, slot)) for slot in range(stage.workers)
+        )
+    for thread in threads:
+        thread.start()
+
+    depths = []
+    start.wait()
+    started = perf_counter()
+
+    def sample() -> None:
+        while not done.is_set():
+            depths.append((perf_counter() - started, [channel.depth for channel in channels]))
+            sleep(sample_interval)
+
+    sampler = threading.Thread(target=sample, daemon=True)
+    sampler.start()
+    for thread in threads:
+        thread.join()
+    elapsed = perf_counter() - started
+    done.set()
+    sampler.join()
+    depths.append((elapsed, [channel.depth for channel in channels]))
+
+    stage_stats = []
+    for index, stage in enumerate(stages):
+        samples = [sample[1][index] for sample in depths]
+        stage_stats.append(
+            {
+                "name": stage.name,
+                "workers": stage.workers,
+                "cost": stage.cost,
+                "processed": sum(processed[index]),
+                "busy": sum(busy[index]),
+                "utilization": sum(busy[index]) / (stage.workers * elapsed) if elapsed > 0 else 0.0,
+                "mean_depth": sum(samples) / len(samples),
+                "max_depth": channels[index].max_depth,
+            }
+        )
+    bottleneck = max(stage_stats, key=lambda stats: stats["utilization"])
+    return {
+        "items": items,
+        "elapsed": elapsed,
+        "throughput": items / elapsed if elapsed > 0 else float("inf"),
+        "stages": stage_stats,
+        "depths": depths,
+        "bottleneck": bottleneck["name"],
+    }
@@ -0,0 +1,251 @@
+"""Declarative benchmark plans.
+
+A plan is a TOML file with optional ``[defaults]`` and any number of
+``[[experiment]]`` tables::
+
+    workers = 2
+
+    [defaults]
+    implementations = ["dll", "sll", "array"]
+    operations = ["enqueue", "dequeue", "peek", "concat", "iconcat"]
+    payloads = ["small_int"]
+    repeats = 1
+    gc = "enabled"
+
+    [[experiment]]
+    name = "strings"
+    payloads = ["short_str", "bytes_1k"]
+    initial_size = 10000
+    max_size = 80000
+
+    [[experiment]]
+    name = "large"
+    implementations = ["array"]
+    sizes = [1000000]
+    operations = ["enqueue", "dequeue"]
+
+Every experiment expands into cells, one per (implementation, size,
+payload, gc mode, repeats). Experiments that share a cell share its
+measurement, with their operations merged, so its fixtures are built only
+once. Cells with the same size and payload form one job, which generates the
+payload once for all its implementations. Jobs run largest first on
+``workers`` processes, which keeps a long job from starting last.
+"""
+
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+if sys.version_info >= (3, 11):
+    import tomllib
+else:
+    import tomli as tomllib
+
+from analyze.benchmark import DOUBLING_OPERATIONS, measure_doubling_cell
+from analyze.gc_monitor import GCMode
+from analyze.implementations import DEFAULT_IMPLEMENTATIONS, IMPLEMENTATIONS
+from analyze.payloads import Payload, make_payloads
+
+EXPERIMENT_KEYS = {
+    "name",
+    "implementations",
+    "sizes",
+    "initial_size",
+    "max_size",
+    "operations",
+    "payloads",
+    "repeats",
+    "gc",
+}
+
+DEFAULTS = {
+    "implementations": list(DEFAULT_IMPLEMENTATIONS),
+    "operations": list(DOUBLING_OPERATIONS),
+    "payloads": [Payload.small_int.value],
+    "repeats": 1,
+    "gc": GCMode.enabled.value,
+    "initial_size": 10000,
+    "max_size": 160000,
+}
+
+
+class Cell(NamedTuple):
+    """One measured combination; experiments that agree on it share the result."""
+
+    implementation: str
+    size: int
+    payload: str
+    gc_mode: str
+    repeats: int
+
+
+def load_plan(path: Path) -> Dict[str, Any]:
+    """Read a plan file. Raises ValueError for invalid TOML or a bad ``workers``."""
+    with open(path, "rb") as handle:
+        try:
+            plan = tomllib.load(handle)
+        except tomllib.TOMLDecodeError as e:
+            raise ValueError(f"{path}: {e}") from None
+    workers = plan.get("workers", 1)
+    if not isinstance(workers, int) or isinstance(workers, bool) or workers < 1:
+        raise ValueError(f"{path}: workers must be a positive integer")
+    return plan
+
+
+def _choices(experiment: Dict[str, Any], key: str, allowed, name: str) -> List[str]:
+    values = experiment[key]
+    if not isinstance(values, list) or not values:
+        raise ValueError(f"experiment '{name}': {key} must be a non-empty list")
+    unknown = [value for value in values if value not in allowed]
+    if unknown:
+        raise ValueError(f"experiment '{name}': unknown {key} {', '.join(map(str, unknown))}")
+    return values
+
+
+def _sizes(experiment: Dict[str, Any], name: str) -> List[int]:
+    if "sizes" in experiment:
+        sizes = experiment["sizes"]
+    else:
+        sizes = []
+        size = experiment["initial_size"]
+        while isinstance(size, int) and size > 0 and size <= experiment["max_size"]:
+            sizes.append(size)
+            size *= 2
+    if not sizes or not all(isinstance(size, int) and size > 0 for size in sizes):
+        raise ValueError(f"experiment '{name}': sizes must be positive integers")
+    return sizes
+
+
+def expand_plan(
+    plan: Dict[str, Any]
+) -> Tuple[List[str], Dict[Cell, List[str]], Dict[Cell, Dict[str, List[str]]]]:
+    """Expand the experiments of a plan into cells.
+
+    Returns ``(names, operations, members)``: the experiment names in order,
+    the merged operations of every cell (in doubling order) and, per cell,
+    the experiments it belongs to with the operations each of them asked
+    for. Raises ValueError for invalid plans.
+    """
+    defaults = dict(DEFAULTS, **plan.get("defaults", {}))
+    experiments = plan.get("experiment", [])
+    if not experiments:
+        raise ValueError("the plan has no [[experiment]] tables")
+    names: List[str] = []
+    operations: Dict[Cell, List[str]] = {}
+    members: Dict[Cell, Dict[str, List[str]]] = {}
+    for index, entry in enumerate(experiments, 1):
+        name = str(entry.get("name", f"experiment-{index}"))
+        unknown = set(entry) - EXPERIMENT_KEYS
+        if unknown:
+            raise ValueError(f"experiment '{name}': unknown keys {', '.join(sorted(unknown))}")
+        if name in names:
+            raise ValueError(f"duplicate experiment name '{name}'")
+        names.append(name)
+        # A doubling range in the experiment replaces explicit sizes from the defaults
+        experiment = dict(defaults, **entry)
+        if "sizes" not in entry and ("initial_size" in entry or "max_size" in entry):
+            experiment.pop("sizes", None)
+        implementations = _choices(experiment, "implementations", IMPLEMENTATIONS, name)
+        requested = _choices(experiment, "operations", DOUBLING_OPERATIONS, name)
+        requested = [op for op in DOUBLING_OPERATIONS if op in requested]
+        payloads = _choices(experiment, "payloads", {payload.value for payload in Payload}, name)
+        gc_mode = experiment["gc"]
+        if gc_mode not in {mode.value for mode in GCMode}:
+            raise ValueError(f"experiment '{name}': unknown gc mode {gc_mode}")
+        repeats = experiment["repeats"]
+        if not isinstance(repeats, int) or repeats < 1:
+            raise ValueError(f"experiment '{name}': repeats must be a positive integer")
+        for implementation in implementations:
+            for size in _sizes(experiment, name):
+                for payload in payloads:
+                    cell = Cell(implementation, size, payload, gc_mode, repeats)
+                    merged = set(operations.get(cell, [])) | set(requested)
+                    operations[cell] = [op for op in DOUBLING_OPERATIONS if op in merged]
+                    members.setdefault(cell, {})[name] = requested
+    return names, operations, members
+
+
+def plan_jobs(operations: Dict[Cell, List[str]]) -> List[Dict[str, Any]]:
+    """Group cells by size, payload, GC mode and repeats into jobs, costliest first.
+
+    The cost estimate is elements times repeats times operations, which is
+    enough to order the jobs for longest-processing-time-first scheduling.
+    """
+    groups: Dict[Tuple[int, str, str, int], List[Tuple[str, List[str]]]] = {}
+    for cell, ops in operations.items():
+        groups.setdefault((cell.size, cell.payload, cell.gc_mode, cell.repeats), []).append(
+            (cell.implementation, ops)
+        )
+    jobs = [
+        {
+            "size": size,
+            "payload": payload,
+            "gc_mode": gc_mode,
+            "repeats": repeats,
+            "cells": cells,
+            "cost": size * repeats * sum(len(ops) for _, ops in cells),
+        }
+        for (size, payload, gc_mode, repeats), cells in groups.items()
+    ]
+    jobs.sort(key=lambda job: job["cost"], reverse=True)
+    return jobs
+
+
+def run_plan_job(job: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Measure every cell of a job, generating its payload once."""
+    items = make_payloads(Payload(job["payload"]), job["size"])
+    measured = []
+    for implementation, ops in job["cells"]:
+        noise: Dict[str, Dict] = {}
+        results = measure_doubling_cell(
+            IMPLEMENTATIONS[implementation],
+            job["size"],
+            ops,
+            GCMode(job["gc_mode"]),
+            repeats=job["repeats"],
+            noise=noise,
+            items=items,
+        )
+        measured.append(
+            {
+                "cell": Cell(implementation, job["size"], job["payload"], job["gc_mode"], job["repeats"]),
+                "results": results,
+                "noise": noise,
+            }
+        )
+    return measured
+
+
+def execute_jobs(
+    jobs: List[Dict[str, Any]],
+    workers: int = 1,
+    on_cell: Optional[Callable[[Cell, Dict[str, float], Dict[str, Dict]], None]] = None,
+) -> Dict[Cell, Dict[str, float]]:
+    """Run the jobs, on ``workers`` processes when more than one.
+
+    Jobs are submitted in the given order, so with ``plan_jobs`` the
+    costliest start first. ``on_cell(cell, results, noise)`` is called in
+    this process as cells complete. Several workers finish sooner but share
+    the machine, so their timings are noisier than those of a single worker.
+    """
+    results: Dict[Cell, Dict[str, float]] = {}
+
+    def collect(measured: List[Dict[str, Any]]) -> None:
+        for entry in measured:
+            cell = Cell(*entry["cell"])
+            results[cell] = entry["results"]
+            if on_cell is not None:
+                on_cell(cell, entry["results"], entry["noise"])
+
+    if workers < 1:
+        raise ValueError("workers must be at least 1")
+    if workers == 1:
+        for job in jobs:
+            collect(run_plan_job(job))
+        return results
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(run_plan_job, job) for job in jobs]
+        for future in as_completed(futures):
+            collect(future.result())
+    return results
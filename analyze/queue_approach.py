@@ -9,6 +9,7 @@ class QueueApproach(str, Enum):
     dll = "dll"
     sll = "sll"
     array = "array"
+    bankers = "bankers"
 
     def __str__(self) -> str:
         """Return string representation of the enum value."""
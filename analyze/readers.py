@@ -0,0 +1,108 @@
+"""Concurrent readers of a queue that one writer keeps updating.
+
+The writer slides a window over a stream of integers: it enqueues every
+item and dequeues the oldest once the queue holds ``window`` of them. Reader
+threads keep taking views of the queue, each reading its size and its first
+``scan`` elements, and checking that they are consecutive, i.e. that the
+view is consistent. A locked queue has to hold its lock for the whole view
+and so stalls the writer; a persistent queue hands out an immutable version
+and lets readers scan it without any lock.
+"""
+
+import threading
+from itertools import islice
+from time import perf_counter
+from typing import Any, Dict, List
+
+from analyze.persistent_queue import BankersQueue
+from analyze.sll_queue import BasicSLLQueue
+
+
+class LockedReaders:
+    """A BasicSLLQueue behind one lock, held by the writer and by every view."""
+
+    def __init__(self):
+        self._queue = BasicSLLQueue()
+        self._lock = threading.Lock()
+
+    def write(self, item: Any, window: int) -> None:
+        with self._lock:
+            self._queue.enqueue(item)
+            if self._queue.size() > window:
+                self._queue.dequeue()
+
+    def view(self, scan: int) -> List[Any]:
+        with self._lock:
+            return list(islice(self._queue, scan))
+
+
+class PersistentReaders:
+    """A BankersQueue whose readers scan the current version without locking."""
+
+    def __init__(self):
+        self._queue = BankersQueue()
+
+    def write(self, item: Any, window: int) -> None:
+        # The only writer, so the two updates need no lock
+        self._queue.enqueue(item)
+        if self._queue.size() > window:
+            self._queue.dequeue()
+
+    def view(self, scan: int) -> List[Any]:
+        return list(islice(self._queue.version(), scan))
+
+
+READER_QUEUES = {
+    "locked_sll": LockedReaders,
+    "bankers": PersistentReaders,
+}
+
+
+def run_readers(kind: str, readers: int, writes: int, window: int = 1000, scan: int = 100) -> Dict[str, Any]:
+    """Run one writer and ``readers`` reader threads until the writer is done.
+
+    Returns the elapsed time, the writer's throughput, the number of views,
+    their throughput, the mean and worst time of one view and the number of
+    inconsistent views (always 0 unless a queue is broken).
+    """
+    if readers < 1 or writes < 1 or window < 1 or scan < 1:
+        raise ValueError("readers, writes, window and scan must be positive")
+    shared = READER_QUEUES[kind]()
+    done = threading.Event()
+    ready = threading.Barrier(readers + 1)
+    stats = [{"views": 0, "busy": 0.0, "worst": 0.0, "inconsistent": 0} for _ in range(readers)]
+
+    def read(record: Dict[str, Any]) -> None:
+        ready.wait()
+        while not done.is_set():
+            start = perf_counter()
+            items = shared.view(scan)
+            elapsed = perf_counter() - start
+            if items and items != list(range(items[0], items[0] + len(items))):
+                record["inconsistent"] += 1
+            record["views"] += 1
+            record["busy"] += elapsed
+            record["worst"] = max(record["worst"], elapsed)
+
+    threads = [threading.Thread(target=read, args=(record,)) for record in stats]
+    for thread in threads:
+        thread.start()
+    ready.wait()
+    start_time = perf_counter()
+    for item in range(writes):
+        shared.write(item, window)
+    elapsed = perf_counter() - start_time
+    done.set()
+    for thread in threads:
+        thread.join()
+
+    views = sum(record["views"] for record in stats)
+    return {
+        "elapsed": elapsed,
+        "write_throughput": writes / elapsed,
+        "views": views,
+        "view_throughput": views / elapsed,
+        "mean_view": sum(record["busy"] for record in stats) / views if views else 0.0,
+        "worst_view": max(record["worst"] for record in stats),
+        "inconsistent": sum(record["inconsistent"] for record in stats),
+    }
@@ -0,0 +1,314 @@
+"""HTML and Markdown reports of a stored run.
+
+A report collects everything a run directory holds (see ``ResultStore``):
+the run parameters, the environment, the measured cells, a log-log plot per
+operation, the fitted complexity of every curve and the speedup of every
+implementation over a baseline. The HTML file embeds its plots as base64
+PNGs and needs nothing else; the Markdown file links the same PNGs, which
+are written next to it.
+
+Plots are drawn with matplotlib's object-oriented ``Figure`` API, without
+pyplot's global state, so they can be rendered in separate processes.
+"""
+
+import base64
+import html
+import io
+import json
+import math
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from analyze.benchmark import DOUBLING_OPERATIONS
+from analyze.gc_monitor import GCMode
+from analyze.payloads import Payload
+from analyze.results_store import ResultStore
+
+# {series: {operation: {size: seconds}}}
+Series = Dict[str, Dict[str, Dict[int, float]]]
+
+
+def series_name(record: Dict[str, Any]) -> str:
+    """Name the curve a cell belongs to: its implementation plus any non-default payload or GC mode."""
+    variant = [
+        value
+        for key, default in (("payload", Payload.small_int.value), ("gc_mode", GCMode.enabled.value))
+        for value in [record.get(key)]
+        if value is not None and value != default
+    ]
+    return record["implementation"] + (f" ({', '.join(variant)})" if variant else "")
+
+
+def load_series(store: ResultStore) -> Series:
+    """Return the valid times of a run's cells by series, operation and size.
+
+    Failed cells are left out, and when a cell was stored more than once the
+    latest value wins, as in ``ResultStore.completed_cells``.
+    """
+    series: Series = {}
+    for record in store.load():
+        seconds = record.get("seconds")
+        if not isinstance(seconds, (int, float)) or not math.isfinite(seconds):
+            continue
+        operations = series.setdefault(series_name(record), {})
+        operations.setdefault(record["operation"], {})[int(record["size"])] = float(seconds)
+    return series
+
+
+def ordered_operations(series: Series) -> List[str]:
+    """Return the operations present in ``series``, the doubling ones first in their usual order."""
+    present = {operation for operations in series.values() for operation in operations}
+    return [op for op in DOUBLING_OPERATIONS if op in present] + sorted(present - set(DOUBLING_OPERATIONS))
+
+
+def fit_slope(points: Dict[int, float]) -> Optional[float]:
+    """Return the least-squares slope of log(time) over log(size), or None with fewer than two sizes.
+
+    A slope near 0 means constant time, near 1 linear and near 2 quadratic.
+    """
+    logs = [(math.log(size), math.log(seconds)) for size, seconds in points.items() if size > 0 and seconds > 0]
+    if len({x for x, _ in logs}) < 2:
+        return None
+    mean_x = sum(x for x, _ in logs) / len(logs)
+    mean_y = sum(y for _, y in logs) / len(logs)
+    spread = sum((x - mean_x) ** 2 for x, _ in logs)
+    return sum((x - mean_x) * (y - mean_y) for x, y in logs) / spread
+
+
+def complexity_label(slope: Optional[float]) -> str:
+    """Return the complexity class nearest to a log-log slope."""
+    if slope is None:
+        return "-"
+    if slope < 0.5:
+        return "O(1)"
+    if slope < 1.5:
+        return "O(n)"
+    return "O(n²)"
+
+
+def speedup(baseline: Dict[int, float], other: Dict[int, float]) -> Optional[float]:
+    """Return baseline time over the other time at the largest size both measured."""
+    common = set(baseline) & set(other)
+    if not common:
+        return None
+    size = max(common)
+    return baseline[size] / other[size] if other[size] > 0 else None
+
+
+def render_plot(job: Tuple[str, Dict[str, Dict[int, float]]]) -> Tuple[str, bytes]:
+    """Draw the log-log plot of one operation and return it as PNG bytes."""
+    from matplotlib.figure import Figure
+
+    operation, curves = job
+    figure = Figure(figsize=(10, 6))
+    axis = figure.subplots()
+    for name, points in curves.items():
+        sizes = sorted(size for size, seconds in points.items() if seconds > 0)
+        if sizes:
+            axis.loglog(sizes, [points[size] * 1000 for size in sizes], marker="o", label=name.upper(), linewidth=2)
+    axis.set_title(f"Log-Log Plot for {operation.capitalize()} Operation", fontsize=16)
+    axis.set_xlabel("Log Queue Size", fontsize=14)
+    axis.set_ylabel("Log Time (ms)", fontsize=14)
+    axis.grid(True, which="both", linestyle="--", alpha=0.5)
+    if axis.get_legend_handles_labels()[0]:
+        axis.legend(fontsize=12)
+    figure.tight_layout()
+    buffer = io.BytesIO()
+    figure.savefig(buffer, format="png")
+    return operation, buffer.getvalue()
+
+
+def render_plots(series: Series, operations: Sequence[str], workers: int = 1) -> Dict[str, bytes]:
+    """Render the plot of every operation, on ``workers`` processes when more than one."""
+    jobs = [
+        (operation, {name: ops[operation] for name, ops in series.items() if operation in ops})
+        for operation in operations
+    ]
+    if workers <= 1 or len(jobs) <= 1:
+        return dict(map(render_plot, jobs))
+    with ProcessPoolExecutor(max_workers=min(workers, len(jobs))) as executor:
+        return dict(executor.map(render_plot, jobs))
+
+
+def _flatten(value: Any, prefix: str = "") -> List[Tuple[str, str]]:
+    """Turn nested metadata into (dotted key, text) rows."""
+    if isinstance(value, dict):
+        return [row for key, item in value.items() for row in _flatten(item, f"{prefix}{key}.")]
+    if isinstance(value, list) and all(not isinstance(item, (dict, list)) for item in value):
+        text = ", ".join(str(item) for item in value) or "-"
+    elif isinstance(value, (dict, list)):
+        text = json.dumps(value)
+    else:
+        text = "-" if value is None else str(value)
+    return [(prefix.rstrip("."), text)]
+
+
+def build_report(store: ResultStore, baseline: Optional[str] = None, workers: int = 1) -> Dict[str, Any]:
+    """Collect everything the report shows about a stored run.
+
+    ``baseline`` names the series the speedups are relative to; by default
+    it is the first one stored in the run. Raises ValueError when the
+    run has no valid cells or the baseline is not one of its series.
+    """
+    series = load_series(store)
+    if not series:
+        raise ValueError(f"run {store.run_id} has no measured cells")
+    baseline = baseline or next(iter(series))
+    if baseline not in series:
+        raise ValueError(f"unknown baseline '{baseline}', expected one of {', '.join(series)}")
+    operations = ordered_operations(series)
+    return {
+        "run_id": store.run_id,
+        "metadata": _flatten(store.read_metadata()),
+        "environment": _flatten(store.read_environment()),
+        "series": series,
+        "operations": operations,
+        "baseline": baseline,
+        "slopes": {
+            name: {op: fit_slope(ops[op]) if op in ops else None for op in operations}
+            for name, ops in series.items()
+        },
+        "speedups": {
+            name: {
+                op: speedup(series[baseline][op], ops[op]) if op in ops and op in series[baseline] else None
+                for op in operations
+            }
+            for name, ops in series.items()
+        },
+        "plots": render_plots(series, operations, workers),
+    }
+
+
+def _sizes(series: Series, operation: str) -> List[int]:
+    return sorted({size for ops in series.values() for size in ops.get(operation, {})})
+
+
+def _time(series: Series, name: str, operation: str, size: int) -> str:
+    seconds = series[name].get(operation, {}).get(size)
+    return "-" if seconds is None else f"{seconds * 1000:.4f}"
+
+
+def _slope_text(slope: Optional[float]) -> str:
+    return "-" if slope is None else f"{slope:.2f} {complexity_label(slope)}"
+
+
+def _speedup_text(ratio: Optional[float]) -> str:
+    return "-" if ratio is None else f"{ratio:.2f}x"
+
+
+def _markdown_table(header: Sequence[str], rows: Sequence[Sequence[str]]) -> List[str]:
+    def line(cells):
+        return "| " + " | ".join(str(cell).replace("|", "\\|") for cell in cells) + " |"
+
+    return [line(header), "|" + "|".join("---" for _ in header) + "|", *map(line, rows), ""]
+
+
+def _html_table(header: Sequence[str], rows: Sequence[Sequence[str]]) -> List[str]:
+    lines = ["<table>", "<tr>" + "".join(f"<th>{html.escape(str(cell))}</th>" for cell in header) + "</tr>"]
+    lines += ["<tr>" + "".join(f"<td>{html.escape(str(cell))}</td>" for cell in row) + "</tr>" for row in rows]
+    return lines + ["</table>"]
+
+
+def _sections(report: Dict[str, Any]) -> List[Tuple[str, Any]]:
+    """Return the report as ("heading" | "text", text), ("table", (header, rows)) and ("plot", operation) parts."""
+    series = report["series"]
+    names = list(series)
+    operations = report["operations"]
+    slopes = [[name.upper()] + [_slope_text(report["slopes"][name][op]) for op in operations] for name in names]
+    speedups = [
+        [name.upper()] + [_speedup_text(report["speedups"][name][op]) for op in operations] for name in names
+    ]
+    parts: List[Tuple[str, Any]] = [
+        ("heading", "Fitted Complexity"),
+        (
+            "text",
+            "Least-squares slope of log(time) over log(size): about 0 is constant, "
+            "1 linear and 2 quadratic time.",
+        ),
+        ("table", (["Queue", *operations], slopes)),
+        ("heading", f"Speedup over {report['baseline'].upper()}"),
+        ("text", "Baseline time over the implementation's time at the largest size both measured."),
+        ("table", (["Queue", *operations], speedups)),
+    ]
+    for operation in operations:
+        times = [
+            [f"{size:,}"] + [_time(series, name, operation, size) for name in names]
+            for size in _sizes(series, operation)
+        ]
+        parts += [
+            ("heading", f"{operation.capitalize()} Times (ms)"),
+            ("plot", operation),
+            ("table", (["Size", *(name.upper() for name in names)], times)),
+        ]
+    parts += [
+        ("heading", "Run Parameters"),
+        ("table", (["Parameter", "Value"], report["metadata"])),
+        ("heading", "Environment"),
+        ("table", (["Property", "Value"], report["environment"])),
+    ]
+    return parts
+
+
+def to_markdown(report: Dict[str, Any], plot_files: Dict[str, str]) -> str:
+    """Render the report as Markdown that links the plot files by relative path."""
+    lines = [f"# Queue Performance Report, Run {report['run_id']}", ""]
+    for kind, content in _sections(report):
+        if kind == "heading":
+            lines += [f"## {content}", ""]
+        elif kind == "text":
+            lines += [content, ""]
+        elif kind == "plot":
+            lines += [f"![{content} log-log plot]({plot_files[content]})", ""]
+        else:
+            lines += _markdown_table(*content)
+    return "\n".join(lines)
+
+
+_STYLE = """
+body { font-family: sans-serif; margin: 2em auto; max-width: 1100px; color: #222; }
+table { border-collapse: collapse; margin: 1em 0; }
+th, td { border: 1px solid #ccc; padding: 0.3em 0.7em; text-align: right; }
+th { background: #f0e6f6; }
+td:first-child, th:first-child { text-align: left; }
+img { max-width: 100%; }
+"""
+
+
+def to_html(report: Dict[str, Any]) -> str:
+    """Render the report as one HTML page with the plots embedded."""
+    title = html.escape(f"Queue Performance Report, Run {report['run_id']}")
+    lines = [
+        "<!DOCTYPE html>",
+        '<html lang="en">',
+        f'<head><meta charset="utf-8"><title>{title}</title><style>{_STYLE}</style></head>',
+        "<body>",
+        f"<h1>{title}</h1>",
+    ]
+    for kind, content in _sections(report):
+        if kind == "heading":
+            lines.append(f"<h2>{html.escape(content)}</h2>")
+        elif kind == "text":
+            lines.append(f"<p>{html.escape(content)}</p>")
+        elif kind == "plot":
+            encoded = base64.b64encode(report["plots"][content]).decode("ascii")
+            lines.append(f'<img alt="{html.escape(content)} log-log plot" src="data:image/png;base64,{encoded}">')
+        else:
+            lines += _html_table(*content)
+    lines += ["</body>", "</html>", ""]
+    return "\n".join(lines)
+
+
+def write_report_files(report: Dict[str, Any], directory: Path) -> Tuple[Path, Path]:
+    """Write ``report.html``, ``report.md`` and the plot PNGs the Markdown links to."""
+    directory = Path(directory)
+    plot_files = {}
+    for operation, png in report["plots"].items():
+        name = f"report_{operation}.png"
+        (directory / name).write_bytes(png)
+        plot_files[operation] = name
+    html_path = directory / "report.html"
+    markdown_path = directory / "report.md"
+    html_path.write_text(to_html(report), encoding="utf-8")
+    markdown_path.write_text(to_markdown(report, plot_files), encoding="utf-8")
+    return html_path, markdown_path
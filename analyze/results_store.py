@@ -0,0 +1,102 @@
+"""Durable, append-only storage of doubling experiment results."""
+
+import json
+import math
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+
+class ResultStore:
+    """Results of one doubling run, stored under ``<root>/runs/<run_id>``.
+
+    Every measured (implementation, size, operation) cell is appended to
+    ``cells.jsonl`` and flushed to disk straight away, so an interrupted or
+    killed sweep keeps everything it measured.
+    """
+
+    @staticmethod
+    def exists(root: Path, run_id: str) -> bool:
+        """Check whether a run with this id has been stored under ``root``."""
+        return (Path(root) / "runs" / run_id / "run.json").exists()
+
+    def __init__(self, root: Path, run_id: Optional[str] = None):
+        self.run_id = run_id or f"{time.strftime('%Y%m%d-%H%M%S')}-{os.getpid()}"
+        self.path = Path(root) / "runs" / self.run_id
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.cells_path = self.path / "cells.jsonl"
+        self.metadata_path = self.path / "run.json"
+        self.environment_path = self.path / "environment.json"
+
+    def write_metadata(self, metadata: Dict[str, Any]) -> None:
+        """Save the parameters the run was started with."""
+        with open(self.metadata_path, "w") as handle:
+            json.dump(metadata, handle, indent=2)
+
+    def read_metadata(self) -> Dict[str, Any]:
+        """Return the saved run parameters, or an empty dict if there are none."""
+        if not self.metadata_path.exists():
+            return {}
+        with open(self.metadata_path) as handle:
+            return json.load(handle)
+
+    def write_environment(self, environment: Dict[str, Any]) -> None:
+        """Save the machine description and noise checks of the run."""
+        with open(self.environment_path, "w") as handle:
+            json.dump(environment, handle, indent=2)
+
+    def read_environment(self) -> Dict[str, Any]:
+        """Return the saved environment, or an empty dict if there is none."""
+        if not self.environment_path.exists():
+            return {}
+        with open(self.environment_path) as handle:
+            return json.load(handle)
+
+    def write_report(self, report: Dict[str, Any]) -> None:
+        """Save a combined report of the run as ``report.json``."""
+        with open(self.path / "report.json", "w") as handle:
+            json.dump(report, handle, indent=2)
+
+    def append(self, implementation: str, size: int, operation: str, seconds: float, **extra) -> None:
+        """Persist one measured cell."""
+        record = {
+            "implementation": implementation,
+            "size": size,
+            "operation": operation,
+            "seconds": seconds,
+            **extra,
+        }
+        with open(self.cells_path, "a") as handle:
+            handle.write(json.dumps(record) + "\n")
+            handle.flush()
+            os.fsync(handle.fileno())
+
+    def load(self) -> List[Dict[str, Any]]:
+        """Return every stored cell, skipping a line cut short by a crash."""
+        if not self.cells_path.exists():
+            return []
+        records = []
+        with open(self.cells_path) as handle:
+            for line in handle:
+                try:
+                    records.append(json.loads(line))
+                except json.JSONDecodeError:
+                    continue
+        return records
+
+    def completed_cells(self) -> Dict[Tuple[str, int, str], float]:
+        """Return the valid measured time of every stored cell.
+
+        Cells whose time is missing or not a finite number (a failed
+        measurement) are left out so that resuming measures them again. When
+        a cell was stored more than once the latest value wins.
+        """
+        cells = {}
+        for record in self.load():
+            seconds = record.get("seconds")
+            if not isinstance(seconds, (int, float)) or not math.isfinite(seconds):
+                continue
+            key = (record["implementation"], int(record["size"]), record["operation"])
+            cells[key] = float(seconds)
+        return cells
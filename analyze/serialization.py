@@ -0,0 +1,140 @@
+"""Compact binary encoding of queue contents.
+
+The encoding starts with a magic string, a one-byte kind and the item count.
+Queues holding only ints that fit in 64 bits or only floats are stored as
+one packed array, and queues of strings as one NUL-separated UTF-8 string
+when no element contains a NUL; anything else is stored item by item behind
+a type tag. Only ints, floats, strings, bytes, booleans and None can be
+encoded.
+"""
+
+import struct
+import sys
+from array import array
+from typing import Any, Iterable, List
+
+MAGIC = b"QUE1"
+_HEADER = struct.Struct("<4scQ")
+_INT = struct.Struct("<q")
+_FLOAT = struct.Struct("<d")
+_LENGTH = struct.Struct("<I")
+
+KIND_INT64 = b"q"
+KIND_FLOAT64 = b"d"
+KIND_STRINGS = b"s"
+KIND_TAGGED = b"t"
+
+
+def _packed(typecode: str, items: List[Any]) -> bytes:
+    values = array(typecode, items)
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values.tobytes()
+
+
+def _unpacked(typecode: str, data: bytes) -> List[Any]:
+    values = array(typecode)
+    values.frombytes(data)
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values.tolist()
+
+
+def encode_items(items: Iterable[Any]) -> bytes:
+    """Encode a sequence of primitive values front to back."""
+    items = items if isinstance(items, list) else list(items)
+    header = _HEADER.pack
+    types = set(map(type, items))
+    if types == {int}:
+        try:
+            return header(MAGIC, KIND_INT64, len(items)) + _packed("q", items)
+        except OverflowError:
+            pass
+    elif types == {float}:
+        return header(MAGIC, KIND_FLOAT64, len(items)) + _packed("d", items)
+    elif types == {str}:
+        joined = "\0".join(items)
+        # Any extra separator means some element contains a NUL itself
+        if joined.count("\0") == len(items) - 1:
+            return header(MAGIC, KIND_STRINGS, len(items)) + joined.encode("utf-8")
+
+    parts = [header(MAGIC, KIND_TAGGED, len(items))]
+    append = parts.append
+    for item in items:
+        kind = type(item)
+        if item is None:
+            append(b"n")
+        elif kind is bool:
+            append(b"T" if item else b"F")
+        elif kind is int:
+            if -(2 ** 63) <= item < 2 ** 63:
+                append(b"i" + _INT.pack(item))
+            else:
+                raw = item.to_bytes((item.bit_length() + 8) // 8, "little", signed=True)
+                append(b"I" + _LENGTH.pack(len(raw)) + raw)
+        elif kind is float:
+            append(b"f" + _FLOAT.pack(item))
+        elif kind is str:
+            raw = item.encode("utf-8")
+            append(b"s" + _LENGTH.pack(len(raw)) + raw)
+        elif kind is bytes:
+            append(b"b" + _LENGTH.pack(len(item)) + item)
+        else:
+            raise TypeError(f"cannot encode {kind.__name__} items")
+    return b"".join(parts)
+
+
+def decode_items(data: bytes) -> List[Any]:
+    """Decode the values written by ``encode_items``."""
+    if len(data) < _HEADER.size:
+        raise ValueError("truncated queue data")
+    magic, kind, count = _HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise ValueError("not queue data")
+    body = memoryview(data)[_HEADER.size:]
+    if kind == KIND_INT64 or kind == KIND_FLOAT64:
+        if len(body) != 8 * count:
+            raise ValueError("truncated queue data")
+        return _unpacked(kind.decode(), body)
+    if kind == KIND_STRINGS:
+        items = bytes(body).decode("utf-8").split("\0")
+        if len(items) != count:
+            raise ValueError("truncated queue data")
+        return items
+    if kind != KIND_TAGGED:
+        raise ValueError(f"unknown queue data kind {kind!r}")
+
+    items: List[Any] = [None] * count
+    offset = _HEADER.size
+    try:
+        for index in range(count):
+            tag = data[offset:offset + 1]
+            offset += 1
+            if tag == b"i":
+                items[index] = _INT.unpack_from(data, offset)[0]
+                offset += 8
+            elif tag == b"f":
+                items[index] = _FLOAT.unpack_from(data, offset)[0]
+                offset += 8
+            elif tag in (b"s", b"b", b"I"):
+                length = _LENGTH.unpack_from(data, offset)[0]
+                offset += 4
+                raw = data[offset:offset + length]
+                if len(raw) != length:
+                    raise ValueError("truncated queue data")
+                offset += length
+                if tag == b"s":
+                    items[index] = raw.decode("utf-8")
+                elif tag == b"b":
+                    items[index] = bytes(raw)
+                else:
+                    items[index] = int.from_bytes(raw, "little", signed=True)
+            elif tag == b"T":
+                items[index] = True
+            elif tag == b"F":
+                items[index] = False
+            elif tag != b"n":
+                raise ValueError(f"unknown item tag {tag!r}")
+    except struct.error:
+        raise ValueError("truncated queue data") from None
+    return items
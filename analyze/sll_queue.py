@@ -1,6 +1,10 @@
 """A basic Singly Linked List implementation for a Queue."""
 
-from typing import Any, Optional
+import weakref
+from typing import Any, Dict, Iterator, Optional
+
+from analyze.node_pool import NodePool
+from analyze.serialization import decode_items, encode_items
 
 class Node:
     """Represents a node in the singly linked list."""
@@ -9,15 +13,74 @@ class Node:
         self.next: Optional[Node] = None
 
 class BasicSLLQueue:
-    """A Singly Linked List implementation of a Queue (FIFO)."""
-    def __init__(self):
+    """A Singly Linked List implementation of a Queue (FIFO).
+
+    With ``pool_size`` > 0 dequeued nodes are recycled through a bounded free
+    list instead of being reallocated on every enqueue.
+
+    ``snapshot`` returns a copy that shares the nodes. Every queue only looks
+    at its own ``_size`` nodes from ``_head``, so dequeues just move the head
+    and the first sharer to enqueue can link past the shared tail; a later
+    sharer finds that link taken and copies its nodes first.
+    """
+    def __init__(self, pool_size: int = 0):
         self._head: Optional[Node] = None
         self._tail: Optional[Node] = None
         self._size: int = 0
+        self._pool: Optional[NodePool] = NodePool(Node, pool_size) if pool_size else None
+        # Queues sharing nodes with this one, or None when it owns them alone
+        self._share: Optional[weakref.WeakSet] = None
+
+    def snapshot(self) -> "BasicSLLQueue":
+        """Return a copy of the queue that shares its nodes (O(1))."""
+        if self._share is None:
+            self._share = weakref.WeakSet([self])
+        clone = BasicSLLQueue(self._pool.max_size if self._pool is not None else 0)
+        clone._head = self._head
+        clone._tail = self._tail
+        clone._size = self._size
+        clone._share = self._share
+        self._share.add(clone)
+        return clone
+
+    def _shared(self) -> bool:
+        """Check whether another live queue still shares nodes with this one."""
+        if self._share is not None and len(self._share) < 2:
+            self._share = None
+        return self._share is not None
+
+    def _unshare(self) -> None:
+        """Copy this queue's nodes so it no longer shares any (O(n))."""
+        node = self._head
+        size = self._size
+        self._share.discard(self)
+        self._share = None
+        self._head = None
+        self._tail = None
+        self._size = 0
+        for _ in range(size):
+            self.enqueue(node.data)
+            node = node.next
+
+    def unshare(self) -> None:
+        """Take private copies of any nodes shared with a snapshot now (O(n) if shared, else O(1)).
+
+        Later operations then take the unshared paths, which clear links and
+        recycle nodes, instead of copying on the first conflicting write.
+        """
+        if self._share is not None and self._shared():
+            self._unshare()
+
+    def _claim_tail(self) -> None:
+        """Copy the nodes first if another sharer already linked past our tail."""
+        if self._share is not None and self._tail is not None and self._tail.next is not None:
+            if self._shared():
+                self._unshare()
 
     def enqueue(self, value: Any) -> None:
         """Add an element to the back of the queue (O(1))."""
-        new_node = Node(value)
+        self._claim_tail()
+        new_node = Node(value) if self._pool is None else self._pool.acquire(value)
         if self._tail is None:
             self._head = new_node
             self._tail = new_node
@@ -30,11 +93,16 @@ class BasicSLLQueue:
         """Remove and return the front element of the queue (O(1))."""
         if self.is_empty():
             raise IndexError("dequeue from empty queue")
-        value = self._head.data
-        self._head = self._head.next
-        if self._head is None:
-            self._tail = None
+        node = self._head
+        value = node.data
         self._size -= 1
+        if self._size == 0:
+            self._head = None
+            self._tail = None
+        else:
+            self._head = node.next
+        if self._pool is not None and not self._shared():
+            self._pool.release(node)
         return value
 
     def peek(self) -> Any:
@@ -51,15 +119,61 @@ class BasicSLLQueue:
         """Check if the queue is empty (O(1))."""
         return self._size == 0
 
+    def pool_stats(self) -> Optional[Dict[str, int]]:
+        """Return the node pool counters, or None when pooling is off."""
+        return None if self._pool is None else self._pool.stats()
+
+    def __iter__(self) -> Iterator[Any]:
+        """Yield the elements from front to back without removing them."""
+        node = self._head
+        for _ in range(self._size):
+            yield node.data
+            node = node.next
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Pickle the elements as a flat list instead of a recursive chain of nodes."""
+        return {"items": list(self), "pool_size": self._pool.max_size if self._pool is not None else 0}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__init__(state["pool_size"])
+        self._extend(state["items"])
+
+    def _extend(self, items) -> None:
+        """Append ``items`` in one pass, linking fresh nodes directly."""
+        self._claim_tail()
+        tail = self._tail
+        count = 0
+        for item in items:
+            node = Node(item)
+            if tail is None:
+                self._head = node
+            else:
+                tail.next = node
+            tail = node
+            count += 1
+        self._tail = tail
+        self._size += count
+
+    def to_bytes(self) -> bytes:
+        """Encode the elements in the compact format of ``analyze.serialization``."""
+        return encode_items(self)
+
+    @classmethod
+    def from_bytes(cls, data: bytes, pool_size: int = 0) -> "BasicSLLQueue":
+        """Build a queue from the output of ``to_bytes``."""
+        queue = cls(pool_size)
+        queue._extend(decode_items(data))
+        return queue
+
     def __add__(self, other: "BasicSLLQueue") -> "BasicSLLQueue":
         """Creates a new queue by merging two existing queues (O(n))."""
-        new_queue = BasicSLLQueue()
+        new_queue = BasicSLLQueue(self._pool.max_size if self._pool is not None else 0)
         current = self._head
-        while current:
+        for _ in range(self._size):
             new_queue.enqueue(current.data)
             current = current.next
         current = other._head
-        while current:
+        for _ in range(other._size):
             new_queue.enqueue(current.data)
             current = current.next
         return new_queue
@@ -67,6 +181,10 @@ class BasicSLLQueue:
     def __iadd__(self, other: "BasicSLLQueue") -> "BasicSLLQueue":
         """Merges another queue into the current queue in place (O(n))."""
         if other._head:
+            if other._share is not None and other._shared():
+                # Its nodes still belong to other queues too
+                other._unshare()
+            self._claim_tail()
             if not self._head:
                 self._head = other._head
                 self._tail = other._tail
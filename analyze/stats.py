@@ -0,0 +1,148 @@
+"""Significance tests for timings of competing implementations.
+
+Timings are skewed and have outliers, so nothing here assumes normality:
+confidence intervals come from the percentile bootstrap and differences are
+tested with the Mann–Whitney U test. With several pairs per operation the
+p-values are adjusted with Holm's method, which keeps the chance of any
+false "significant" label at ``alpha``.
+"""
+
+import math
+import random
+import statistics
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from analyze.benchmark import percentile
+
+
+def bootstrap_ci(
+    values: Sequence[float],
+    statistic: Callable[[Sequence[float]], float] = statistics.median,
+    confidence: float = 0.95,
+    resamples: int = 2000,
+    rng: Optional[random.Random] = None,
+) -> Tuple[float, float]:
+    """Return the percentile bootstrap interval of ``statistic`` over ``values``."""
+    if not values:
+        return math.nan, math.nan
+    rng = rng or random.Random()
+    estimates = sorted(statistic(rng.choices(values, k=len(values))) for _ in range(resamples))
+    tail = (1 - confidence) / 2
+    return percentile(estimates, tail), percentile(estimates, 1 - tail)
+
+
+def ratio_ci(
+    a: Sequence[float],
+    b: Sequence[float],
+    confidence: float = 0.95,
+    resamples: int = 2000,
+    rng: Optional[random.Random] = None,
+) -> Tuple[float, float]:
+    """Return the bootstrap interval of ``median(a) / median(b)``, resampling both."""
+    if not a or not b:
+        return math.nan, math.nan
+    rng = rng or random.Random()
+    estimates = []
+    for _ in range(resamples):
+        denominator = statistics.median(rng.choices(b, k=len(b)))
+        numerator = statistics.median(rng.choices(a, k=len(a)))
+        estimates.append(numerator / denominator if denominator > 0 else math.inf)
+    estimates.sort()
+    tail = (1 - confidence) / 2
+    return percentile(estimates, tail), percentile(estimates, 1 - tail)
+
+
+def _ranks(values: Sequence[float]) -> List[float]:
+    """Return the 1-based ranks of ``values``, averaging the ranks of ties."""
+    order = sorted(range(len(values)), key=values.__getitem__)
+    ranks = [0.0] * len(values)
+    start = 0
+    while start < len(order):
+        end = start
+        while end + 1 < len(order) and values[order[end + 1]] == values[order[start]]:
+            end += 1
+        for index in order[start : end + 1]:
+            ranks[index] = (start + end) / 2 + 1
+        start = end + 1
+    return ranks
+
+
+def mann_whitney_u(a: Sequence[float], b: Sequence[float]) -> Tuple[float, float]:
+    """Return the U statistic of ``a`` and the two-sided p-value.
+
+    The p-value uses the normal approximation with tie and continuity
+    corrections, which is adequate from about five values per sample.
+    """
+    n1, n2 = len(a), len(b)
+    if n1 == 0 or n2 == 0:
+        raise ValueError("both samples need at least one value")
+    ranks = _ranks(list(a) + list(b))
+    u = sum(ranks[:n1]) - n1 * (n1 + 1) / 2
+    n = n1 + n2
+    ties = {}
+    for rank in ranks:
+        ties[rank] = ties.get(rank, 0) + 1
+    tie_term = sum(t ** 3 - t for t in ties.values()) / (n * (n - 1)) if n > 1 else 0
+    variance = n1 * n2 / 12 * ((n + 1) - tie_term)
+    if variance <= 0:
+        # Every value is the same
+        return u, 1.0
+    z = max(abs(u - n1 * n2 / 2) - 0.5, 0) / math.sqrt(variance)
+    return u, math.erfc(z / math.sqrt(2))
+
+
+def holm(p_values: Sequence[float]) -> List[float]:
+    """Return Holm's step-down adjustment of ``p_values``, in the same order."""
+    order = sorted(range(len(p_values)), key=p_values.__getitem__)
+    adjusted = [0.0] * len(p_values)
+    running = 0.0
+    for step, index in enumerate(order):
+        running = max(running, min((len(p_values) - step) * p_values[index], 1.0))
+        adjusted[index] = running
+    return adjusted
+
+
+def compare_samples(
+    samples: Dict[str, Sequence[float]],
+    alpha: float = 0.05,
+    confidence: float = 0.95,
+    resamples: int = 2000,
+    seed: Optional[int] = None,
+) -> Dict[str, Any]:
+    """Compare the timings of several implementations of one operation.
+
+    Returns ``{"summary": {name: {"median", "low", "high"}}, "pairs": [...]}``.
+    Every pair ``(a, b)`` holds the medians' ``ratio`` a/b with its interval,
+    the U statistic, the raw and Holm-adjusted p-values and ``significant``,
+    which is true when the adjusted p-value is below ``alpha``.
+    """
+    rng = random.Random(seed)
+    names = list(samples)
+    summary = {}
+    for name in names:
+        low, high = bootstrap_ci(samples[name], confidence=confidence, resamples=resamples, rng=rng)
+        summary[name] = {"median": statistics.median(samples[name]), "low": low, "high": high}
+    pairs = []
+    for i, first in enumerate(names):
+        for second in names[i + 1 :]:
+            u, p = mann_whitney_u(samples[first], samples[second])
+            low, high = ratio_ci(samples[first], samples[second], confidence, resamples, rng)
+            pairs.append(
+                {
+                    "a": first,
+                    "b": second,
+                    "ratio": (
+                        summary[first]["median"] / summary[second]["median"]
+                        if summary[second]["median"] > 0
+                        else math.inf
+                    ),
+                    "low": low,
+                    "high": high,
+                    "u": u,
+                    "p": p,
+                }
+            )
+    for pair, adjusted in zip(pairs, holm([pair["p"] for pair in pairs])):
+        pair["p_adjusted"] = adjusted
+        pair["significant"] = adjusted < alpha
+    return {"summary": summary, "pairs": pairs}
@@ -2,6 +2,7 @@
 
 import functools
 import time
+from typing import Callable, Dict, Optional
 
 class TimingResult:
     """Store timing results for a data structure's operations."""
@@ -44,3 +45,56 @@ def timed(operation_name: str):
         return wrapper
 
     return decorator
+
+
+def _elapsed_ns(func: Callable[[], object]) -> int:
+    start = time.perf_counter_ns()
+    func()
+    return time.perf_counter_ns() - start
+
+
+class HarnessBaseline:
+    """Calibrated cost of the timing harness without any queue work.
+
+    The timed lambdas are list comprehensions such as
+    ``[queue.peek() for _ in range(n)]``, so every measurement also pays for
+    the loop and the list appends. ``loop(count)`` times the same
+    comprehension with an empty body and ``call()`` an empty call between two
+    clock reads. Each is the minimum over ``repeats`` runs, since noise only
+    ever adds time.
+    """
+
+    def __init__(self, repeats: int = 5):
+        self.repeats = repeats
+        self._loops: Dict[int, float] = {}
+        self._call: Optional[float] = None
+
+    def _min_seconds(self, func: Callable[[], object]) -> float:
+        # Warm up once, then keep the fastest run
+        func()
+        return min(_elapsed_ns(func) for _ in range(self.repeats)) / 1e9
+
+    def loop(self, count: int) -> float:
+        """Return the seconds spent by the harness loop over ``count`` elements."""
+        if count not in self._loops:
+            self._loops[count] = self._min_seconds(lambda: [None for _ in range(count)])
+        return self._loops[count]
+
+    def call(self) -> float:
+        """Return the seconds spent calling an empty timed function."""
+        if self._call is None:
+            self._call = self._min_seconds(lambda: None)
+        return self._call
+
+    def overhead(self, iterations: int) -> float:
+        """Return the harness cost of a timed function looping ``iterations`` times (0 for a single call)."""
+        return self.loop(iterations) if iterations else self.call()
+
+    def net(self, seconds: float, iterations: int) -> float:
+        """Return ``seconds`` minus the harness cost, never below zero."""
+        return max(seconds - self.overhead(iterations), 0.0)
+
+    @staticmethod
+    def resolution() -> float:
+        """Return the resolution of the clock used for timing, in seconds."""
+        return time.get_clock_info("perf_counter").resolution
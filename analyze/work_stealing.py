@@ -0,0 +1,130 @@
+"""A work-stealing deque built on BasicDLLQueue and a scheduler to exercise it."""
+
+import random
+import threading
+from time import perf_counter, sleep
+from typing import Any, Dict, List, Optional
+
+from analyze.dll_queue import BasicDLLQueue
+
+
+class WorkStealingDeque:
+    """Task deque owned by one worker and open to thieves.
+
+    The owner pushes and pops at the back, so it keeps working on the task it
+    spawned most recently, while thieves take the oldest tasks from the front.
+    BasicDLLQueue is not thread-safe, so every operation holds a lock; a
+    thief moves its whole batch with one O(1) splice under that lock.
+    """
+
+    def __init__(self, pool_size: int = 0):
+        self._deque = BasicDLLQueue(pool_size)
+        self._lock = threading.Lock()
+
+    def push(self, task: Any) -> None:
+        """Owner: add a task at the back."""
+        with self._lock:
+            self._deque.enqueue(task)
+
+    def pop(self) -> Optional[Any]:
+        """Owner: take the newest task, or None when the deque is empty."""
+        with self._lock:
+            if self._deque.is_empty():
+                return None
+            return self._deque.pop_back()
+
+    def steal(self, max_items: int = 1) -> BasicDLLQueue:
+        """Thief: take up to ``max_items`` of the oldest tasks as a new queue."""
+        with self._lock:
+            return self._deque.split_front(max_items)
+
+    def push_batch(self, batch: BasicDLLQueue) -> None:
+        """Owner: append a stolen batch at the back. O(1)."""
+        with self._lock:
+            self._deque += batch
+
+    def __len__(self) -> int:
+        return len(self._deque)
+
+
+def run_scheduler(workers: int, depth: int, work: int = 0, steal_half: bool = True,
+                  seed: int = 0) -> Dict[str, Any]:
+    """Run a fork/join task tree on ``workers`` threads with work stealing.
+
+    Every task at ``depth`` > 0 spawns two children one level down, so the
+    tree holds ``2 ** (depth + 1) - 1`` tasks; leaves spin for ``work``
+    iterations. Everything starts on worker 0 and idle workers steal from a
+    random victim, either half of its tasks or a single one. Returns the
+    elapsed time, steal counters and the number of tasks each worker ran.
+    """
+    total = 2 ** (depth + 1) - 1
+    deques = [WorkStealingDeque() for _ in range(workers)]
+    executed = [0] * workers
+    steals = [0] * workers
+    stolen = [0] * workers
+    failed = [0] * workers
+    deques[0].push(depth)
+    start = threading.Barrier(workers + 1)
+
+    def worker(index: int) -> None:
+        own = deques[index]
+        rng = random.Random(seed + index)
+        start.wait()
+        while True:
+            task = own.pop()
+            if task is None:
+                if sum(executed) >= total:
+                    return
+                if workers == 1:
+                    continue
+                victim = deques[rng.randrange(workers - 1)]
+                if victim is own:
+                    victim = deques[workers - 1]
+                want = max(len(victim) // 2, 1) if steal_half else 1
+                batch = victim.steal(want)
+                if batch.is_empty():
+                    failed[index] += 1
+                    # Give the GIL to a worker that has tasks
+                    sleep(0)
+                    continue
+                steals[index] += 1
+                stolen[index] += len(batch)
+                own.push_batch(batch)
+                continue
+            if task > 0:
+                own.push(task - 1)
+                own.push(task - 1)
+            else:
+                for _ in range(work):
+                    pass
+            executed[index] += 1
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(workers)]
+    for thread in threads:
+        thread.start()
+    start.wait()
+    started = perf_counter()
+    for thread in threads:
+        thread.join()
+    elapsed = perf_counter() - started
+
+    return {
+        "workers": workers,
+        "tasks": total,
+        "elapsed": elapsed,
+        "steals": sum(steals),
+        "stolen": sum(stolen),
+        "failed_steals": sum(failed),
+        "executed": list(executed),
+    }
+
+
+def worker_counts(max_workers: int) -> List[int]:
+    """Return 1, 2, 4, ... up to ``max_workers`` (always including it)."""
+    counts = []
+    count = 1
+    while count < max_workers:
+        counts.append(count)
+        count *= 2
+    counts.append(max_workers)
+    return counts
@@ -0,0 +1,180 @@
+"""Algorithms that use a queue as their work list, for benchmarking whole workloads.
+
+Each workload builds its input once from a size and a seed, outside any timed
+region, and then runs the same algorithm with whichever queue class it is
+given, so the implementations can be compared inside real code.
+"""
+
+import random
+import tracemalloc
+from typing import Any, Callable, Dict, List, NamedTuple, Tuple
+
+from analyze.benchmark import time_operation
+from analyze.gc_monitor import GCMode
+
+
+def random_graph(nodes: int, degree: int = 4, seed: int = 0) -> List[List[int]]:
+    """Return the adjacency lists of a connected undirected random graph.
+
+    A random spanning tree keeps every node reachable from node 0, and
+    random extra edges bring the average degree up to about ``degree``.
+    """
+    rng = random.Random(seed)
+    graph: List[List[int]] = [[] for _ in range(nodes)]
+    for node in range(1, nodes):
+        parent = rng.randrange(node)
+        graph[node].append(parent)
+        graph[parent].append(node)
+    for _ in range(max(nodes * (degree - 2) // 2, 0)):
+        a, b = rng.randrange(nodes), rng.randrange(nodes)
+        graph[a].append(b)
+        graph[b].append(a)
+    return graph
+
+
+def bfs(queue_class, graph: List[List[int]], source: int = 0) -> List[int]:
+    """Return the hop distance of every node from ``source`` (-1 if unreachable)."""
+    distance = [-1] * len(graph)
+    distance[source] = 0
+    frontier = queue_class()
+    frontier.enqueue(source)
+    while not frontier.is_empty():
+        node = frontier.dequeue()
+        for neighbour in graph[node]:
+            if distance[neighbour] < 0:
+                distance[neighbour] = distance[node] + 1
+                frontier.enqueue(neighbour)
+    return distance
+
+
+class TreeNode:
+    """A node of an n-ary tree."""
+
+    __slots__ = ("value", "children")
+
+    def __init__(self, value: int):
+        self.value = value
+        self.children: List["TreeNode"] = []
+
+
+def random_tree(nodes: int, max_children: int = 4, seed: int = 0) -> TreeNode:
+    """Return the root of a random tree of ``nodes`` nodes, built level by level."""
+    rng = random.Random(seed)
+    root = TreeNode(0)
+    level = [root]
+    value = 1
+    while value < nodes:
+        next_level = []
+        for parent in level:
+            for _ in range(rng.randint(1, max_children)):
+                if value == nodes:
+                    break
+                child = TreeNode(value)
+                parent.children.append(child)
+                next_level.append(child)
+                value += 1
+        level = next_level
+    return root
+
+
+def level_order(queue_class, root: TreeNode) -> List[int]:
+    """Return the number of nodes on each level of the tree, top down."""
+    widths = []
+    current = queue_class()
+    current.enqueue(root)
+    width = 1
+    while width:
+        widths.append(width)
+        next_width = 0
+        for _ in range(width):
+            node = current.dequeue()
+            for child in node.children:
+                current.enqueue(child)
+            next_width += len(node.children)
+        width = next_width
+    return widths
+
+
+def random_jobs(count: int, max_burst: int = 20, seed: int = 0) -> List[Tuple[int, int]]:
+    """Return ``(arrival_tick, burst)`` pairs sorted by arrival for ``count`` jobs."""
+    rng = random.Random(seed)
+    arrival = 0
+    jobs = []
+    for _ in range(count):
+        arrival += rng.randint(0, 3)
+        jobs.append((arrival, rng.randint(1, max_burst)))
+    return jobs
+
+
+def round_robin(queue_class, jobs: List[Tuple[int, int]], quantum: int = 4) -> List[int]:
+    """Simulate a round-robin CPU scheduler and return each job's completion tick.
+
+    This is a discrete-event simulation: time jumps to the next arrival when
+    the ready queue is empty, and a job that does not finish within its
+    ``quantum`` goes back to the end of the ready queue after the jobs that
+    arrived while it ran.
+    """
+    completion = [0] * len(jobs)
+    remaining = [burst for _, burst in jobs]
+    ready = queue_class()
+    clock = 0
+    arrived = 0
+    while arrived < len(jobs) or not ready.is_empty():
+        if ready.is_empty() and jobs[arrived][0] > clock:
+            clock = jobs[arrived][0]
+        while arrived < len(jobs) and jobs[arrived][0] <= clock:
+            ready.enqueue(arrived)
+            arrived += 1
+        job = ready.dequeue()
+        run = min(quantum, remaining[job])
+        clock += run
+        remaining[job] -= run
+        while arrived < len(jobs) and jobs[arrived][0] <= clock:
+            ready.enqueue(arrived)
+            arrived += 1
+        if remaining[job]:
+            ready.enqueue(job)
+        else:
+            completion[job] = clock
+    return completion
+
+
+class Workload(NamedTuple):
+    """Builds the input for a size and runs the algorithm with a queue class."""
+
+    description: str
+    build: Callable[[int, int], Any]
+    run: Callable[[Any, Any], Any]
+
+
+WORKLOADS: Dict[str, Workload] = {
+    "bfs": Workload(
+        "Breadth-first search, average degree 4", lambda size, seed: random_graph(size, 4, seed), bfs
+    ),
+    "level_order": Workload(
+        "Level-order tree traversal", lambda size, seed: random_tree(size, 4, seed), level_order
+    ),
+    "round_robin": Workload(
+        "Round-robin scheduler simulation, quantum 4", lambda size, seed: random_jobs(size, 20, seed), round_robin
+    ),
+}
+
+
+def measure_workload(
+    queue_class, workload: Workload, data: Any, gc_mode: GCMode = GCMode.enabled
+) -> Tuple[float, int]:
+    """Return (seconds, peak_bytes) of running ``workload`` on prebuilt ``data``.
+
+    The time comes from an untraced run; the peak memory allocated while the
+    algorithm runs is measured in a separate run under tracemalloc, which
+    would otherwise slow the timed run down.
+    """
+    seconds = time_operation(lambda: workload.run(queue_class, data), gc_mode)
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        workload.run(queue_class, data)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return seconds, peak
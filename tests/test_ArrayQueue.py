@@ -1,6 +1,9 @@
+import pickle
+import threading
+
 import pytest
 
-from analyze.ArrayQueue import ArrayQueue
+from analyze.ArrayQueue import ArrayQueue, OverflowPolicy
 
 
 class TestArrayQueue:
@@ -300,3 +303,279 @@ class TestArrayQueue:
         assert queue1.rear == 2
         assert queue2.is_empty()
         assert queue2.size() == 0
+
+    def test_reject_when_full(self):
+        """Test that a rejecting queue raises and counts the dropped item."""
+        queue = ArrayQueue(capacity=2, overflow=OverflowPolicy.reject)
+        queue.enqueue(1)
+        queue.enqueue(2)
+        with pytest.raises(IndexError, match="Queue is full"):
+            queue.enqueue(3)
+        assert queue.dropped == 1
+        assert queue.capacity == 2
+        assert queue.dequeue() == 1
+        assert queue.dequeue() == 2
+
+    def test_overwrite_oldest(self):
+        """Test that an overwriting queue drops the oldest items."""
+        queue = ArrayQueue(capacity=3, overflow=OverflowPolicy.overwrite)
+        buffer = queue.items
+        for i in range(1, 6):
+            queue.enqueue(i)
+        assert queue.size() == 3
+        assert queue.dropped == 2
+        assert queue.items is buffer
+        assert [queue.dequeue() for _ in range(3)] == [3, 4, 5]
+        assert queue.is_empty()
+
+    def test_block_waits_for_consumer(self):
+        """Test that a blocking queue waits for room instead of growing."""
+        queue = ArrayQueue(capacity=2, overflow=OverflowPolicy.block)
+        received = []
+
+        def consume():
+            for _ in range(50):
+                received.append(queue.dequeue(timeout=5))
+
+        consumer = threading.Thread(target=consume)
+        consumer.start()
+        for i in range(50):
+            queue.enqueue(i, timeout=5)
+        consumer.join()
+        assert received == list(range(50))
+        assert queue.capacity == 2
+        assert queue.dropped == 0
+
+    def test_block_timeout(self):
+        """Test that a blocking enqueue gives up after its timeout."""
+        queue = ArrayQueue(capacity=1, overflow=OverflowPolicy.block)
+        queue.enqueue(1)
+        with pytest.raises(IndexError, match="Queue is full"):
+            queue.enqueue(2, timeout=0.01)
+        assert queue.dropped == 1
+        assert queue.dequeue() == 1
+        with pytest.raises(IndexError, match="Queue is empty"):
+            queue.dequeue(timeout=0.01)
+
+    def test_blocking(self):
+        """Test that only the block policy reports a blocking queue."""
+        assert ArrayQueue(capacity=1, overflow=OverflowPolicy.block).blocking
+        assert not ArrayQueue(capacity=1, overflow=OverflowPolicy.reject).blocking
+        assert not ArrayQueue().blocking
+
+    def test_incremental_resize_keeps_order(self):
+        """Test that incremental resizing preserves FIFO order across resizes."""
+        queue = ArrayQueue(capacity=2, incremental=True)
+        for i in range(100):
+            queue.enqueue(i)
+        assert queue.size() == 100
+        assert queue.capacity >= 100
+        assert [queue.dequeue() for _ in range(100)] == list(range(100))
+        assert queue.is_empty()
+
+    def test_incremental_resize_is_gradual(self):
+        """Test that growing leaves old elements to be copied later."""
+        queue = ArrayQueue(capacity=8, incremental=True)
+        for i in range(8):
+            queue.enqueue(i)
+        queue.enqueue(8)
+        assert queue.capacity == 16
+        assert queue._old is not None
+        assert queue.peek() == 0
+        assert queue.dequeue() == 0
+        for i in range(9, 14):
+            queue.enqueue(i)
+        assert queue._old is None
+        assert [queue.dequeue() for _ in range(13)] == list(range(1, 14))
+
+    def test_incremental_resize_clears_old_buffer(self):
+        """Test that copied slots are cleared and the old buffer is freed in chunks."""
+        queue = ArrayQueue(capacity=64, incremental=True)
+        for i in range(65):
+            queue.enqueue(i)
+        old = queue._old
+        queue.enqueue(65)
+        assert old[:2] == [None, None]
+        while queue._old is not None:
+            queue.enqueue(0)
+        assert old == [None] * len(old)
+        assert queue._retired is old
+        while queue._retired is not None:
+            queue.dequeue()
+        assert old == []
+
+    def test_incremental_spare_ready_at_growth(self):
+        """Test that every growth finds a full-size spare, even after dequeues."""
+        queue = ArrayQueue(capacity=3, incremental=True, shrink_threshold=0.4)
+        for i in range(5000):
+            if queue.count == queue.capacity:
+                assert len(queue._spare) == 2 * queue.capacity
+            queue.enqueue(i)
+            if i % 3 == 0:
+                queue.dequeue()
+
+    def test_incremental_after_load(self):
+        """Test that a loaded full queue grows onto a pre-built spare."""
+        queue = ArrayQueue.from_bytes(ArrayQueue.to_bytes(ArrayQueue(4)), 4, incremental=True)
+        for i in range(4):
+            queue.enqueue(i)
+        restored = pickle.loads(pickle.dumps(queue))
+        assert len(restored._spare) == 8
+        restored.enqueue(4)
+        assert [restored.dequeue() for _ in range(5)] == [0, 1, 2, 3, 4]
+
+    def test_incremental_add_during_resize(self):
+        """Test that concatenation sees elements that are still being copied."""
+        queue = ArrayQueue(capacity=4, incremental=True)
+        for i in range(5):
+            queue.enqueue(i)
+        other = ArrayQueue(capacity=4, incremental=True)
+        for i in range(5, 10):
+            other.enqueue(i)
+        result = queue + other
+        assert [result.dequeue() for _ in range(10)] == list(range(10))
+        queue += other
+        assert [queue.dequeue() for _ in range(10)] == list(range(10))
+
+    def test_shrink_after_drain(self):
+        """Test that a drained queue gives back capacity."""
+        queue = ArrayQueue(capacity=4, shrink_threshold=0.25)
+        for i in range(1000):
+            queue.enqueue(i)
+        peak = queue.capacity
+        assert [queue.dequeue() for _ in range(995)] == list(range(995))
+        assert queue.capacity < peak
+        assert queue.capacity >= 4
+        assert [queue.dequeue() for _ in range(5)] == list(range(995, 1000))
+
+    def test_shrink_never_below_initial_capacity(self):
+        """Test that shrinking stops at the initial capacity."""
+        queue = ArrayQueue(capacity=8, shrink_threshold=0.25)
+        for i in range(64):
+            queue.enqueue(i)
+        while not queue.is_empty():
+            queue.dequeue()
+        assert queue.capacity == 8
+
+    def test_shrink_without_incremental_keeps_no_spare(self):
+        """Test that shrinking and regrowing a non-incremental queue leaves no spare buffer."""
+        queue = ArrayQueue(capacity=10, shrink_threshold=0.25)
+        for i in range(20000):
+            queue.enqueue(i)
+        while queue.size() > 100:
+            queue.dequeue()
+        assert queue.capacity < 20480
+        for i in range(40000):
+            queue.enqueue(i)
+        assert queue._spare is None
+
+    def test_incremental_shrink_uses_full_spare(self):
+        """Test that an incremental shrink only starts once its buffer is pre-built."""
+        starts = []
+
+        class Probe(ArrayQueue):
+            def _start_migration(self, new_capacity):
+                starts.append(self._spare is not None and len(self._spare) == new_capacity)
+                super()._start_migration(new_capacity)
+
+        queue = Probe(capacity=4, incremental=True, shrink_threshold=0.02)
+        for i in range(5000):
+            queue.enqueue(i)
+        assert [queue.dequeue() for _ in range(5000)] == list(range(5000))
+        assert queue.capacity < 5000
+        assert starts and all(starts)
+
+    def test_shrink_hysteresis(self):
+        """Test that a queue hovering around one size does not keep resizing."""
+        queue = ArrayQueue(capacity=4, shrink_threshold=0.25)
+        for i in range(17):
+            queue.enqueue(i)
+        capacity = queue.capacity
+        for i in range(100):
+            queue.enqueue(i)
+            queue.dequeue()
+        assert queue.capacity == capacity
+
+    def test_invalid_capacity(self):
+        """Test that a queue without room for one element is rejected."""
+        with pytest.raises(ValueError):
+            ArrayQueue(capacity=0)
+        with pytest.raises(ValueError):
+            ArrayQueue(capacity=0, incremental=True)
+
+    @pytest.mark.parametrize("policy", [OverflowPolicy.reject, OverflowPolicy.block, OverflowPolicy.overwrite])
+    def test_bounded_rejects_resizing_options(self, policy):
+        """Test that fixed-capacity policies refuse incremental resizing and shrinking."""
+        with pytest.raises(ValueError):
+            ArrayQueue(4, overflow=policy, incremental=True)
+        with pytest.raises(ValueError):
+            ArrayQueue(4, overflow=policy, shrink_threshold=0.25)
+
+    def test_invalid_shrink_threshold(self):
+        """Test that thresholds without room for hysteresis are rejected."""
+        with pytest.raises(ValueError):
+            ArrayQueue(shrink_threshold=0.5)
+
+    def test_snapshot_shares_buffer(self, multi_item_queue):
+        """Test that a snapshot shares the buffer until the first enqueue."""
+        copy = multi_item_queue.snapshot()
+        assert copy.items is multi_item_queue.items
+        assert multi_item_queue.dequeue() == 1
+        copy.enqueue(4)
+        assert copy.items is not multi_item_queue.items
+        assert [copy.dequeue() for _ in range(4)] == [1, 2, 3, 4]
+        assert [multi_item_queue.dequeue() for _ in range(2)] == [2, 3]
+
+    def test_dropped_snapshot_clears_slots(self, multi_item_queue):
+        """Test that after a snapshot is dropped, dequeued slots are cleared again."""
+        copy = multi_item_queue.snapshot()
+        del copy
+        front = multi_item_queue.front
+        multi_item_queue.dequeue()
+        assert multi_item_queue.items[front] is None
+
+    def test_unshare(self, multi_item_queue):
+        """Test that unshare copies the buffer up front so dequeues clear slots."""
+        copy = multi_item_queue.snapshot()
+        copy.unshare()
+        assert copy.items is not multi_item_queue.items
+        front = copy.front
+        assert copy.dequeue() == 1
+        assert copy.items[front] is None
+        assert multi_item_queue.dequeue() == 1
+
+    def test_snapshot_during_migration(self):
+        """Test that a snapshot taken mid-resize holds every element."""
+        queue = ArrayQueue(capacity=4, incremental=True)
+        for i in range(5):
+            queue.enqueue(i)
+        copy = queue.snapshot()
+        queue.enqueue(5)
+        assert [copy.dequeue() for _ in range(5)] == [0, 1, 2, 3, 4]
+        assert [queue.dequeue() for _ in range(6)] == [0, 1, 2, 3, 4, 5]
+
+    def test_pickle_keeps_settings(self):
+        """Test that pickling keeps the order of a wrapped buffer and the policy."""
+        queue = ArrayQueue(capacity=4, overflow=OverflowPolicy.block)
+        for i in range(4):
+            queue.enqueue(i)
+        queue.dequeue()
+        queue.enqueue(4)
+        copy = pickle.loads(pickle.dumps(queue))
+        assert copy.overflow == OverflowPolicy.block
+        assert copy.capacity == 4
+        assert [copy.dequeue() for _ in range(4)] == [1, 2, 3, 4]
+        copy.enqueue(5)
+        assert copy.peek() == 5
+
+    def test_bytes_round_trip(self, multi_item_queue):
+        """Test the compact binary format."""
+        copy = ArrayQueue.from_bytes(multi_item_queue.to_bytes())
+        assert list(copy) == [1, 2, 3]
+        copy.enqueue(4)
+        assert [copy.dequeue() for _ in range(4)] == [1, 2, 3, 4]
+
+    def test_from_bytes_bounded_overflow(self, multi_item_queue):
+        """Test that a bounded queue refuses more elements than its capacity."""
+        with pytest.raises(ValueError):
+            ArrayQueue.from_bytes(multi_item_queue.to_bytes(), 2, OverflowPolicy.reject)
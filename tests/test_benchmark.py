@@ -0,0 +1,117 @@
+import itertools
+import math
+
+import pytest
+
+from analyze.benchmark import (
+    AdaptiveDoubling,
+    TimeBudget,
+    harness_iterations,
+    measure_doubling_cell,
+    measure_interleaved,
+    operation_elements,
+    time_operation,
+)
+from analyze.dll_queue import BasicDLLQueue
+from analyze.sll_queue import BasicSLLQueue
+
+
+class TestAdaptiveDoubling:
+
+    @pytest.fixture
+    def synthetic_measure(self):
+        """Fixture to provide a measure function with a linear and a quadratic operation."""
+        def measure(size, operations):
+            costs = {"linear": size * 1e-6, "quadratic": size * size * 1e-9}
+            return {op: costs[op] for op in operations}
+        return measure
+
+    def test_no_budget_doubles_to_max(self, synthetic_measure):
+        """Test that without limits every doubling size is measured."""
+        experiment = AdaptiveDoubling(
+            synthetic_measure, TimeBudget(), operations=["linear"], refine_rounds=0
+        )
+        sizes = experiment.run(1000, 16000)
+        assert sizes == [1000, 2000, 4000, 8000, 16000]
+        assert experiment.stopped == {}
+
+    def test_cell_budget_stops_quadratic_operation(self, synthetic_measure):
+        """Test that an operation stops once its predicted time exceeds the cell budget."""
+        experiment = AdaptiveDoubling(
+            synthetic_measure,
+            TimeBudget(per_cell=0.5),
+            operations=["linear", "quadratic"],
+            refine_rounds=0,
+        )
+        sizes = experiment.run(1000, 64000)
+        results = experiment.results(sizes)
+        assert sizes[-1] == 64000
+        assert experiment.stopped["quadratic"] < 64000
+        assert math.isnan(results["quadratic"][-1])
+        assert not any(math.isnan(t) for t in results["linear"])
+
+    def test_refinement_at_bend(self):
+        """Test that sizes are refined around a change in growth rate."""
+        def measure(size, operations):
+            cost = size * 1e-6 if size <= 4000 else (size ** 2) * 2.5e-10
+            return {op: cost for op in operations}
+
+        experiment = AdaptiveDoubling(measure, TimeBudget(), operations=["op"], refine_rounds=1)
+        sizes = experiment.run(1000, 16000)
+        assert len(sizes) > 5
+        assert any(4000 < size < 8000 for size in sizes)
+
+    def test_total_budget_share(self):
+        """Test that a shared budget splits the remaining time."""
+        budget = TimeBudget(total=10.0)
+        share = budget.share(4)
+        assert share.total <= 2.5
+        assert TimeBudget().share(3).total is None
+
+
+def test_measure_doubling_cell_subset():
+    """Test that only the requested operations are timed."""
+    cell = measure_doubling_cell(BasicSLLQueue, 100, ["peek", "iconcat"])
+    assert set(cell) == {"peek", "iconcat"}
+
+
+def test_dequeue_fixtures_are_private_snapshots():
+    """Test that every dequeue repeat runs on an unshared snapshot instead of a refill."""
+    fixtures = []
+
+    class Probe(BasicSLLQueue):
+        def snapshot(self):
+            fixtures.append(super().snapshot())
+            return fixtures[-1]
+
+    measure_doubling_cell(Probe, 100, ["dequeue"], repeats=3)
+    assert len(fixtures) >= 3
+    assert all(fixture._share is None for fixture in fixtures)
+
+
+def test_time_operation_setup_fixture():
+    """Test that every run gets its own fixture from setup."""
+    counter = itertools.count()
+    seen = []
+    time_operation(seen.append, setup=lambda: next(counter))
+    assert seen == [0, 1]
+
+
+def test_operation_elements_and_harness_loops():
+    """Test the element counts and harness loop lengths of the doubling operations."""
+    assert [operation_elements(op, 300) for op in ("enqueue", "dequeue", "peek", "concat")] == [300, 150, 100, 30]
+    assert harness_iterations("peek", 300) == 100
+    assert harness_iterations("iconcat", 300) == 0
+
+
+def test_measure_interleaved_rounds():
+    """Test that every implementation gets one sample per round and operation."""
+    rounds = []
+    samples = measure_interleaved(
+        {"sll": BasicSLLQueue, "dll": BasicDLLQueue}, 100, ["enqueue", "peek"], 3, seed=0, on_round=rounds.append
+    )
+    assert rounds == [1, 2, 3]
+    assert {name: {op: len(values) for op, values in ops.items()} for name, ops in samples.items()} == {
+        "sll": {"enqueue": 3, "peek": 3},
+        "dll": {"enqueue": 3, "peek": 3},
+    }
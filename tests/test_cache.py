@@ -0,0 +1,62 @@
+import os
+import time
+
+import analyze.cache
+from analyze.ArrayQueue import ArrayQueue
+from analyze.cache import ResultCache, implementation_sources
+from analyze.sll_queue import BasicSLLQueue
+
+
+class TestResultCache:
+
+    def test_sources_include_dependencies(self):
+        """Test that the key covers the node pool used by the linked-list queues."""
+        sources = implementation_sources(BasicSLLQueue)
+        assert "analyze.sll_queue" in sources
+        assert "analyze.node_pool" in sources
+        assert "analyze.benchmark" in sources
+
+    def test_sources_include_harness_dependencies(self):
+        """Test that the modules imported by the benchmark harness are covered too."""
+        sources = implementation_sources(ArrayQueue)
+        assert "analyze.gc_monitor" in sources
+        assert "analyze.environment" in sources
+
+    def test_key_changes_with_parameters_and_implementation(self, tmp_path):
+        """Test that keys differ per implementation and parameter set."""
+        cache = ResultCache(tmp_path)
+        key = cache.key(ArrayQueue, {"size": 10})
+        assert key == cache.key(ArrayQueue, {"size": 10})
+        assert key != cache.key(ArrayQueue, {"size": 20})
+        assert key != cache.key(BasicSLLQueue, {"size": 10})
+
+    def test_key_changes_with_source(self, tmp_path, monkeypatch):
+        """Test that editing an implementation invalidates its results."""
+        cache = ResultCache(tmp_path)
+        key = cache.key(ArrayQueue, {})
+        sources = implementation_sources(ArrayQueue)
+        sources["analyze.ArrayQueue"] += "\n# edited\n"
+        monkeypatch.setattr(analyze.cache, "implementation_sources", lambda cls: sources)
+        assert cache.key(ArrayQueue, {}) != key
+
+    def test_get_put(self, tmp_path):
+        """Test storing and reading back a value."""
+        cache = ResultCache(tmp_path)
+        assert cache.get("missing") is None
+        cache.put("abc", {"results": [1.5, float("nan")]})
+        assert cache.get("abc")["results"][0] == 1.5
+
+    def test_evict_by_age_and_size(self, tmp_path):
+        """Test that old entries go first and the size limit is honoured."""
+        cache = ResultCache(tmp_path)
+        for name in ("old", "middle", "new"):
+            cache.put(name, {"data": "x" * 100})
+        now = time.time()
+        os.utime(tmp_path / "old.json", (now - 10 * 86400, now - 10 * 86400))
+        os.utime(tmp_path / "middle.json", (now - 60, now - 60))
+        assert cache.evict(max_age=86400) == 1
+        assert cache.get("old") is None
+        size = (tmp_path / "new.json").stat().st_size
+        assert cache.evict(max_bytes=size) == 1
+        assert cache.get("middle") is None
+        assert cache.get("new") is not None
@@ -0,0 +1,110 @@
+import pytest
+
+from analyze.ArrayQueue import ArrayQueue
+from analyze.counters import (
+    POINTER_SIZE,
+    CostCounters,
+    CountingArrayQueue,
+    CountingDLLQueue,
+    CountingSLLQueue,
+    count_doubling_cell,
+)
+from analyze.dll_queue import BasicDLLQueue
+from analyze.sll_queue import BasicSLLQueue
+
+
+class TestCountingArrayQueue:
+
+    def test_resizes_and_copies(self):
+        """Test that doubling from capacity 1 copies 1 + 2 + 4 + ... elements."""
+        queue = CountingArrayQueue(1)
+        for i in range(16):
+            queue.enqueue(i)
+        assert queue.counters.resizes == 4
+        assert queue.counters.elements_copied == 1 + 2 + 4 + 8
+        assert queue.wasted() == 0
+
+    def test_incremental_migration_copies(self):
+        """Test that an incremental resize counts every element it moves."""
+        queue = CountingArrayQueue(4, incremental=True)
+        for i in range(5):
+            queue.enqueue(i)
+        assert [queue.dequeue() for _ in range(5)] == list(range(5))
+        assert queue.counters.resizes == 1
+        assert queue.counters.elements_copied <= 4
+
+    def test_snapshot_copy_on_write(self):
+        """Test that writing to a shared buffer counts the copy."""
+        queue = CountingArrayQueue(8)
+        queue.enqueue(1)
+        clone = queue.snapshot()
+        queue.enqueue(2)
+        assert queue.counters.elements_copied == 8
+        assert clone.dequeue() == 1
+
+    def test_wasted(self):
+        """Test that wasted capacity counts unused slots."""
+        queue = CountingArrayQueue(10)
+        for i in range(3):
+            queue.enqueue(i)
+        assert queue.wasted() == 7
+
+
+class TestCountingLinkedLists:
+
+    @pytest.mark.parametrize("queue_class", [CountingDLLQueue, CountingSLLQueue])
+    def test_pool_reuse(self, queue_class):
+        """Test that pooled nodes count as reused instead of allocated."""
+        queue = queue_class(4)
+        for i in range(4):
+            queue.enqueue(i)
+        for _ in range(4):
+            queue.dequeue()
+        assert queue.wasted() == 4
+        for i in range(6):
+            queue.enqueue(i)
+        assert queue.counters.nodes_allocated == 6
+        assert queue.counters.nodes_reused == 4
+
+    @pytest.mark.parametrize("queue_class", [CountingDLLQueue, CountingSLLQueue])
+    def test_unshare_is_not_an_enqueue(self, queue_class):
+        """Test that copying shared nodes counts copies and nodes but no enqueues."""
+        queue = queue_class()
+        for i in range(3):
+            queue.enqueue(i)
+        clone = queue.snapshot()
+        clone.enqueue(3)
+        queue.enqueue(4)
+        assert list(queue) == [0, 1, 2, 4]
+        assert queue.counters.enqueues == 4
+        assert queue.counters.elements_copied == 3
+        assert queue.counters.nodes_allocated == 3 + 1 + 3
+
+    def test_shared_counters(self):
+        """Test that queues can count into one CostCounters."""
+        counters = CostCounters()
+        CountingDLLQueue(counters=counters).enqueue(1)
+        CountingSLLQueue(counters=counters).enqueue(2)
+        assert counters.stats()["nodes_allocated"] == 2
+
+
+class TestCountDoublingCell:
+
+    @pytest.mark.parametrize("queue_class", [ArrayQueue, BasicDLLQueue, BasicSLLQueue])
+    def test_operations(self, queue_class):
+        """Test that every doubling operation gets a counter record."""
+        records = count_doubling_cell(queue_class, 1000)
+        assert list(records) == ["enqueue", "dequeue", "peek", "concat", "iconcat"]
+        assert records["enqueue"]["enqueues"] == 1000
+        assert records["dequeue"]["dequeues"] == 500
+        assert records["dequeue"]["enqueues"] == 0
+        assert records["concat"]["elements_copied"] == 1100
+        assert records["concat"]["bytes_copied"] == 1100 * POINTER_SIZE
+
+    def test_linked_lists_never_resize(self):
+        """Test that linked lists allocate one node per element and never resize."""
+        records = count_doubling_cell(BasicSLLQueue, 1000)
+        assert records["enqueue"]["nodes_allocated"] == 1000
+        assert records["enqueue"]["node_bytes"] > 0
+        assert all(record["resizes"] == 0 for record in records.values())
+        assert records["iconcat"]["elements_copied"] == 0
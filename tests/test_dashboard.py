@@ -0,0 +1,46 @@
+from rich.console import Console
+from rich.progress import TimeRemainingColumn
+
+from analyze.benchmark import TimeBudget
+from analyze.dashboard import BudgetRemainingColumn, DoublingDashboard
+
+
+def render(dashboard):
+    console = Console(width=120, record=True)
+    console.print(dashboard)
+    return console.export_text()
+
+
+class TestDoublingDashboard:
+
+    def test_fixed_sizes_weight_progress_by_size(self):
+        """Test that without a budget the bar counts cells weighted by size."""
+        dashboard = DoublingDashboard(["sll"], [100, 200], ["enqueue", "dequeue"])
+        task = dashboard.progress.tasks[0]
+        assert task.total == 600
+        dashboard.start_cell("sll", 100)
+        dashboard.record("sll", 100, "enqueue", 0.001)
+        dashboard.skip(100)
+        assert task.completed == 200
+        assert any(isinstance(column, TimeRemainingColumn) for column in dashboard.progress.columns)
+        assert "ETA" in render(dashboard)
+
+    def test_total_budget_drives_eta(self):
+        """Test that an adaptive run measures progress and ETA against the budget."""
+        budget = TimeBudget(total=3600)
+        dashboard = DoublingDashboard(["sll"], [100], ["enqueue"], budget=budget)
+        task = dashboard.progress.tasks[0]
+        assert task.total == 3600
+        dashboard.record("sll", 100, "enqueue", 0.001)
+        assert 0 < task.completed < 3600
+        columns = dashboard.progress.columns
+        assert not any(isinstance(column, TimeRemainingColumn) for column in columns)
+        assert any(isinstance(column, BudgetRemainingColumn) for column in columns)
+        assert "≤ 0:59:59" in render(dashboard)
+
+    def test_cell_budget_hides_eta(self):
+        """Test that a budget without a total shows no ETA."""
+        dashboard = DoublingDashboard(["sll"], [100], ["enqueue"], budget=TimeBudget(per_cell=1.0))
+        assert dashboard.progress.tasks[0].total is None
+        dashboard.record("sll", 100, "enqueue", 0.001)
+        assert "ETA" not in render(dashboard)
@@ -0,0 +1,115 @@
+import math
+import socket
+import threading
+
+from analyze.distributed import (
+    Coordinator,
+    _receive,
+    _send,
+    host_spread,
+    make_jobs,
+    parse_address,
+    run_worker,
+    spawn_local_workers,
+)
+
+OPERATIONS = ["enqueue", "peek"]
+
+
+def small_jobs():
+    return make_jobs({("sll", 100): OPERATIONS, ("array", 200): OPERATIONS, ("dll", 50): OPERATIONS})
+
+
+def test_make_jobs_largest_first():
+    """Test that the slowest cells are handed out first."""
+    assert [job["size"] for job in small_jobs()] == [200, 100, 50]
+
+
+def test_worker_threads_complete_all_jobs():
+    """Test that several workers share the jobs and every cell gets a result."""
+    seen = []
+    with Coordinator(small_jobs(), on_result=lambda *args: seen.append(args)) as coordinator:
+        host, port = coordinator.address
+        threads = [
+            threading.Thread(target=run_worker, args=(host, port, f"w{i}"))
+            for i in range(2)
+        ]
+        for thread in threads:
+            thread.start()
+        assert coordinator.wait(timeout=30)
+    for thread in threads:
+        thread.join(timeout=30)
+    assert set(coordinator.results) == {("sll", 100), ("array", 200), ("dll", 50)}
+    assert all(set(cell) == set(OPERATIONS) for cell in coordinator.results.values())
+    assert len(seen) == 6
+    assert sum(stats["jobs"] for stats in coordinator.workers.values()) == 3
+    assert all(stats["calibration"] > 0 for stats in coordinator.workers.values())
+
+
+def test_lost_worker_job_is_requeued():
+    """Test that a job is handed out again when its worker disconnects."""
+    with Coordinator(small_jobs()) as coordinator:
+        host, port = coordinator.address
+        with socket.create_connection((host, port)) as connection:
+            stream = connection.makefile("rwb")
+            _send(stream, {"type": "hello", "name": "flaky"})
+            calibration = _receive(stream)
+            _send(stream, {"type": "result", "id": calibration["id"], "results": {"enqueue": 0.1}})
+            assert _receive(stream)["type"] == "job"
+            stream.close()
+        run_worker(host, port, "steady")
+        assert coordinator.wait(timeout=30)
+    assert coordinator.workers["steady"]["jobs"] == 3
+    assert coordinator.workers["flaky"]["jobs"] == 0
+
+
+def test_job_given_up_after_max_attempts():
+    """Test that a job whose workers keep disconnecting is recorded as NaN."""
+    jobs = make_jobs({("sll", 100): OPERATIONS})
+    seen = []
+    with Coordinator(jobs, max_attempts=2, on_result=lambda *args: seen.append(args)) as coordinator:
+        host, port = coordinator.address
+        for attempt in range(2):
+            with socket.create_connection((host, port)) as connection:
+                stream = connection.makefile("rwb")
+                _send(stream, {"type": "hello", "name": f"crash{attempt}"})
+                calibration = _receive(stream)
+                _send(stream, {"type": "result", "id": calibration["id"], "results": {"enqueue": 0.1}})
+                assert _receive(stream)["type"] == "job"
+                stream.close()
+        assert coordinator.wait(timeout=30)
+    assert coordinator.failed == [jobs[0]["id"]]
+    assert all(math.isnan(seconds) for seconds in coordinator.results[("sll", 100)].values())
+    assert [args[0] for args in seen] == ["crash1", "crash1"]
+
+
+def test_local_worker_processes():
+    """Test a coordinator served by worker processes on localhost."""
+    with Coordinator(small_jobs()) as coordinator:
+        host, port = coordinator.address
+        processes = spawn_local_workers(2, host, port)
+        assert coordinator.wait(timeout=60)
+    for process in processes:
+        assert process.wait(timeout=30) == 0
+    assert len(coordinator.results) == 3
+    assert set(coordinator.workers) == {"local-0", "local-1"}
+
+
+def test_host_spread():
+    """Test the per-host calibration summary."""
+    workers = {
+        "a": {"host": "one", "calibration": 1.0},
+        "b": {"host": "one", "calibration": 3.0},
+        "c": {"host": "two", "calibration": 4.0},
+        "d": {"host": "two", "calibration": math.nan},
+    }
+    summary, cv = host_spread(workers)
+    assert summary["one"][:2] == (2, 2.0)
+    assert summary["two"] == (1, 4.0, 0.0)
+    assert math.isclose(cv, math.sqrt(2) / 3)
+
+
+def test_parse_address():
+    """Test HOST:PORT parsing with a localhost default."""
+    assert parse_address("example:9000") == ("example", 9000)
+    assert parse_address("9000") == ("127.0.0.1", 9000)
@@ -1,3 +1,5 @@
+import pickle
+
 import pytest
 
 from analyze.dll_queue import BasicDLLQueue
@@ -215,3 +217,183 @@ class TestBasicDLLQueue:
         assert single_item_queue.dequeue() == 3  # From multi_item_queue
         assert multi_item_queue.is_empty()
         assert len(multi_item_queue) == 0
+
+    def test_pool_reuses_nodes(self):
+        """Test that a pooled queue recycles dequeued nodes."""
+        queue = BasicDLLQueue(pool_size=2)
+        queue.enqueue(1)
+        node = queue._head
+        assert queue.dequeue() == 1
+        queue.enqueue(2)
+        assert queue._head is node
+        assert queue.peek() == 2
+        assert queue.pool_stats()["hits"] == 1
+        assert queue.pool_stats()["misses"] == 1
+
+    def test_pool_is_bounded(self):
+        """Test that the pool never keeps more than its configured size."""
+        queue = BasicDLLQueue(pool_size=2)
+        for i in range(5):
+            queue.enqueue(i)
+        assert [queue.dequeue() for _ in range(5)] == [0, 1, 2, 3, 4]
+        stats = queue.pool_stats()
+        assert stats["free"] == 2
+        assert stats["discarded"] == 3
+        assert queue.is_empty()
+
+    def test_pool_disabled_by_default(self, empty_queue):
+        """Test that pooling is off unless requested."""
+        assert empty_queue.pool_stats() is None
+
+    def test_push_front(self, multi_item_queue):
+        """Test adding items at the front."""
+        multi_item_queue.push_front(0)
+        assert len(multi_item_queue) == 4
+        assert multi_item_queue.peek() == 0
+        assert multi_item_queue._head.next.prev is multi_item_queue._head
+        assert [multi_item_queue.dequeue() for _ in range(4)] == [0, 1, 2, 3]
+
+    def test_push_front_empty(self, empty_queue):
+        """Test that push_front on an empty queue sets both ends."""
+        empty_queue.push_front(1)
+        assert empty_queue.peek() == 1
+        assert empty_queue.peek_back() == 1
+
+    def test_pop_back(self, multi_item_queue):
+        """Test removing items from the back."""
+        assert multi_item_queue.peek_back() == 3
+        assert multi_item_queue.pop_back() == 3
+        assert multi_item_queue._tail.next is None
+        assert multi_item_queue.pop_back() == 2
+        assert multi_item_queue.pop_back() == 1
+        assert multi_item_queue.is_empty()
+        assert multi_item_queue._head is None
+        assert multi_item_queue._tail is None
+
+    def test_pop_back_empty(self, empty_queue):
+        """Test popping and peeking at the back of an empty queue."""
+        with pytest.raises(IndexError):
+            empty_queue.pop_back()
+        with pytest.raises(IndexError):
+            empty_queue.peek_back()
+
+    def test_pop_back_releases_to_pool(self):
+        """Test that pop_back recycles a fully unlinked node."""
+        queue = BasicDLLQueue(pool_size=2)
+        queue.enqueue(1)
+        queue.enqueue(2)
+        node = queue._tail
+        assert queue.pop_back() == 2
+        assert node.prev is None and node.next is None and node.data is None
+        queue.push_front(0)
+        assert queue._head is node
+        assert [queue.dequeue(), queue.dequeue()] == [0, 1]
+
+    def test_splice_middle(self):
+        """Test moving a run of nodes from the middle of another queue."""
+        source = BasicDLLQueue()
+        for i in range(5):
+            source.enqueue(i)
+        target = BasicDLLQueue()
+        target.enqueue(-1)
+        first = source._head.next
+        last = first.next.next
+        target.splice(source, first, last, 3)
+        assert len(source) == 2
+        assert len(target) == 4
+        assert [source.dequeue() for _ in range(2)] == [0, 4]
+        assert target._tail.next is None
+        assert [target.pop_back() for _ in range(4)] == [3, 2, 1, -1]
+
+    def test_splice_whole_queue(self, empty_queue, multi_item_queue):
+        """Test splicing every node leaves the source empty."""
+        empty_queue.splice(multi_item_queue, multi_item_queue._head, multi_item_queue._tail, 3)
+        assert multi_item_queue.is_empty()
+        assert multi_item_queue._head is None
+        assert multi_item_queue._tail is None
+        assert [empty_queue.dequeue() for _ in range(3)] == [1, 2, 3]
+
+    def test_split_front(self, multi_item_queue):
+        """Test taking items off the front as a new queue."""
+        front = multi_item_queue.split_front(2)
+        assert [front.dequeue() for _ in range(2)] == [1, 2]
+        assert multi_item_queue._head.prev is None
+        assert multi_item_queue.dequeue() == 3
+        assert multi_item_queue.split_front(5).is_empty()
+
+    def test_snapshot_shares_nodes(self, multi_item_queue):
+        """Test that a snapshot shares nodes and is independent of later dequeues."""
+        copy = multi_item_queue.snapshot()
+        assert copy._head is multi_item_queue._head
+        assert [multi_item_queue.dequeue() for _ in range(3)] == [1, 2, 3]
+        assert len(copy) == 3
+        assert [copy.dequeue() for _ in range(3)] == [1, 2, 3]
+
+    def test_snapshot_both_ends(self, multi_item_queue):
+        """Test changes at either end of a sharer stay private to it."""
+        copy = multi_item_queue.snapshot()
+        multi_item_queue.pop_back()
+        multi_item_queue.enqueue(4)
+        multi_item_queue.push_front(0)
+        copy.push_front(-1)
+        copy.enqueue(5)
+        assert [multi_item_queue.dequeue() for _ in range(4)] == [0, 1, 2, 4]
+        assert [copy.pop_back() for _ in range(5)] == [5, 3, 2, 1, -1]
+
+    def test_snapshot_iadd_keeps_snapshot(self, single_item_queue, multi_item_queue):
+        """Test that merging a shared queue leaves its snapshot intact."""
+        copy = multi_item_queue.snapshot()
+        single_item_queue += multi_item_queue
+        single_item_queue.dequeue()
+        single_item_queue.dequeue()
+        assert [copy.dequeue() for _ in range(3)] == [1, 2, 3]
+
+    def test_dropped_snapshot_unshares(self):
+        """Test that after a snapshot is dropped, dequeues clear links and recycle nodes again."""
+        queue = BasicDLLQueue(pool_size=4)
+        for i in range(4):
+            queue.enqueue(i)
+        copy = queue.snapshot()
+        del copy
+        queue.dequeue()
+        assert queue._head.prev is None
+        queue.pop_back()
+        assert queue._tail.next is None
+        queue.enqueue(4)
+        queue.enqueue(5)
+        assert queue.pool_stats()["hits"] == 2
+        assert queue._share is None
+
+    def test_unshare(self, multi_item_queue):
+        """Test that unshare copies the nodes up front so dequeues clear links."""
+        copy = multi_item_queue.snapshot()
+        copy.unshare()
+        assert copy._share is None and not multi_item_queue._shared()
+        assert copy._head is not multi_item_queue._head
+        assert copy.dequeue() == 1
+        assert copy._head.prev is None
+        assert list(multi_item_queue) == [1, 2, 3]
+
+    def test_splice_shared_rejected(self, empty_queue, multi_item_queue):
+        """Test that nodes cannot be spliced out of a queue with a live snapshot."""
+        copy = multi_item_queue.snapshot()
+        with pytest.raises(ValueError):
+            empty_queue.splice(multi_item_queue, multi_item_queue._head, multi_item_queue._head, 1)
+        assert len(copy) == 3
+
+    def test_pickle_long_queue(self):
+        """Test that pickling a long queue does not recurse through its nodes."""
+        queue = BasicDLLQueue(pool_size=8)
+        for i in range(10000):
+            queue.enqueue(i)
+        queue.dequeue()
+        copy = pickle.loads(pickle.dumps(queue))
+        assert list(copy) == list(range(1, 10000))
+        assert copy.pool_stats()["max_size"] == 8
+
+    def test_bytes_round_trip(self, multi_item_queue):
+        """Test the compact binary format."""
+        copy = BasicDLLQueue.from_bytes(multi_item_queue.to_bytes())
+        assert list(copy) == [1, 2, 3]
+        copy.enqueue(4)
+        assert [copy.dequeue() for _ in range(4)] == [1, 2, 3, 4]
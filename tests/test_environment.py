@@ -0,0 +1,104 @@
+import math
+from itertools import count
+
+from analyze.environment import (
+    check_environment,
+    frequency_scaling,
+    noise_score,
+    probe_noise,
+    reject_outliers,
+    run_noise_score,
+    summarize_repeats,
+    warm_up,
+)
+
+
+class TestOutliers:
+
+    def test_reject_outliers(self):
+        """Test that a far-off timing is rejected and the rest kept."""
+        kept, rejected = reject_outliers([1.0, 1.1, 0.9, 1.05, 0.95, 10.0])
+        assert rejected == [10.0]
+        assert len(kept) == 5
+
+    def test_identical_values_kept(self):
+        """Test that a zero MAD rejects nothing."""
+        assert reject_outliers([2.0, 2.0, 2.0, 5.0]) == ([2.0, 2.0, 2.0, 5.0], [])
+
+    def test_too_few_values(self):
+        """Test that fewer than three values are never rejected."""
+        assert reject_outliers([1.0, 100.0]) == ([1.0, 100.0], [])
+
+    def test_noise_score(self):
+        """Test the robust coefficient of variation."""
+        assert noise_score([1.0, 1.0, 1.0]) == 0.0
+        assert math.isclose(noise_score([1.0, 2.0, 3.0]), 1.4826 / 2)
+        assert math.isnan(noise_score([1.0]))
+
+    def test_summarize_repeats(self):
+        """Test that the summary uses the median of the kept timings."""
+        summary = summarize_repeats([1.0, 1.2, 0.8, 1.1, 0.9, 50.0])
+        assert summary["seconds"] == 1.0
+        assert summary["repeats"] == 6
+        assert summary["rejected"] == 1
+        assert summary["noise"] > 0
+
+    def test_run_noise_score(self):
+        """Test that the run score is the median cell score, ignoring NaN."""
+        assert run_noise_score([0.1, math.nan, 0.3, 0.2]) == 0.2
+        assert math.isnan(run_noise_score([]))
+
+
+class TestWarmUp:
+
+    def test_stops_when_stable(self):
+        """Test that warm-up stops once the window is stable."""
+        timings = iter([5.0, 3.0, 2.0] + [1.0] * 20)
+        result = warm_up(lambda: next(timings), window=4)
+        assert result["stable"]
+        assert result["runs"] == 6
+
+    def test_gives_up(self):
+        """Test that warm-up stops after max_runs without stabilising."""
+        runs = count(1)
+        result = warm_up(lambda: float(next(runs) ** 2), window=3, max_runs=10)
+        assert not result["stable"]
+        assert result["runs"] == 10
+
+    def test_probe_noise(self):
+        """Test that the probe is timed ``runs`` times and scored."""
+        timings = iter([1.0, 2.0, 3.0, 9.0])
+        assert math.isclose(probe_noise(lambda: next(timings), runs=3), 1.4826 / 2)
+
+
+class TestEnvironment:
+
+    def test_frequency_scaling(self, tmp_path):
+        """Test reading governors, frequencies and turbo from a sysfs tree."""
+        for cpu, governor in (("cpu0", "powersave"), ("cpu1", "performance")):
+            cpufreq = tmp_path / cpu / "cpufreq"
+            cpufreq.mkdir(parents=True)
+            (cpufreq / "scaling_governor").write_text(governor + "\n")
+            (cpufreq / "scaling_max_freq").write_text("3600000\n")
+            (cpufreq / "scaling_min_freq").write_text("800000\n")
+        (tmp_path / "intel_pstate").mkdir()
+        (tmp_path / "intel_pstate" / "no_turbo").write_text("0\n")
+        scaling = frequency_scaling(tmp_path)
+        assert scaling["governors"] == ["performance", "powersave"]
+        assert scaling["max_mhz"] == 3600
+        assert scaling["min_mhz"] == 800
+        assert scaling["current_mhz"] is None
+        assert scaling["turbo"] is True
+
+    def test_frequency_scaling_missing(self, tmp_path):
+        """Test that a machine without cpufreq reports nothing."""
+        scaling = frequency_scaling(tmp_path)
+        assert scaling["governors"] == []
+        assert scaling["turbo"] is None
+
+    def test_check_environment(self):
+        """Test that the environment description has every field."""
+        environment = check_environment()
+        for key in ("platform", "python", "cpu_count", "frequency", "load_average", "warnings"):
+            assert key in environment
+        assert isinstance(environment["warnings"], list)
@@ -0,0 +1,43 @@
+import gc
+
+from analyze.benchmark import time_operation
+from analyze.gc_monitor import GCMode, GCMonitor, gc_disabled
+
+
+class TestGCMonitor:
+
+    def test_counts_collection(self):
+        """Test that a forced collection is recorded in generation 2."""
+        with GCMonitor() as monitor:
+            gc.collect()
+        assert monitor.collections[2] >= 1
+        assert monitor.total_collections >= 1
+        assert monitor.total_pause > 0
+        assert monitor._callback not in gc.callbacks
+
+    def test_reset(self):
+        """Test that reset clears the counters."""
+        with GCMonitor() as monitor:
+            gc.collect()
+        monitor.reset()
+        assert monitor.stats() == {"collections": [0, 0, 0], "pauses": [0.0, 0.0, 0.0]}
+
+    def test_gc_disabled_restores_state(self):
+        """Test that the collector is re-enabled after the disabled region."""
+        assert gc.isenabled()
+        with gc_disabled():
+            assert not gc.isenabled()
+        assert gc.isenabled()
+
+    def test_time_operation_disabled_gc_records_nothing(self):
+        """Test that no automatic collections happen while GC is disabled."""
+        def make_cycles():
+            for _ in range(20000):
+                node = {}
+                node["self"] = node
+
+        monitor = GCMonitor()
+        elapsed = time_operation(make_cycles, GCMode.disabled, monitor)
+        assert elapsed > 0
+        assert monitor.total_collections == 0
+        assert gc.isenabled()
@@ -0,0 +1,57 @@
+import json
+import math
+import sys
+
+import analyze.interpreters
+from analyze.interpreters import discover_interpreters, interpreter_info, run_matrix
+
+
+class TestInterpreters:
+
+    def test_current_interpreter(self):
+        """Test probing the running interpreter."""
+        info = interpreter_info(sys.executable)
+        assert info is not None
+        assert info["version"] == ".".join(map(str, sys.version_info[:3]))
+        assert info["label"].endswith(info["version"])
+
+    def test_unusable_interpreter(self):
+        """Test that a missing executable is reported as None."""
+        assert interpreter_info("/nonexistent/python") is None
+
+    def test_discover_includes_current(self):
+        """Test that discovery finds the current interpreter without duplicates."""
+        found = discover_interpreters(["python3", "no-such-python"])
+        labels = [info["label"] for info in found]
+        assert found[0]["version"] == ".".join(map(str, sys.version_info[:3]))
+        assert len(labels) == len(set(labels))
+
+    def test_run_matrix(self):
+        """Test measuring cells under an interpreter, with NaN for failures."""
+        info = interpreter_info(sys.executable)
+        broken = dict(info, executable="/nonexistent/python", label="broken")
+        seen = []
+        results = run_matrix(
+            [info, broken],
+            ["sll"],
+            [500],
+            ["enqueue"],
+            on_cell=lambda label, impl, size, cell: seen.append(label),
+        )
+        assert results[(info["label"], "sll", 500)]["enqueue"] > 0
+        assert math.isnan(results[("broken", "sll", 500)]["enqueue"])
+        assert seen == [info["label"], "broken"]
+
+    def test_run_matrix_unreadable_output(self, monkeypatch):
+        """Test that a child printing invalid JSON records NaN and the matrix goes on."""
+
+        def garbled(implementation, size, operations, **kwargs):
+            if implementation == "sll":
+                raise json.JSONDecodeError("Expecting value", "oops", 0)
+            return {"results": {operation: 1.0 for operation in operations}}
+
+        monkeypatch.setattr(analyze.interpreters, "run_isolated", garbled)
+        info = interpreter_info(sys.executable)
+        results = run_matrix([info], ["sll", "dll"], [500], ["enqueue"])
+        assert math.isnan(results[(info["label"], "sll", 500)]["enqueue"])
+        assert results[(info["label"], "dll", 500)]["enqueue"] == 1.0
@@ -0,0 +1,48 @@
+import pytest
+
+from analyze.isolation import measure_cell, peak_rss, resource, resource_usage, run_isolated
+
+USAGE_KEYS = {
+    "max_rss",
+    "minor_faults",
+    "major_faults",
+    "voluntary_switches",
+    "involuntary_switches",
+    "user_cpu",
+    "system_cpu",
+}
+
+
+class TestIsolation:
+
+    def test_measure_cell(self):
+        """Test measuring a cell in this process."""
+        cell = measure_cell({"implementation": "array", "size": 1000, "operations": ["enqueue", "peek"]})
+        assert set(cell["results"]) == {"enqueue", "peek"}
+        assert cell["gc_stats"] is None
+        if resource is not None:
+            assert set(cell["usage"]) == USAGE_KEYS | {"wall"}
+
+    def test_run_isolated(self):
+        """Test that a subprocess returns timings, GC stats and usage."""
+        cell = run_isolated("sll", 2000, ["enqueue", "dequeue"], payload="short_str", gc_stats=True)
+        assert set(cell["results"]) == {"enqueue", "dequeue"}
+        assert all(seconds > 0 for seconds in cell["results"].values())
+        assert set(cell["gc_stats"]) == {"enqueue", "dequeue"}
+        if resource is not None:
+            assert cell["usage"]["max_rss"] > 0
+            assert cell["usage"]["wall"] > 0
+
+    def test_run_isolated_failure(self):
+        """Test that a failing child raises RuntimeError."""
+        with pytest.raises(RuntimeError):
+            run_isolated("no-such-queue", 10, ["enqueue"])
+
+    @pytest.mark.skipif(resource is None, reason="resource module is Unix only")
+    def test_usage_delta(self):
+        """Test that usage counters are differences from the starting point."""
+        before = resource.getrusage(resource.RUSAGE_SELF)
+        usage = resource_usage(before, before)
+        assert usage["minor_faults"] == 0
+        assert usage["user_cpu"] == 0
+        assert usage["max_rss"] == peak_rss()
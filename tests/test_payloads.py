@@ -0,0 +1,46 @@
+import pytest
+
+from analyze.ArrayQueue import ArrayQueue
+from analyze.benchmark import measure_doubling_cell, measure_payload
+from analyze.payloads import Payload, make_payloads, traced_payloads
+from analyze.sll_queue import BasicSLLQueue
+
+
+class TestPayloads:
+
+    @pytest.mark.parametrize("payload", list(Payload))
+    def test_count_and_distinct(self, payload):
+        """Test that every payload type yields the requested number of distinct elements."""
+        if payload == Payload.numpy:
+            pytest.importorskip("numpy")
+        items = make_payloads(payload, 50)
+        assert len(items) == 50
+        assert len({id(item) for item in items}) == 50 or payload == Payload.small_int
+
+    def test_small_int_is_list(self):
+        """Test that small ints are the values the benchmarks used before, as a list."""
+        assert make_payloads(Payload.small_int, 10) == list(range(10))
+
+    def test_bytes_size(self):
+        """Test that the bytes payload holds 1 KB elements."""
+        assert {len(item) for item in make_payloads(Payload.bytes_1k, 20)} == {1024}
+
+    def test_traced_payloads(self):
+        """Test that tracing returns a list and counts its memory."""
+        items, allocated = traced_payloads(Payload.bytes_1k, 100)
+        assert isinstance(items, list)
+        assert allocated >= 100 * 1024
+
+    def test_doubling_cell_with_items(self):
+        """Test that a doubling cell enqueues the given elements."""
+        items = make_payloads(Payload.short_str, 1000)
+        results = measure_doubling_cell(BasicSLLQueue, 1000, ["enqueue", "dequeue"], items=items)
+        assert set(results) == {"enqueue", "dequeue"}
+        assert all(seconds > 0 for seconds in results.values())
+
+    def test_measure_payload(self):
+        """Test that payload measurement reports times and queue memory."""
+        stats = measure_payload(ArrayQueue, make_payloads(Payload.dict, 500))
+        assert stats["enqueue"] > 0
+        assert stats["dequeue"] > 0
+        assert stats["queue_bytes"] > 0
@@ -0,0 +1,117 @@
+import pickle
+import random
+from collections import deque
+
+import pytest
+
+from analyze.benchmark import DOUBLING_OPERATIONS, measure_doubling_cell
+from analyze.persistent_queue import BankersQueue, PersistentQueue
+
+
+class TestPersistentQueue:
+
+    def test_fifo_order(self):
+        """Test that elements come out in the order they went in."""
+        queue = PersistentQueue()
+        for i in range(100):
+            queue = queue.enqueue(i)
+        values = []
+        while not queue.is_empty():
+            value, queue = queue.dequeue()
+            values.append(value)
+        assert values == list(range(100))
+
+    def test_old_versions_unchanged(self):
+        """Test that enqueue and dequeue leave the version they started from intact."""
+        first = PersistentQueue().enqueue(1).enqueue(2)
+        second = first.enqueue(3)
+        value, third = second.dequeue()
+        assert value == 1
+        assert list(first) == [1, 2]
+        assert list(second) == [1, 2, 3]
+        assert list(third) == [2, 3]
+        assert first.size() == 2 and third.size() == 2
+
+    def test_random_versions_match_deque(self):
+        """Test random operations on old and new versions against a deque model."""
+        rng = random.Random(0)
+        versions = [(PersistentQueue(), deque())]
+        for _ in range(3000):
+            queue, model = rng.choice(versions)
+            model = deque(model)
+            if model and rng.random() < 0.45:
+                value, queue = queue.dequeue()
+                assert value == model.popleft()
+            else:
+                value = rng.random()
+                queue = queue.enqueue(value)
+                model.append(value)
+            versions.append((queue, model))
+        for queue, model in versions:
+            assert queue.size() == len(model)
+            assert list(queue) == list(model)
+
+    def test_empty_errors(self):
+        """Test that dequeue and peek on an empty queue raise IndexError."""
+        with pytest.raises(IndexError):
+            PersistentQueue().dequeue()
+        with pytest.raises(IndexError):
+            PersistentQueue().peek()
+
+
+class TestBankersQueue:
+
+    @pytest.fixture
+    def multi_item_queue(self):
+        """Fixture to provide a BankersQueue with multiple items."""
+        queue = BankersQueue()
+        for i in (1, 2, 3):
+            queue.enqueue(i)
+        return queue
+
+    def test_operations(self, multi_item_queue):
+        """Test enqueue, dequeue, peek and size on the mutable handle."""
+        assert multi_item_queue.peek() == 1
+        assert multi_item_queue.dequeue() == 1
+        multi_item_queue.enqueue(4)
+        assert list(multi_item_queue) == [2, 3, 4]
+        assert multi_item_queue.size() == 3
+
+    def test_snapshot_and_version_are_stable(self, multi_item_queue):
+        """Test that snapshots and versions do not see later updates."""
+        snapshot = multi_item_queue.snapshot()
+        version = multi_item_queue.version()
+        multi_item_queue.dequeue()
+        multi_item_queue.enqueue(4)
+        assert list(snapshot) == [1, 2, 3]
+        assert list(version) == [1, 2, 3]
+        assert snapshot.dequeue() == 1
+        assert list(multi_item_queue) == [2, 3, 4]
+
+    def test_unshare_keeps_version(self, multi_item_queue):
+        """Test that unshare has nothing to copy."""
+        snapshot = multi_item_queue.snapshot()
+        version = snapshot.version()
+        snapshot.unshare()
+        assert snapshot.version() is version
+
+    def test_concat(self, multi_item_queue):
+        """Test that + builds a new queue and += empties the other queue."""
+        other = BankersQueue()
+        other.enqueue(4)
+        merged = multi_item_queue + other
+        assert list(merged) == [1, 2, 3, 4]
+        assert list(multi_item_queue) == [1, 2, 3]
+        multi_item_queue += other
+        assert list(multi_item_queue) == [1, 2, 3, 4]
+        assert other.is_empty()
+
+    def test_pickle_roundtrip(self, multi_item_queue):
+        """Test that pickling keeps the elements."""
+        assert list(pickle.loads(pickle.dumps(multi_item_queue))) == [1, 2, 3]
+
+    def test_doubling_cell(self):
+        """Test that the doubling harness measures every operation."""
+        results = measure_doubling_cell(BankersQueue, 1000)
+        assert set(results) == set(DOUBLING_OPERATIONS)
+        assert all(seconds >= 0 for seconds in results.values())
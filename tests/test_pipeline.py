@@ -0,0 +1,78 @@
+import threading
+
+import pytest
+
+from analyze.ArrayQueue import ArrayQueue
+from analyze.dll_queue import BasicDLLQueue
+from analyze.pipeline import CLOSED, Channel, Stage, parse_stages, run_pipeline
+from analyze.sll_queue import BasicSLLQueue
+
+
+class TestParseStages:
+
+    def test_parse(self):
+        """Test parsing stages with and without workers and cost."""
+        assert parse_stages("a:2:100, b:1, c") == [Stage("a", 2, 100), Stage("b", 1, 0), Stage("c", 1, 0)]
+
+    @pytest.mark.parametrize("spec", ["", "a:x", "a:0:1", "a:1:-1", "a:1:2:3"])
+    def test_invalid(self, spec):
+        """Test that malformed stage specs raise ValueError."""
+        with pytest.raises(ValueError):
+            parse_stages(spec)
+
+
+class TestChannel:
+
+    def test_closes_after_all_producers(self):
+        """Test that get returns CLOSED only after every producer closed and the queue drained."""
+        channel = Channel(BasicSLLQueue, producers=2)
+        channel.put(1)
+        channel.close()
+        assert channel.get() == 1
+        channel.put(2)
+        channel.close()
+        assert channel.get() == 2
+        assert channel.get() is CLOSED
+
+    def test_bounded_put_waits(self):
+        """Test that a full bounded channel blocks producers until a get."""
+        channel = Channel(ArrayQueue, capacity=2)
+        channel.put(1)
+        channel.put(2)
+        producer = threading.Thread(target=channel.put, args=(3,))
+        producer.start()
+        producer.join(0.05)
+        assert producer.is_alive()
+        assert channel.get() == 1
+        producer.join(1)
+        assert not producer.is_alive()
+        assert channel.depth == 2
+        assert channel.max_depth == 2
+
+    def test_invalid_capacity(self):
+        """Test that a zero capacity is rejected."""
+        with pytest.raises(ValueError):
+            Channel(BasicDLLQueue, capacity=0)
+
+
+class TestRunPipeline:
+
+    @pytest.mark.parametrize("queue_class", [BasicDLLQueue, BasicSLLQueue, ArrayQueue])
+    def test_every_item_passes_every_stage(self, queue_class):
+        """Test fan-out and fan-in deliver every item through every stage."""
+        stages = [Stage("a", 1, 0), Stage("b", 3, 10), Stage("c", 2, 0)]
+        result = run_pipeline(queue_class, stages, 2000, capacity=50)
+        assert [stats["processed"] for stats in result["stages"]] == [2000, 2000, 2000]
+        assert all(stats["max_depth"] <= 50 for stats in result["stages"])
+        assert result["depths"][-1][1] == [0, 0, 0]
+        assert result["throughput"] > 0
+
+    def test_bottleneck(self):
+        """Test that the costly stage is reported as the bottleneck."""
+        stages = [Stage("cheap", 1, 0), Stage("costly", 1, 2000)]
+        assert run_pipeline(BasicSLLQueue, stages, 300)["bottleneck"] == "costly"
+
+    def test_no_stages(self):
+        """Test that an empty pipeline is rejected."""
+        with pytest.raises(ValueError):
+            run_pipeline(BasicSLLQueue, [], 10)
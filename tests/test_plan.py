@@ -0,0 +1,128 @@
+import pytest
+
+from analyze.plan import Cell, execute_jobs, expand_plan, load_plan, plan_jobs
+
+PLAN = """
+workers = 1
+
+[defaults]
+implementations = ["sll", "array"]
+repeats = 1
+
+[[experiment]]
+name = "small"
+sizes = [1000, 2000]
+operations = ["enqueue", "dequeue"]
+
+[[experiment]]
+name = "peek"
+implementations = ["array"]
+sizes = [2000]
+operations = ["peek"]
+
+[[experiment]]
+name = "strings"
+implementations = ["sll"]
+payloads = ["short_str"]
+initial_size = 500
+max_size = 1000
+operations = ["enqueue"]
+"""
+
+
+@pytest.fixture
+def plan(tmp_path):
+    path = tmp_path / "plan.toml"
+    path.write_text(PLAN)
+    return load_plan(path)
+
+
+class TestExpandPlan:
+
+    def test_shared_cells_merge_operations(self, plan):
+        """Test that experiments sharing a cell measure it once with all their operations."""
+        names, operations, members = expand_plan(plan)
+        assert names == ["small", "peek", "strings"]
+        cell = Cell("array", 2000, "small_int", "enabled", 1)
+        assert operations[cell] == ["enqueue", "dequeue", "peek"]
+        assert members[cell] == {"small": ["enqueue", "dequeue"], "peek": ["peek"]}
+        assert len(operations) == 6
+
+    def test_doubling_range(self, plan):
+        """Test that initial_size and max_size expand to doubling sizes."""
+        _, operations, _ = expand_plan(plan)
+        sizes = sorted(cell.size for cell in operations if cell.payload == "short_str")
+        assert sizes == [500, 1000]
+
+    @pytest.mark.parametrize(
+        "experiment",
+        [
+            {"implementations": ["heap"]},
+            {"operations": ["pop"]},
+            {"payloads": []},
+            {"repeats": 0},
+            {"sizes": [0]},
+            {"gc": "sometimes"},
+            {"colour": "red"},
+        ],
+    )
+    def test_invalid(self, experiment):
+        """Test that invalid experiments raise ValueError."""
+        with pytest.raises(ValueError):
+            expand_plan({"experiment": [dict(experiment, name="bad")]})
+
+    def test_no_experiments(self):
+        """Test that a plan without experiments is rejected."""
+        with pytest.raises(ValueError):
+            expand_plan({})
+
+    def test_default_implementations_leave_out_bankers(self):
+        """Test that experiments without implementations get the doubling defaults."""
+        _, operations, _ = expand_plan({"experiment": [{"name": "plain", "sizes": [100]}]})
+        assert sorted({cell.implementation for cell in operations}) == ["array", "dll", "sll"]
+
+    @pytest.mark.parametrize("workers", ["2", 0, -1, 1.5, True])
+    def test_invalid_workers(self, tmp_path, workers):
+        """Test that a plan's workers must be a positive integer."""
+        path = tmp_path / "plan.toml"
+        value = str(workers).lower() if isinstance(workers, bool) else repr(workers).replace("'", '"')
+        path.write_text(f"workers = {value}\n[[experiment]]\nsizes = [100]\n")
+        with pytest.raises(ValueError, match="workers"):
+            load_plan(path)
+
+    def test_invalid_toml(self, tmp_path):
+        """Test that a malformed file raises ValueError."""
+        path = tmp_path / "plan.toml"
+        path.write_text("[[experiment]\n")
+        with pytest.raises(ValueError):
+            load_plan(path)
+
+
+class TestJobs:
+
+    def test_grouped_and_costliest_first(self, plan):
+        """Test that cells sharing size and payload form one job, largest first."""
+        _, operations, _ = expand_plan(plan)
+        jobs = plan_jobs(operations)
+        costs = [job["cost"] for job in jobs]
+        assert costs == sorted(costs, reverse=True)
+        first = jobs[0]
+        assert (first["size"], first["payload"]) == (2000, "small_int")
+        assert sorted(implementation for implementation, _ in first["cells"]) == ["array", "sll"]
+
+    def test_execute_rejects_no_workers(self, plan):
+        """Test that fewer than one worker is an error rather than a serial run."""
+        _, operations, _ = expand_plan(plan)
+        with pytest.raises(ValueError):
+            execute_jobs(plan_jobs(operations), 0)
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_execute(self, plan, workers):
+        """Test that every cell is measured, in process and on a process pool."""
+        _, operations, _ = expand_plan(plan)
+        seen = []
+        results = execute_jobs(plan_jobs(operations), workers, lambda cell, r, n: seen.append(cell))
+        assert set(results) == set(operations)
+        assert sorted(seen) == sorted(operations)
+        for cell, ops in operations.items():
+            assert list(results[cell]) == ops
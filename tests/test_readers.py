@@ -0,0 +1,27 @@
+import pytest
+
+from analyze.readers import READER_QUEUES, run_readers
+
+
+class TestRunReaders:
+
+    @pytest.mark.parametrize("kind", list(READER_QUEUES))
+    def test_views_are_consistent(self, kind):
+        """Test that readers only ever see consistent views while the writer runs."""
+        stats = run_readers(kind, readers=2, writes=5000, window=100, scan=50)
+        assert stats["inconsistent"] == 0
+        assert stats["write_throughput"] > 0
+        assert stats["views"] >= 0
+
+    @pytest.mark.parametrize("kind", list(READER_QUEUES))
+    def test_window(self, kind):
+        """Test that the writer keeps at most ``window`` items."""
+        shared = READER_QUEUES[kind]()
+        for item in range(10):
+            shared.write(item, 4)
+        assert shared.view(10) == [6, 7, 8, 9]
+
+    def test_invalid_arguments(self):
+        """Test that non-positive arguments raise ValueError."""
+        with pytest.raises(ValueError):
+            run_readers("bankers", readers=0, writes=10)
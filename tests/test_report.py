@@ -0,0 +1,96 @@
+import math
+
+import pytest
+
+from analyze.report import (
+    build_report,
+    complexity_label,
+    fit_slope,
+    load_series,
+    series_name,
+    speedup,
+    to_html,
+    write_report_files,
+)
+from analyze.results_store import ResultStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    """Fixture to provide a stored run with a linear and a constant-time implementation."""
+    store = ResultStore(tmp_path, run_id="run")
+    store.write_metadata({"initial_size": 1000, "implementations": ["sll", "array"]})
+    store.write_environment({"python": "3.11.7", "frequency": {"governors": ["performance"]}})
+    for size in (1000, 2000, 4000):
+        store.append("sll", size, "enqueue", size * 1e-6)
+        store.append("array", size, "enqueue", size * 5e-7)
+        store.append("sll", size, "peek", 1e-4)
+        store.append("array", size, "peek", math.nan)
+    return store
+
+
+class TestAnalysis:
+
+    def test_fit_slope(self):
+        """Test the log-log slope of exact power laws and of too few points."""
+        assert fit_slope({n: 3e-9 * n for n in (1000, 2000, 4000)}) == pytest.approx(1.0)
+        assert fit_slope({n: 1e-12 * n ** 2 for n in (1000, 2000)}) == pytest.approx(2.0)
+        assert fit_slope({1000: 0.1}) is None
+
+    def test_complexity_label(self):
+        """Test mapping slopes to the nearest complexity class."""
+        assert [complexity_label(slope) for slope in (None, 0.1, 1.2, 1.9)] == ["-", "O(1)", "O(n)", "O(n²)"]
+
+    def test_speedup_at_largest_common_size(self):
+        """Test that the speedup compares the largest size both curves share."""
+        assert speedup({1: 4.0, 2: 8.0, 4: 16.0}, {1: 2.0, 2: 2.0}) == 4.0
+        assert speedup({1: 1.0}, {2: 1.0}) is None
+
+    def test_series_name(self):
+        """Test that non-default payloads and GC modes name their own curve."""
+        assert series_name({"implementation": "sll"}) == "sll"
+        assert series_name({"implementation": "sll", "payload": "small_int", "gc_mode": "enabled"}) == "sll"
+        assert series_name({"implementation": "sll", "payload": "dict", "gc_mode": "disabled"}) == "sll (dict, disabled)"
+
+    def test_load_series_skips_failed_cells(self, store):
+        """Test that NaN cells are left out of the curves."""
+        series = load_series(store)
+        assert "peek" not in series["array"]
+        assert series["sll"]["enqueue"][4000] == pytest.approx(4e-3)
+
+
+class TestBuildReport:
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_report(self, store, workers):
+        """Test the collected report with serial and parallel plot rendering."""
+        report = build_report(store, baseline="sll", workers=workers)
+        assert report["operations"] == ["enqueue", "peek"]
+        assert report["slopes"]["sll"]["enqueue"] == pytest.approx(1.0)
+        assert report["slopes"]["sll"]["peek"] == pytest.approx(0.0)
+        assert report["speedups"]["array"]["enqueue"] == pytest.approx(2.0)
+        assert report["speedups"]["array"]["peek"] is None
+        assert all(png.startswith(b"\x89PNG") for png in report["plots"].values())
+        assert ("frequency.governors", "performance") in report["environment"]
+
+    def test_write_files(self, store):
+        """Test that the HTML embeds the plots and the Markdown links the written PNGs."""
+        report = build_report(store)
+        html_path, markdown_path = write_report_files(report, store.path)
+        assert "data:image/png;base64," in html_path.read_text()
+        markdown = markdown_path.read_text()
+        assert "![enqueue log-log plot](report_enqueue.png)" in markdown
+        assert (store.path / "report_enqueue.png").exists()
+        assert "| SLL | 1.00x | 1.00x |" in markdown
+
+    def test_html_escapes_values(self, store):
+        """Test that stored text is escaped in the HTML."""
+        store.write_metadata({"plan": "<script>"})
+        assert "&lt;script&gt;" in to_html(build_report(store))
+
+    def test_errors(self, store, tmp_path):
+        """Test that an empty run and an unknown baseline raise ValueError."""
+        with pytest.raises(ValueError):
+            build_report(ResultStore(tmp_path, run_id="empty"))
+        with pytest.raises(ValueError):
+            build_report(store, baseline="heap")
@@ -0,0 +1,42 @@
+from analyze.results_store import ResultStore
+
+
+class TestResultStore:
+
+    def test_append_and_load(self, tmp_path):
+        """Test that appended cells are read back in order."""
+        store = ResultStore(tmp_path, run_id="run")
+        store.append("sll", 1000, "enqueue", 0.5)
+        store.append("sll", 1000, "dequeue", 0.25)
+        records = ResultStore(tmp_path, run_id="run").load()
+        assert [(r["operation"], r["seconds"]) for r in records] == [
+            ("enqueue", 0.5),
+            ("dequeue", 0.25),
+        ]
+
+    def test_truncated_line_is_skipped(self, tmp_path):
+        """Test that a line cut short by a crash does not break loading."""
+        store = ResultStore(tmp_path, run_id="run")
+        store.append("dll", 10, "peek", 0.1)
+        with open(store.cells_path, "a") as handle:
+            handle.write('{"implementation": "dll", "si')
+        assert len(store.load()) == 1
+
+    def test_metadata_round_trip(self, tmp_path):
+        """Test that run parameters are saved and restored."""
+        store = ResultStore(tmp_path, run_id="run")
+        assert store.read_metadata() == {}
+        store.write_metadata({"initial_size": 10})
+        assert store.read_metadata() == {"initial_size": 10}
+        assert store.path == tmp_path / "runs" / "run"
+
+    def test_completed_cells_skip_failures(self, tmp_path):
+        """Test that failed cells are not treated as completed and the latest value wins."""
+        store = ResultStore(tmp_path, run_id="run")
+        store.append("array", 100, "enqueue", 1.0)
+        store.append("array", 100, "enqueue", 2.0)
+        store.append("array", 100, "concat", float("nan"))
+        assert store.completed_cells() == {("array", 100, "enqueue"): 2.0}
+        assert not ResultStore.exists(tmp_path, "run")
+        store.write_metadata({})
+        assert ResultStore.exists(tmp_path, "run")
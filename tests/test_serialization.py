@@ -0,0 +1,51 @@
+import pytest
+
+from analyze.serialization import (
+    KIND_FLOAT64,
+    KIND_INT64,
+    KIND_STRINGS,
+    KIND_TAGGED,
+    decode_items,
+    encode_items,
+)
+
+
+class TestSerialization:
+
+    @pytest.mark.parametrize(
+        "items, kind",
+        [
+            ([1, -2, 3], KIND_INT64),
+            ([0.5, -1.25], KIND_FLOAT64),
+            (["a", "", "é"], KIND_STRINGS),
+            (["a\0b", "c"], KIND_TAGGED),
+            ([1, 2 ** 70], KIND_TAGGED),
+            ([None, True, False, 7, 1.5, "s", b"\x00b"], KIND_TAGGED),
+            ([], KIND_TAGGED),
+        ],
+    )
+    def test_round_trip(self, items, kind):
+        """Test that every supported payload decodes to the same values."""
+        data = encode_items(items)
+        assert data[4:5] == kind
+        assert decode_items(data) == items
+
+    def test_packed_ints_are_compact(self):
+        """Test that 64-bit ints take eight bytes each."""
+        assert len(encode_items(range(1000))) == len(encode_items([])) + 8000
+
+    def test_unsupported_type(self):
+        """Test that unsupported element types raise TypeError."""
+        with pytest.raises(TypeError):
+            encode_items([object()])
+
+    def test_bad_data(self):
+        """Test that foreign or truncated data raises ValueError."""
+        with pytest.raises(ValueError):
+            decode_items(b"nope")
+        with pytest.raises(ValueError):
+            decode_items(b"XXXX" + encode_items([1])[4:])
+        with pytest.raises(ValueError):
+            decode_items(encode_items([1, 2])[:-1])
+        with pytest.raises(ValueError):
+            decode_items(encode_items(["x", 1])[:-3])
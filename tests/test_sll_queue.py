@@ -1,3 +1,5 @@
+import pickle
+
 import pytest
 
 from analyze.sll_queue import BasicSLLQueue
@@ -214,3 +216,104 @@ class TestBasicSLLQueue:
         assert single_item_queue.dequeue() == 3  # From multi_item_queue
         assert multi_item_queue.is_empty()
         assert multi_item_queue.size() == 0
+
+    def test_pool_reuses_nodes(self):
+        """Test that a pooled queue recycles dequeued nodes."""
+        queue = BasicSLLQueue(pool_size=2)
+        queue.enqueue(1)
+        node = queue._head
+        assert queue.dequeue() == 1
+        queue.enqueue(2)
+        assert queue._head is node
+        assert queue.peek() == 2
+        assert queue.pool_stats()["hits"] == 1
+        assert queue.pool_stats()["misses"] == 1
+
+    def test_pool_is_bounded(self):
+        """Test that the pool never keeps more than its configured size."""
+        queue = BasicSLLQueue(pool_size=2)
+        for i in range(5):
+            queue.enqueue(i)
+        assert [queue.dequeue() for _ in range(5)] == [0, 1, 2, 3, 4]
+        stats = queue.pool_stats()
+        assert stats["free"] == 2
+        assert stats["discarded"] == 3
+        assert queue.is_empty()
+
+    def test_pool_disabled_by_default(self, empty_queue):
+        """Test that pooling is off unless requested."""
+        assert empty_queue.pool_stats() is None
+
+    def test_snapshot_shares_nodes(self):
+        """Test that a snapshot shares nodes and is independent of later dequeues."""
+        queue = BasicSLLQueue()
+        for i in range(4):
+            queue.enqueue(i)
+        copy = queue.snapshot()
+        assert copy._head is queue._head
+        assert [queue.dequeue() for _ in range(4)] == [0, 1, 2, 3]
+        assert copy.size() == 4
+        assert [copy.dequeue() for _ in range(4)] == [0, 1, 2, 3]
+
+    def test_snapshot_enqueue_both(self):
+        """Test that both sharers can enqueue without seeing each other's items."""
+        queue = BasicSLLQueue()
+        queue.enqueue(1)
+        copy = queue.snapshot()
+        queue.enqueue(2)
+        copy.enqueue(3)
+        assert [queue.dequeue(), queue.dequeue()] == [1, 2]
+        assert [copy.dequeue(), copy.dequeue()] == [1, 3]
+
+    def test_snapshot_with_pool(self):
+        """Test that shared nodes are not recycled while a snapshot uses them."""
+        queue = BasicSLLQueue(pool_size=4)
+        for i in range(3):
+            queue.enqueue(i)
+        copy = queue.snapshot()
+        queue.dequeue()
+        queue.enqueue(3)
+        assert queue.pool_stats()["hits"] == 0
+        assert [copy.dequeue() for _ in range(3)] == [0, 1, 2]
+
+    def test_dropped_snapshot_unshares(self):
+        """Test that after a snapshot is dropped, dequeued nodes are recycled again."""
+        queue = BasicSLLQueue(pool_size=4)
+        for i in range(3):
+            queue.enqueue(i)
+        copy = queue.snapshot()
+        del copy
+        queue.dequeue()
+        queue.enqueue(3)
+        assert queue.pool_stats()["hits"] == 1
+        assert queue._share is None
+
+    def test_unshare(self):
+        """Test that unshare copies the nodes up front so dequeued nodes are recycled."""
+        queue = BasicSLLQueue(pool_size=4)
+        for i in range(3):
+            queue.enqueue(i)
+        copy = queue.snapshot()
+        copy.unshare()
+        assert copy._share is None and not queue._shared()
+        assert copy.dequeue() == 0
+        copy.enqueue(3)
+        assert copy.pool_stats()["hits"] == 1
+        assert list(queue) == [0, 1, 2]
+
+    def test_pickle_long_queue(self):
+        """Test that pickling a long queue does not recurse through its nodes."""
+        queue = BasicSLLQueue(pool_size=8)
+        for i in range(10000):
+            queue.enqueue(i)
+        queue.dequeue()
+        copy = pickle.loads(pickle.dumps(queue))
+        assert list(copy) == list(range(1, 10000))
+        assert copy.pool_stats()["max_size"] == 8
+
+    def test_bytes_round_trip(self, multi_item_queue):
+        """Test the compact binary format."""
+        copy = BasicSLLQueue.from_bytes(multi_item_queue.to_bytes())
+        assert list(copy) == [1, 2, 3]
+        copy.enqueue(4)
+        assert [copy.dequeue() for _ in range(4)] == [1, 2, 3, 4]
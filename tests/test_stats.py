@@ -0,0 +1,80 @@
+import math
+import random
+
+import pytest
+
+from analyze.stats import _ranks, bootstrap_ci, compare_samples, holm, mann_whitney_u, ratio_ci
+
+
+class TestMannWhitneyU:
+
+    def test_ranks_with_ties(self):
+        """Test that tied values share the average of their ranks."""
+        assert _ranks([3.0, 1.0, 3.0, 2.0]) == [3.5, 1.0, 3.5, 2.0]
+
+    def test_separated_samples(self):
+        """Test U and the normal-approximation p-value of fully separated samples."""
+        u, p = mann_whitney_u([1, 2, 3, 4, 5], [6, 7, 8, 9, 10])
+        assert u == 0
+        assert p == pytest.approx(0.01219, abs=1e-4)
+
+    def test_symmetry(self):
+        """Test that swapping the samples gives the complementary U and the same p."""
+        a, b = [1.0, 4.0, 2.5, 7.0], [3.0, 5.0, 6.0, 8.0, 9.0]
+        u_ab, p_ab = mann_whitney_u(a, b)
+        u_ba, p_ba = mann_whitney_u(b, a)
+        assert u_ab + u_ba == len(a) * len(b)
+        assert p_ab == pytest.approx(p_ba)
+
+    def test_identical_values(self):
+        """Test that samples of one repeated value are not different."""
+        assert mann_whitney_u([1.0] * 5, [1.0] * 5)[1] == 1.0
+
+    def test_empty_sample(self):
+        """Test that an empty sample raises ValueError."""
+        with pytest.raises(ValueError):
+            mann_whitney_u([], [1.0])
+
+
+class TestIntervals:
+
+    def test_bootstrap_ci_brackets_median(self):
+        """Test that the interval of the median contains it and is reproducible."""
+        values = [random.Random(1).gauss(10, 1) for _ in range(50)]
+        low, high = bootstrap_ci(values, rng=random.Random(0))
+        assert low <= sorted(values)[25] <= high
+        assert (low, high) == bootstrap_ci(values, rng=random.Random(0))
+
+    def test_ratio_ci(self):
+        """Test that the ratio interval of a doubled sample lies around 2."""
+        rng = random.Random(2)
+        a = [2 * rng.uniform(0.9, 1.1) for _ in range(30)]
+        b = [rng.uniform(0.9, 1.1) for _ in range(30)]
+        low, high = ratio_ci(a, b, rng=random.Random(0))
+        assert low < 2 < high
+        assert math.isnan(ratio_ci([], b)[0])
+
+    def test_holm(self):
+        """Test Holm's step-down adjustment keeps the input order and is monotone."""
+        assert holm([0.01, 0.04, 0.03, 0.005]) == pytest.approx([0.03, 0.06, 0.06, 0.02])
+        assert holm([]) == []
+
+
+class TestCompareSamples:
+
+    def test_labels(self):
+        """Test that a clear difference is significant and equal distributions are not."""
+        rng = random.Random(3)
+        samples = {
+            "fast": [rng.uniform(1.0, 1.2) for _ in range(20)],
+            "slow": [rng.uniform(1.5, 1.7) for _ in range(20)],
+            "same": [rng.uniform(1.0, 1.2) for _ in range(20)],
+        }
+        result = compare_samples(samples, seed=0)
+        pairs = {(pair["a"], pair["b"]): pair for pair in result["pairs"]}
+        assert pairs[("fast", "slow")]["significant"]
+        assert pairs[("fast", "slow")]["ratio"] < 1
+        assert pairs[("slow", "same")]["significant"]
+        assert not pairs[("fast", "same")]["significant"]
+        assert all(pair["p_adjusted"] >= pair["p"] for pair in result["pairs"])
+        assert set(result["summary"]) == set(samples)
@@ -0,0 +1,43 @@
+from analyze.timer import HarnessBaseline, TimingResult, timed
+
+
+class TestHarnessBaseline:
+
+    def test_loop_is_cached(self):
+        """Test that each loop length is calibrated once."""
+        baseline = HarnessBaseline(repeats=2)
+        first = baseline.loop(1000)
+        assert first > 0
+        assert baseline.loop(1000) == first
+
+    def test_overhead_picks_loop_or_call(self):
+        """Test that single calls use the call baseline and loops the loop baseline."""
+        baseline = HarnessBaseline(repeats=2)
+        assert baseline.overhead(0) == baseline.call()
+        assert baseline.overhead(500) == baseline.loop(500)
+
+    def test_net_never_negative(self):
+        """Test that subtracting the overhead clamps at zero."""
+        baseline = HarnessBaseline(repeats=2)
+        assert baseline.net(0.0, 1000) == 0.0
+        assert baseline.net(10.0, 0) == 10.0 - baseline.call()
+
+
+class TestTimed:
+
+    def test_records_into_timing_result(self):
+        """Test that the decorator adds its time and count to ``timing_result``."""
+
+        class Subject:
+            def __init__(self):
+                self.timing_result = TimingResult("subject")
+
+            @timed("work")
+            def work(self, count=1):
+                return count
+
+        subject = Subject()
+        assert subject.work(count=3) == 3
+        total, elements = subject.timing_result.operations["work"]
+        assert elements == 3
+        assert total == subject.timing_result.total_time > 0
@@ -0,0 +1,52 @@
+from analyze.work_stealing import WorkStealingDeque, run_scheduler, worker_counts
+
+
+class TestWorkStealingDeque:
+
+    def test_owner_is_lifo(self):
+        """Test that the owner pops the newest task."""
+        deque = WorkStealingDeque()
+        for i in range(3):
+            deque.push(i)
+        assert [deque.pop() for _ in range(3)] == [2, 1, 0]
+        assert deque.pop() is None
+
+    def test_thief_takes_oldest(self):
+        """Test that thieves steal from the front in FIFO order."""
+        deque = WorkStealingDeque()
+        for i in range(5):
+            deque.push(i)
+        batch = deque.steal(2)
+        assert [batch.dequeue() for _ in range(2)] == [0, 1]
+        assert len(deque) == 3
+        assert deque.pop() == 4
+
+    def test_steal_empty(self):
+        """Test stealing from an empty deque returns an empty batch."""
+        assert WorkStealingDeque().steal(4).is_empty()
+
+    def test_push_batch(self):
+        """Test that a stolen batch lands at the back of the thief's deque."""
+        victim = WorkStealingDeque()
+        thief = WorkStealingDeque()
+        for i in range(4):
+            victim.push(i)
+        thief.push("own")
+        thief.push_batch(victim.steal(2))
+        assert [thief.pop() for _ in range(3)] == [1, 0, "own"]
+
+
+def test_scheduler_runs_every_task():
+    """Test that the scheduler runs the whole task tree exactly once."""
+    for workers in (1, 3):
+        stats = run_scheduler(workers, depth=8)
+        assert stats["tasks"] == 511
+        assert sum(stats["executed"]) == 511
+        assert len(stats["executed"]) == workers
+
+
+def test_worker_counts():
+    """Test the doubling sequence of worker counts."""
+    assert worker_counts(8) == [1, 2, 4, 8]
+    assert worker_counts(6) == [1, 2, 4, 6]
+    assert worker_counts(1) == [1]
@@ -0,0 +1,63 @@
+import pytest
+
+from analyze.ArrayQueue import ArrayQueue
+from analyze.dll_queue import BasicDLLQueue
+from analyze.sll_queue import BasicSLLQueue
+from analyze.workloads import (
+    WORKLOADS,
+    bfs,
+    level_order,
+    measure_workload,
+    random_graph,
+    random_jobs,
+    random_tree,
+    round_robin,
+)
+
+QUEUE_CLASSES = [BasicDLLQueue, BasicSLLQueue, ArrayQueue]
+
+
+class TestWorkloads:
+
+    def test_bfs_distances(self):
+        """Test BFS on a small graph with a known answer."""
+        graph = [[1, 2], [0, 3], [0, 3], [1, 2, 4], [3], []]
+        for queue_class in QUEUE_CLASSES:
+            assert bfs(queue_class, graph) == [0, 1, 1, 2, 3, -1]
+
+    def test_random_graph_is_connected(self):
+        """Test that every node of a generated graph is reachable."""
+        assert min(bfs(BasicSLLQueue, random_graph(500))) == 0
+
+    def test_level_order_widths(self):
+        """Test level widths of a generated tree add up to its size."""
+        root = random_tree(1000)
+        widths = level_order(BasicDLLQueue, root)
+        assert widths[0] == 1
+        assert sum(widths) == 1000
+
+    def test_round_robin(self):
+        """Test a hand-checked round-robin schedule."""
+        jobs = [(0, 5), (1, 2), (10, 1)]
+        assert round_robin(ArrayQueue, jobs, quantum=2) == [7, 4, 11]
+
+    @pytest.mark.parametrize("name", list(WORKLOADS))
+    def test_implementations_agree(self, name):
+        """Test that every queue gives the same workload result."""
+        workload = WORKLOADS[name]
+        data = workload.build(2000, 1)
+        expected = workload.run(BasicSLLQueue, data)
+        for queue_class in QUEUE_CLASSES:
+            assert workload.run(queue_class, data) == expected
+
+    def test_random_jobs_sorted(self):
+        """Test that generated jobs arrive in order."""
+        arrivals = [arrival for arrival, _ in random_jobs(100)]
+        assert arrivals == sorted(arrivals)
+
+    def test_measure_workload(self):
+        """Test that measuring returns a time and a positive peak."""
+        workload = WORKLOADS["bfs"]
+        seconds, peak = measure_workload(ArrayQueue, workload, workload.build(1000, 0))
+        assert seconds > 0
+        assert peak > 0